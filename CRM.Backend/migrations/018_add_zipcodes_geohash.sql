@@ -0,0 +1,7 @@
+-- Migration: Add a precomputed Geohash column to ZipCodes for radius lookups
+-- Populate it by reloading ZIP codes converted with:
+--   python3 database/master_data/convert_geonames.py --geohash
+-- Run with: docker exec crm-mariadb sh -c "mariadb -ucrm_user -pCrmPass@Dev2024 crm_db < /tmp/migration.sql"
+
+ALTER TABLE ZipCodes ADD COLUMN IF NOT EXISTS Geohash VARCHAR(12) NULL DEFAULT NULL AFTER IsActive;
+ALTER TABLE ZipCodes ADD INDEX IF NOT EXISTS IX_ZipCodes_Geohash (Geohash);
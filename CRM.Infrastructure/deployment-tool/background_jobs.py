@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Background Jobs
+Runs long web UI requests (deployments, builds, cloud CLI logins) on a
+worker pool instead of inside the HTTP request, so the server keeps
+answering while they run.
+
+Each job gets an ID that the browser polls for status, progress and the
+final result. Finished jobs are kept for a while and then dropped, oldest
+first.
+"""
+
+import copy
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class Job:
+    """One background request and its outcome."""
+    id: str
+    kind: str
+    status: str = "queued"  # queued, running, success, failed
+    created: float = field(default_factory=time.time)
+    started: float = 0.0
+    finished: float = 0.0
+    # Updated by the job while it runs, e.g. per-task status of a deployment plan
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: str = ""
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def report(self, section: str, key: str, value: Any):
+        """Set progress[section][key]; safe while another thread serializes the job."""
+        with self._lock:
+            self.progress.setdefault(section, {})[key] = value
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("success", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        end = self.finished or time.time()
+        with self._lock:
+            progress = copy.deepcopy(self.progress)
+        return {
+            "jobId": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created": self.created,
+            "elapsed": round(end - self.started, 3) if self.started else 0.0,
+            "progress": progress,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobRegistry:
+    """Runs jobs on a bounded thread pool and keeps their state for polling."""
+
+    def __init__(self, max_workers: int = 8, keep_finished: int = 100):
+        self.keep_finished = keep_finished
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def submit(self, kind: str, func: Callable[[], Any]) -> Job:
+        """Queue func; a dict result with a false 'success' marks the job failed."""
+        job = Job(id=secrets.token_hex(8), kind=kind)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._pool.submit(self._run, job, func)
+        return job
+
+    def _run(self, job: Job, func: Callable[[], Any]):
+        job.status = "running"
+        job.started = time.time()
+        self._local.job = job
+        try:
+            job.result = func()
+            failed = isinstance(job.result, dict) and not job.result.get("success", True)
+            job.status = "failed" if failed else "success"
+            if failed:
+                job.error = job.result.get("error", "")
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished = time.time()
+            self._local.job = None
+
+    def current(self) -> Optional[Job]:
+        """The job running on this thread, if any."""
+        return getattr(self._local, "job", None)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """All known jobs without their results, newest first."""
+        with self._lock:
+            jobs = sorted(self._jobs.values(), key=lambda job: job.created, reverse=True)
+        return [{key: value for key, value in job.to_dict().items() if key != "result"} for job in jobs]
+
+    def _prune(self):
+        finished = sorted((job for job in self._jobs.values() if job.done), key=lambda job: job.finished)
+        for job in finished[:max(len(finished) - self.keep_finished, 0)]:
+            del self._jobs[job.id]
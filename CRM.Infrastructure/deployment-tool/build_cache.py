@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Build Cache
+Skips frontend, API and Docker image builds whose inputs have not changed.
+
+Each build step is keyed on a SHA-256 over its build command and the
+contents of its input files (source trees, lockfiles, Dockerfiles). After a
+successful build the key is stored together with the artifact path or the
+image ID; the next build with the same key is skipped as long as that
+artifact or image still exists.
+
+Git builds check out every build into a fresh worktree, so their artifacts
+are also copied into the cache directory and restored into the next
+worktree when the key matches.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# Directories that hold build output or dependencies, never build inputs
+EXCLUDED_DIRS = {"node_modules", "bin", "obj", "build", "dist", "publish", "coverage",
+                 ".git", "__pycache__", "TestResults"}
+
+DEFAULT_CACHE_FILE = Path(__file__).parent / "generated" / "build-cache.json"
+# Copies of artifacts built in a worktree, one directory per step
+ARTIFACTS_DIR_NAME = "build-artifacts"
+
+
+def fingerprint(root: Path, inputs: Iterable[str], extra: str = "") -> str:
+    """SHA-256 over the relative paths and contents of the input files and directories under root."""
+    digest = hashlib.sha256(extra.encode("utf-8"))
+    for relative in sorted(inputs):
+        path = root / relative
+        if path.is_dir():
+            files = []
+            for directory, subdirs, names in os.walk(path):
+                subdirs[:] = [name for name in subdirs if name not in EXCLUDED_DIRS]
+                files.extend(Path(directory) / name for name in names)
+        elif path.exists():
+            files = [path]
+        else:
+            # A missing input is part of the key too
+            digest.update(f"\0missing:{relative}".encode("utf-8"))
+            continue
+        for file in sorted(files):
+            digest.update(f"\0{file.relative_to(root).as_posix()}\0".encode("utf-8"))
+            with open(file, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Last successful build key (and artifact/image) per build step."""
+
+    def __init__(self, cache_file: Path = DEFAULT_CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self.artifacts_dir = self.cache_file.parent / ARTIFACTS_DIR_NAME
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        try:
+            with open(self.cache_file, "r") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, step: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(step)
+
+    def record(self, step: str, key: str, **details):
+        """Store a successful build and write the cache file."""
+        with self._lock:
+            self.entries[step] = {"key": key, "built_at": datetime.now().isoformat(), **details}
+            self._save()
+
+    def invalidate(self, step: str):
+        """Forget a step, e.g. after its build failed."""
+        with self._lock:
+            if self.entries.pop(step, None) is not None:
+                self._save()
+
+    def store_artifact(self, step: str, source: Path) -> Optional[str]:
+        """Copy a step's output directory into the cache; returns where, or None if the copy failed."""
+        target = self.artifacts_dir / step
+        staging = self.artifacts_dir / f"{step}.tmp"
+        try:
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.copytree(source, staging, symlinks=True)
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            return None
+        return str(target)
+
+    def restore_artifact(self, entry: Dict[str, Any], target: Path) -> bool:
+        """Copy the output stored with a cache entry back to target."""
+        stored = entry.get("stored_artifact")
+        if not stored or not Path(stored).is_dir():
+            return False
+        try:
+            shutil.copytree(stored, target, symlinks=True)
+        except OSError:
+            shutil.rmtree(target, ignore_errors=True)
+            return False
+        return True
+
+    def _save(self):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(temp_file, self.cache_file)
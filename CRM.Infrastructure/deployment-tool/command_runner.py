@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Streaming Command Runner
+Runs shell commands for the build and deployment engines and streams their
+stdout/stderr to the log callback line by line while they run, instead of
+buffering everything until the command exits.
+
+Only a bounded tail of each stream is retained for the returned output, so
+a long docker build or npm install cannot grow memory without limit. Every
+command runs in its own process group; cancel() and timeouts terminate the
+whole group, including children of the shell.
+"""
+
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional, Set
+
+
+class LineRingBuffer:
+    """Keeps the most recent lines of a stream within a character budget."""
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.lines = deque()
+        self.size = 0
+        self.dropped = 0
+
+    def append(self, line: str):
+        self.lines.append(line)
+        self.size += len(line)
+        while self.size > self.max_chars and len(self.lines) > 1:
+            self.size -= len(self.lines.popleft())
+            self.dropped += 1
+
+    def text(self) -> str:
+        return "".join(self.lines)
+
+
+@dataclass
+class CommandResult:
+    """Outcome of one command; stdout/stderr hold the retained tails."""
+    returncode: Optional[int]
+    stdout: str = ""
+    stderr: str = ""
+    timed_out: bool = False
+    cancelled: bool = False
+    dropped_lines: int = 0
+
+    @property
+    def success(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+
+class CommandRunner:
+    """Run shell commands, streaming their output to a log callback."""
+
+    # Characters of output retained per stream for the returned result
+    MAX_RETAINED_CHARS = 1024 * 1024
+    # stderr lines repeated as an error when a command fails
+    ERROR_TAIL_LINES = 20
+    # Seconds between SIGTERM and SIGKILL when stopping a process group
+    KILL_GRACE_SECONDS = 5
+
+    def __init__(self, log_callback: Callable[[str, str], None], max_retained_chars: int = MAX_RETAINED_CHARS):
+        self.log = log_callback
+        self.max_retained_chars = max_retained_chars
+        self._processes: Set[subprocess.Popen] = set()
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    @staticmethod
+    def _read_stream(stream, name: str, lines: queue.Queue):
+        """Reader thread: forward each line of a pipe, then an end marker."""
+        try:
+            for line in iter(stream.readline, ""):
+                lines.put((name, line))
+        finally:
+            stream.close()
+            lines.put((name, None))
+
+    def _terminate(self, process: subprocess.Popen):
+        """Stop a command and everything it started."""
+        if process.poll() is not None:
+            return
+        try:
+            if sys.platform == "win32":
+                subprocess.run(f"taskkill /T /F /PID {process.pid}", shell=True, capture_output=True)
+                return
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=self.KILL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, OSError):
+            pass
+
+    def cancel(self):
+        """Terminate every running command; commands started afterwards are cancelled too until reset()."""
+        self._cancelled.set()
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            self._terminate(process)
+
+    def reset(self):
+        """Allow commands to run again after cancel()."""
+        self._cancelled.clear()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self, cmd: str, cwd: str = None, timeout: int = 600, log_command: str = None) -> CommandResult:
+        """Run a shell command, logging each output line as it arrives.
+
+        stdout and stderr lines are logged as "output" (tools such as docker
+        build report progress on stderr); on failure the tail of stderr is
+        logged again as an error.
+        """
+        self.log("cmd", f"$ {log_command or cmd}")
+        if self._cancelled.is_set():
+            self.log("warning", "Cancelled")
+            return CommandResult(None, cancelled=True)
+
+        if sys.platform == "win32":
+            group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {"start_new_session": True}
+        try:
+            process = subprocess.Popen(
+                cmd, shell=True, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, errors="replace", bufsize=1, **group
+            )
+        except Exception as e:
+            self.log("error", str(e))
+            return CommandResult(None, stderr=str(e))
+
+        with self._lock:
+            self._processes.add(process)
+        retained = {"stdout": LineRingBuffer(self.max_retained_chars),
+                    "stderr": LineRingBuffer(self.max_retained_chars)}
+        error_tail = deque(maxlen=self.ERROR_TAIL_LINES)
+        lines: queue.Queue = queue.Queue()
+        readers = [
+            threading.Thread(target=self._read_stream, args=(process.stdout, "stdout", lines), daemon=True),
+            threading.Thread(target=self._read_stream, args=(process.stderr, "stderr", lines), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        deadline = time.monotonic() + timeout if timeout else None
+        open_streams = 2
+        timed_out = False
+        try:
+            while open_streams:
+                if deadline and time.monotonic() > deadline:
+                    timed_out = True
+                    self._terminate(process)
+                    break
+                if self._cancelled.is_set():
+                    self._terminate(process)
+                    break
+                try:
+                    name, line = lines.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    open_streams -= 1
+                    continue
+                retained[name].append(line)
+                if name == "stderr":
+                    error_tail.append(line.rstrip("\n"))
+                if line.strip():
+                    self.log("output", line.rstrip("\n"))
+            try:
+                process.wait(timeout=self.KILL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                self._terminate(process)
+            for reader in readers:
+                reader.join(timeout=1)
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+
+        result = CommandResult(
+            process.returncode,
+            stdout=retained["stdout"].text(),
+            stderr=retained["stderr"].text(),
+            timed_out=timed_out,
+            cancelled=self._cancelled.is_set() and not timed_out and process.returncode != 0,
+            dropped_lines=retained["stdout"].dropped + retained["stderr"].dropped,
+        )
+        if timed_out:
+            self.log("error", f"Command timed out after {timeout}s")
+        elif result.cancelled:
+            self.log("warning", "Command cancelled")
+        elif process.returncode != 0 and error_tail:
+            self.log("error", "\n".join(error_tail))
+        return result
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Cached Git Mirror
+Keeps a persistent bare mirror of the source repository and creates build
+directories from it as detached worktrees, instead of cloning the whole
+repository into a fresh directory on every build.
+
+The first build fetches the branch once; later builds only fetch the new
+commits. A worktree shares the mirror's object store, so creating a build
+directory copies no history, only the files of the requested commit.
+Credentials are passed on each fetch and never written to the mirror's
+config.
+"""
+
+import hashlib
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_MIRROR_ROOT = Path(__file__).parent / "generated" / "git-mirrors"
+
+
+def _subprocess_run(cmd: str, cwd: str = None, timeout: int = 600) -> Tuple[bool, str]:
+    try:
+        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+        return result.returncode == 0, result.stdout + result.stderr
+    except subprocess.TimeoutExpired:
+        return False, "Timeout"
+    except Exception as e:
+        return False, str(e)
+
+
+def strip_credentials(repo_url: str) -> str:
+    """The repository URL without user:token@, used to key the mirror."""
+    parts = urlsplit(repo_url)
+    if parts.scheme and "@" in parts.netloc:
+        return urlunsplit(parts._replace(netloc=parts.netloc.rsplit("@", 1)[1]))
+    return repo_url
+
+
+class GitMirror:
+    """A bare mirror of one repository and the worktrees checked out from it."""
+
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, repo_url: str, mirror_root: Path = DEFAULT_MIRROR_ROOT, env_prefix: str = "",
+                 run_command: Optional[Callable[..., Tuple[bool, str]]] = None):
+        self.repo_url = repo_url
+        # e.g. GIT_SSH_COMMAND='ssh -i key' for SSH remotes
+        self.env_prefix = f"{env_prefix} " if env_prefix else ""
+        self.run_command = run_command or _subprocess_run
+        key = hashlib.sha256(strip_credentials(repo_url).encode("utf-8")).hexdigest()[:16]
+        self.path = Path(mirror_root) / f"{key}.git"
+        with self._locks_guard:
+            # Fetches and worktree changes to the same mirror are serialized
+            self._lock = self._locks.setdefault(str(self.path), threading.Lock())
+
+    def _git(self, args: str, timeout: int = 600) -> Tuple[bool, str]:
+        return self.run_command(f'{self.env_prefix}git -C "{self.path}" {args}', timeout=timeout)
+
+    def update(self, branch: str) -> Tuple[bool, str]:
+        """Create the mirror if needed and fetch the branch; only new objects are transferred."""
+        with self._lock:
+            if not (self.path / "HEAD").exists():
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                success, output = self.run_command(f'git init --bare "{self.path}"', timeout=60)
+                if not success:
+                    return False, output
+            return self._git(f'fetch --prune --no-tags "{self.repo_url}" '
+                             f'"+refs/heads/{branch}:refs/heads/{branch}"')
+
+    def revision(self, ref: str) -> str:
+        """Commit ID of a branch or commit in the mirror, or "" if unknown."""
+        success, output = self._git(f'rev-parse --verify --quiet "{ref}^{{commit}}"', timeout=30)
+        return output.strip() if success else ""
+
+    def add_worktree(self, destination: str, ref: str) -> Tuple[bool, str]:
+        """Check out ref (branch or commit) into destination as a detached worktree."""
+        commit = self.revision(ref)
+        if not commit:
+            return False, f"Unknown revision: {ref}"
+        self.remove_worktree(destination)
+        with self._lock:
+            return self._git(f'worktree add --force --detach "{destination}" {commit}')
+
+    def remove_worktree(self, destination: str):
+        """Delete a worktree directory and drop its registration from the mirror."""
+        with self._lock:
+            if Path(destination).exists():
+                shutil.rmtree(destination, ignore_errors=True)
+            if self.path.exists():
+                self._git("worktree prune", timeout=60)
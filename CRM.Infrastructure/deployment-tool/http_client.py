@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Pooled HTTP Client
+Keep-alive HTTP(S) client for the smoke tests, BVT tests and readiness
+checks in main.py and the web UI.
+
+Connections are pooled per scheme, host and port, so consecutive checks
+against the same API or frontend reuse one TCP connection (and one TLS
+session) instead of reconnecting for every request. All HTTPS connections
+share one TLS context that accepts self-signed certificates, as deployments
+commonly use them.
+
+Every response carries the time spent in each phase of the request (DNS,
+connect, TLS, time to first byte, total); the first three only when the
+request had to open a new connection.
+"""
+
+import http.client
+import socket
+import ssl
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+
+def _insecure_context() -> ssl.SSLContext:
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+@dataclass
+class HTTPResponse:
+    """A fully read response."""
+    status: int
+    reason: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    url: str = ""
+    # Milliseconds per phase: dns, connect, tls (new connections only), ttfb, total
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="ignore")
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    def header(self, name: str, default: str = "") -> str:
+        """Header value, matched case-insensitively."""
+        name = name.lower()
+        return next((value for key, value in self.headers.items() if key.lower() == name), default)
+
+
+class HTTPClient:
+    """Pool of keep-alive connections; safe to share between threads."""
+
+    # Idle connections kept per host:port
+    MAX_IDLE_PER_HOST = 8
+    MAX_REDIRECTS = 5
+    # Methods that are safe to resend when a reused connection turns out to be closed
+    RETRYABLE_METHODS = {"GET", "HEAD", "OPTIONS"}
+    # Raised when the server closed an idle keep-alive connection
+    STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                    ConnectionResetError, BrokenPipeError)
+
+    _shared: Optional['HTTPClient'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, user_agent: str = "CRM-Deploy-Tool",
+                 max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        self.ssl_context = ssl_context or _insecure_context()
+        self.user_agent = user_agent
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'HTTPClient':
+        """The process-wide client."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _acquire(self, key: Tuple[str, str, int], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """An idle connection for key (reused=True) or a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _connect(self, conn: http.client.HTTPConnection, scheme: str, host: str, port: int,
+                 timings: Dict[str, float]):
+        """Open the connection's socket step by step, timing DNS, TCP connect and TLS.
+
+        Like socket.create_connection, every resolved address is tried in turn
+        (e.g. ::1, then 127.0.0.1 for localhost); connect is the time to the one
+        that accepted.
+        """
+        started = time.perf_counter()
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        resolved = time.perf_counter()
+        timings["dns"] = (resolved - started) * 1000
+        error: Optional[OSError] = None
+        for family, socktype, proto, _, address in addresses:
+            attempt = time.perf_counter()
+            sock = socket.socket(family, socktype, proto)
+            try:
+                sock.settimeout(conn.timeout)
+                sock.connect(address)
+                break
+            except OSError as e:
+                sock.close()
+                error = e
+        else:
+            raise error or OSError(f"getaddrinfo returned no addresses for {host}")
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connected = time.perf_counter()
+            timings["connect"] = (connected - attempt) * 1000
+            if scheme == "https":
+                sock = self.ssl_context.wrap_socket(sock, server_hostname=host)
+                timings["tls"] = (time.perf_counter() - connected) * 1000
+        except Exception:
+            sock.close()
+            raise
+        conn.sock = sock
+    
+    def _release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, url: str, method: str, headers: Dict[str, str], body: Optional[bytes],
+              timeout: float) -> HTTPResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "localhost", port)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            timings: Dict[str, float] = {}
+            try:
+                if conn.sock is None:
+                    self._connect(conn, *key, timings)
+                sent = time.perf_counter()
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                timings["ttfb"] = (time.perf_counter() - sent) * 1000
+                data = response.read()
+            except self.STALE_ERRORS:
+                conn.close()
+                if reused and method in self.RETRYABLE_METHODS:
+                    # The server dropped the idle connection; retry on a fresh one
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return HTTPResponse(response.status, response.reason, dict(response.getheaders()), data, url, timings)
+
+    def request(self, url: str, method: str = "GET", headers: Dict[str, str] = None,
+                body: Optional[bytes] = None, timeout: float = 15,
+                follow_redirects: bool = True) -> HTTPResponse:
+        """Send a request and read the whole response.
+
+        Unlike urlopen, error statuses are returned, not raised; connection
+        failures and timeouts still raise. Redirects of GET and HEAD requests
+        are followed.
+        """
+        started = time.perf_counter()
+        request_headers = {"User-Agent": self.user_agent}
+        request_headers.update(headers or {})
+        response = self._send(url, method, request_headers, body, timeout)
+        redirects = 0
+        while (follow_redirects and method in ("GET", "HEAD") and response.status in (301, 302, 303, 307, 308)
+               and response.header("Location") and redirects < self.MAX_REDIRECTS):
+            redirects += 1
+            url = urljoin(url, response.header("Location"))
+            response = self._send(url, method, request_headers, None, timeout)
+        # Phases are those of the last hop; total includes any redirects
+        response.timings["total"] = (time.perf_counter() - started) * 1000
+        return response
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Latency Histograms
+Compact, mergeable latency histograms for smoke and load test results.
+
+Values are recorded in microseconds into HDR-style log-linear buckets:
+every power of two is split into 16 linear sub-buckets, so a bucket is
+within about 6% of any value in it while a histogram from milliseconds to
+minutes needs only a few hundred buckets. Only non-empty buckets are
+stored, and two histograms merge by adding their bucket counts.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# 2**SUB_BUCKET_BITS linear sub-buckets per power of two
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def format_ms(value_ms: float) -> str:
+    """Milliseconds with a decimal below 10ms, where DNS and connect times usually are."""
+    return f"{value_ms:.1f}ms" if value_ms < 10 else f"{value_ms:.0f}ms"
+
+
+def bucket_index(value_us: int) -> int:
+    """Bucket of a value; values below 2 * SUB_BUCKETS get an exact bucket."""
+    value_us = max(int(value_us), 0)
+    shift = max(value_us.bit_length() - SUB_BUCKET_BITS - 1, 0)
+    return shift * SUB_BUCKETS + (value_us >> shift)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Lowest and highest value (microseconds) of a bucket."""
+    shift = max(index // SUB_BUCKETS - 1, 0)
+    mantissa = index - shift * SUB_BUCKETS
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Latency distribution of one measurement, e.g. the TLS phase of a check."""
+
+    def __init__(self, counts: Optional[Dict[int, int]] = None):
+        self.counts: Dict[int, int] = dict(counts or {})
+        self.count = sum(self.counts.values())
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def record(self, value_ms: float, times: int = 1):
+        """Add a value in milliseconds."""
+        value_us = max(int(round(value_ms * 1000)), 0)
+        index = bucket_index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + times
+        self.count += times
+        self.total_us += value_us * times
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """Add another histogram's values to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        for attr, pick in (("min_us", min), ("max_us", max)):
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            setattr(self, attr, theirs if mine is None else mine if theirs is None else pick(mine, theirs))
+        return self
+
+    def percentile(self, pct: float) -> float:
+        """Value in milliseconds at or below which pct percent of the values fall."""
+        if not self.count:
+            return 0.0
+        rank = max(-(-pct * self.count // 100), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                value_us = (low + high) / 2
+                # Exact extremes are known, keep the estimate within them
+                if self.max_us is not None:
+                    value_us = min(value_us, self.max_us)
+                if self.min_us is not None:
+                    value_us = max(value_us, self.min_us)
+                return value_us / 1000
+        return (self.max_us or 0) / 1000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        return (self.max_us or 0) / 1000
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99)) -> str:
+        """e.g. "p50 12ms | p90 18ms | p99 40ms | max 41ms (n=20)"."""
+        parts = [f"p{pct:g} {format_ms(self.percentile(pct))}" for pct in percentiles]
+        parts.append(f"max {format_ms(self.max)}")
+        return f"{' | '.join(parts)} (n={self.count})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "unit": "us",
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+            "total": self.total_us,
+            "min": self.min_us,
+            "max": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        histogram = cls({int(index): count for index, count in data.get("counts", {}).items()})
+        histogram.total_us = data.get("total", 0)
+        histogram.min_us = data.get("min")
+        histogram.max_us = data.get("max")
+        return histogram
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Log Store
+Bounded in-memory log shared by the deployment session log, the wizard's
+activity log panel and the web UI.
+
+Entries live in a fixed-capacity ring buffer and are numbered with a
+sequence number that only ever increases, so a reader keeps a cursor and
+asks for the entries after it. Each level (info, error, ...) has its own
+index of sequence numbers, so "show only errors" touches only the errors.
+When the buffer is full the oldest entry is dropped; with a spill path it
+is appended to a JSON-lines file first, so a long session keeps memory flat
+without losing history.
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+DEFAULT_CAPACITY = 10000
+
+
+@dataclass
+class LogEntry:
+    """One log line."""
+    seq: int
+    level: str
+    message: str
+    timestamp: datetime = field(default_factory=datetime.now)
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "seq": self.seq,
+            "time": self.timestamp.strftime("%H:%M:%S"),
+            "timestamp": self.timestamp.isoformat(),
+            "level": self.level,
+            "message": self.message,
+        }
+        if self.details:
+            data["details"] = self.details
+        return data
+
+
+class LogStore:
+    """Ring buffer of log entries with per-level indexes; safe to share between threads."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, spill_path: Optional[Union[str, Path]] = None):
+        self.capacity = max(int(capacity), 1)
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._buffer: List[Optional[LogEntry]] = [None] * self.capacity
+        self._levels: Dict[str, Deque[int]] = {}
+        self._first_seq = 1
+        self._last_seq = 0
+        self._dropped = 0
+        self._spill_file = None
+        self._condition = threading.Condition()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest entry, 0 before the first one."""
+        return self._last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest entry still in memory."""
+        return self._first_seq
+
+    @property
+    def dropped(self) -> int:
+        """Entries evicted from memory (and written to the spill file, if any)."""
+        return self._dropped
+
+    def __len__(self) -> int:
+        return self._last_seq - self._first_seq + 1
+
+    def append(self, level: str, message: str, details: Dict[str, Any] = None) -> LogEntry:
+        """Add an entry, evicting the oldest one when full, and wake waiting readers."""
+        with self._condition:
+            if len(self) == self.capacity:
+                self._evict()
+            self._last_seq += 1
+            entry = LogEntry(self._last_seq, level, message, details=details or {})
+            self._buffer[entry.seq % self.capacity] = entry
+            self._levels.setdefault(level, deque()).append(entry.seq)
+            self._condition.notify_all()
+        return entry
+
+    def _evict(self):
+        entry = self._buffer[self._first_seq % self.capacity]
+        self._buffer[self._first_seq % self.capacity] = None
+        self._first_seq += 1
+        self._dropped += 1
+        # The oldest entry is also the oldest of its level
+        index = self._levels[entry.level]
+        index.popleft()
+        if not index:
+            del self._levels[entry.level]
+        if self.spill_path:
+            self._spill(entry)
+
+    def _spill(self, entry: LogEntry):
+        try:
+            if self._spill_file is None:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+            self._spill_file.write(json.dumps(entry.to_dict(), default=str) + "\n")
+            self._spill_file.flush()
+        except OSError:
+            # Memory stays bounded either way; the spilled history is best effort
+            self.spill_path = None
+
+    def after(self, seq: int = 0, limit: Optional[int] = None) -> List[LogEntry]:
+        """Entries newer than seq, oldest first; costs only the entries returned."""
+        with self._condition:
+            start = max(seq + 1, self._first_seq)
+            end = self._last_seq + 1 if limit is None else min(self._last_seq + 1, start + limit)
+            return [self._buffer[s % self.capacity] for s in range(start, end)]
+
+    def wait(self, seq: int, timeout: float) -> List[LogEntry]:
+        """Entries newer than seq, waiting up to timeout seconds for one if there are none yet."""
+        with self._condition:
+            if self._last_seq <= seq:
+                self._condition.wait(timeout)
+            return self.after(seq)
+
+    def by_level(self, *levels: str) -> List[LogEntry]:
+        """Entries of the given levels still in memory, oldest first."""
+        with self._condition:
+            seqs = sorted(s for level in levels for s in self._levels.get(level, ()))
+            return [self._buffer[s % self.capacity] for s in seqs]
+
+    def counts(self) -> Dict[str, int]:
+        """Entries in memory per level."""
+        with self._condition:
+            return {level: len(index) for level, index in self._levels.items()}
+
+    def clear(self):
+        """Drop all entries from memory; sequence numbers keep counting."""
+        with self._condition:
+            self._buffer = [None] * self.capacity
+            self._levels = {}
+            self._first_seq = self._last_seq + 1
+
+    def close(self):
+        with self._condition:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
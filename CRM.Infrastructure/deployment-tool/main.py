@@ -15,20 +15,27 @@ import json
 import os
 import sys
 import secrets
+import shlex
 import subprocess
 import threading
 import webbrowser
 import socket
-import queue
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple, Callable
 from dataclasses import dataclass, asdict, field
 from enum import Enum
-import urllib.request
-import urllib.error
-import ssl
+
+from build_cache import BuildCache, fingerprint
+from command_runner import CommandRunner
+from git_mirror import GitMirror
+from http_client import HTTPClient
+from latency_histogram import LatencyHistogram, format_ms
+from log_store import LogEntry, LogStore
+from ssh_connection import SSHConnection
+from step_scheduler import StepScheduler
 
 # Version
 VERSION = "3.1.0"
@@ -47,6 +54,10 @@ NAMING_CONVENTIONS = {
     }
 }
 
+# Per-country ZIP code partitions written by
+# database/master_data/convert_geonames.py --partition-dir
+ZIP_CODE_PARTITIONS_DIR = Path(__file__).resolve().parent.parent.parent / "database" / "master_data" / "geonames"
+
 
 class DeploymentStatus(Enum):
     """Deployment status enum."""
@@ -93,26 +104,60 @@ class SmokeTestResult:
     duration_ms: float
     message: str = ""
     details: Dict[str, Any] = field(default_factory=dict)
+    # Latency per request phase (dns, connect, tls, ttfb, total) over all samples
+    latency: Dict[str, LatencyHistogram] = field(default_factory=dict)
+
+
+@dataclass
+class LoadTestResult:
+    """Load test statistics for one endpoint."""
+    test_name: str
+    category: str
+    requests: int
+    errors: int
+    duration_s: float
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    passed: bool = True
+    message: str = ""
+    
+    @property
+    def rps(self) -> float:
+        return self.requests / self.duration_s if self.duration_s else 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        """Failed requests in percent."""
+        return 100.0 * self.errors / self.requests if self.requests else 0.0
 
 
 class DeploymentResourceLog:
     """Tracks all resources created during deployment for summary and cleanup."""
     
-    def __init__(self):
+    # Level prefix of session events (resource_created, test_completed, ...), which
+    # go into the summary but not into the activity log panel
+    EVENT_PREFIX = "event:"
+    
+    def __init__(self, log_store: Optional[LogStore] = None):
         self.resources: List[DeployedResource] = []
-        self.session_log: List[Dict[str, Any]] = []
+        # Bounded and possibly shared with the wizard's activity log; this session
+        # is the entries after session_start
+        self.session_log = log_store if log_store is not None else LogStore()
+        self.session_start = self.session_log.last_seq
         self.start_time: datetime = datetime.now()
         self.end_time: Optional[datetime] = None
         self.test_results: List[SmokeTestResult] = []
+        self.load_test_results: List[LoadTestResult] = []
         
     def log_event(self, event_type: str, message: str, details: Dict[str, Any] = None):
         """Log a session event."""
-        self.session_log.append({
-            "timestamp": datetime.now().isoformat(),
-            "event_type": event_type,
-            "message": message,
-            "details": details or {}
-        })
+        self.session_log.append(self.EVENT_PREFIX + event_type, message, details)
+    
+    def session_entries(self) -> List[LogEntry]:
+        """Events of this session still held in memory."""
+        return self.session_log.after(self.session_start)
     
     def add_resource(self, resource_type: str, name: str, details: Dict[str, Any] = None) -> DeployedResource:
         """Add a deployed resource."""
@@ -143,6 +188,13 @@ class DeploymentResourceLog:
         self.log_event("test_completed", f"{result.test_name}: {'PASSED' if result.passed else 'FAILED'}", 
                       {"category": result.category, "duration_ms": result.duration_ms})
     
+    def add_load_test_result(self, result: LoadTestResult):
+        """Add the load test statistics of one endpoint."""
+        self.load_test_results.append(result)
+        self.log_event("load_test_completed", f"{result.test_name}: {'PASSED' if result.passed else 'FAILED'}",
+                      {"requests": result.requests, "error_rate": round(result.error_rate, 2),
+                       "p99_ms": round(result.p99_ms, 1)})
+    
     def get_resources_by_type(self, resource_type: str) -> List[DeployedResource]:
         """Get resources by type."""
         return [r for r in self.resources if r.resource_type == resource_type]
@@ -240,11 +292,43 @@ class DeploymentSummaryGenerator:
                 lines.append(f"  {cat.upper()} TESTS:")
                 for t in tests:
                     icon = "✓" if t.passed else "✗"
-                    lines.append(f"    {icon} {t.test_name} ({t.duration_ms:.0f}ms)")
+                    lines.append(f"    {icon} {t.test_name} ({format_ms(t.duration_ms)})")
                     if t.message:
                         lines.append(f"        {t.message}")
+                    if "total" in t.latency:
+                        lines.append(f"        total {t.latency['total'].summary()}")
+                        phases = [f"{phase} {format_ms(t.latency[phase].percentile(50))} (n={t.latency[phase].count})"
+                                  for phase in ("dns", "connect", "tls", "ttfb") if phase in t.latency]
+                        if phases:
+                            lines.append(f"        p50 by phase: {' · '.join(phases)}")
                 lines.append("")
         
+        # Load test results (if any)
+        if self.resource_log.load_test_results:
+            results = self.resource_log.load_test_results
+            duration = max(r.duration_s for r in results)
+            total_rps = sum(r.requests for r in results) / duration if duration else 0.0
+            gate_passed = all(r.passed for r in results) and total_rps >= self.config.load_test_slo_min_rps
+            
+            lines.append("-" * 80)
+            lines.append("LOAD TEST RESULTS")
+            lines.append("-" * 80)
+            lines.append(f"  SLO gate: {'PASSED' if gate_passed else 'FAILED'} "
+                         f"(p99 <= {self.config.load_test_slo_p99_ms:.0f}ms, "
+                         f"errors <= {self.config.load_test_slo_error_rate:.1f}%, "
+                         f"throughput >= {self.config.load_test_slo_min_rps:.1f} req/s)")
+            lines.append(f"  Throughput: {total_rps:.1f} req/s over {duration:.0f}s")
+            lines.append("")
+            for r in results:
+                icon = "✓" if r.passed else "✗"
+                lines.append(f"    {icon} {r.test_name}: {r.requests} requests, {r.rps:.1f} req/s, "
+                             f"{r.error_rate:.1f}% errors")
+                lines.append(f"        p50 {r.p50_ms:.0f}ms | p90 {r.p90_ms:.0f}ms | "
+                             f"p99 {r.p99_ms:.0f}ms | max {r.max_ms:.0f}ms")
+                if r.message:
+                    lines.append(f"        {r.message}")
+            lines.append("")
+        
         # Decommission log (if test mode)
         if is_test_mode:
             lines.append("-" * 80)
@@ -264,9 +348,16 @@ class DeploymentSummaryGenerator:
         lines.append("-" * 80)
         lines.append("FULL SESSION LOG")
         lines.append("-" * 80)
-        for entry in self.resource_log.session_log:
-            ts = entry["timestamp"].split("T")[1].split(".")[0]  # Just time
-            lines.append(f"  [{ts}] {entry['event_type']}: {entry['message']}")
+        entries = self.resource_log.session_entries()
+        session_log = self.resource_log.session_log
+        earlier = (entries[0].seq if entries else session_log.last_seq + 1) - self.resource_log.session_start - 1
+        if earlier > 0:
+            where = f" (see {session_log.spill_path})" if session_log.spill_path else ""
+            lines.append(f"  ... {earlier} earlier entries dropped from memory{where}")
+        for entry in entries:
+            level = entry.level[len(DeploymentResourceLog.EVENT_PREFIX):] \
+                if entry.level.startswith(DeploymentResourceLog.EVENT_PREFIX) else entry.level
+            lines.append(f"  [{entry.timestamp.strftime('%H:%M:%S')}] {level}: {entry.message}")
         lines.append("")
         
         lines.append("=" * 80)
@@ -307,7 +398,42 @@ class DeploymentSummaryGenerator:
 
 
 class SmokeTestRunner:
-    """Runs smoke tests on deployed application."""
+    """Runs smoke tests on deployed application.
+    
+    The checks are independent requests, so they run concurrently (at most
+    config.smoke_test_parallelism at a time) and the suite takes about as
+    long as its slowest check. Results are still recorded and logged in the
+    order the checks are defined. config.smoke_test_deadline caps the whole
+    suite: request timeouts shrink to the time left, and checks that have
+    not finished by then are recorded as failed.
+    
+    Each check runs config.smoke_test_samples times; the phase timings of
+    every request go into per-phase latency histograms on the result.
+    """
+    
+    # Timeout of a single request in seconds
+    REQUEST_TIMEOUT = 15
+    # Common API endpoints to test: (path, test name)
+    API_ENDPOINTS = [
+        ("/api/version", "API Version Endpoint"),
+        ("/api/auth/status", "Auth Status Endpoint"),
+        ("/swagger", "Swagger Documentation"),
+        ("/api/customers", "Customers API (may require auth)"),
+    ]
+    # UI pages to test: (path, test name)
+    UI_PAGES = [
+        ("/", "Home Page"),
+        ("/login", "Login Page"),
+        ("/dashboard", "Dashboard Page"),
+        ("/customers", "Customers Page"),
+        ("/settings", "Settings Page"),
+    ]
+    CATEGORY_TITLES = {
+        "health": "Health Check Tests",
+        "api": "API Endpoint Tests",
+        "ui": "UI Page Tests",
+        "cors": "CORS Tests",
+    }
     
     def __init__(self, config: 'DeploymentConfig', resource_log: DeploymentResourceLog, 
                  log_callback: Callable[[str, str], None] = None):
@@ -315,47 +441,80 @@ class SmokeTestRunner:
         self.resource_log = resource_log
         self.log_callback = log_callback or (lambda t, m: print(f"[{t}] {m}"))
         self.results: List[SmokeTestResult] = []
+        # (test name, category, check returning (passed, message)) in reporting order
+        self.checks: List[Tuple[str, str, Callable[[], Tuple[bool, str]]]] = []
+        self.deadline: Optional[float] = None
+        self.http = HTTPClient.shared()
+        # Phase histograms of the check running on the current thread
+        self._recorder = threading.local()
         
     def _log(self, msg_type: str, message: str):
         """Log a message."""
         self.log_callback(msg_type, message)
+    
+    def _request_timeout(self) -> float:
+        """Per-request timeout, never past the suite deadline."""
+        if self.deadline is None:
+            return self.REQUEST_TIMEOUT
+        return max(min(self.REQUEST_TIMEOUT, self.deadline - time.monotonic()), 0.1)
         
     def _make_request(self, url: str, method: str = "GET", 
                      headers: Dict[str, str] = None, 
                      check_cors: bool = False) -> Tuple[bool, int, str, Dict]:
         """Make HTTP request and return (success, status, body, headers)."""
-        import urllib.request
-        import urllib.error
-        import ssl
+        request_headers = dict(headers or {})
+        # Add Origin header for CORS testing
+        if check_cors:
+            request_headers["Origin"] = f"http://{self.config.domain}:{self.config.frontend_port}"
         
-        start = time.time()
         try:
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            req = urllib.request.Request(url, method=method)
-            if headers:
-                for k, v in headers.items():
-                    req.add_header(k, v)
-            
-            # Add Origin header for CORS testing
-            if check_cors:
-                req.add_header("Origin", f"http://{self.config.domain}:{self.config.frontend_port}")
-            
-            with urllib.request.urlopen(req, timeout=15, context=ctx) as response:
-                body = response.read().decode('utf-8', errors='ignore')
-                resp_headers = dict(response.headers)
-                duration = (time.time() - start) * 1000
-                return True, response.status, body, resp_headers
-                
-        except urllib.error.HTTPError as e:
-            duration = (time.time() - start) * 1000
-            return False, e.code, str(e), {}
+            response = self.http.request(url, method=method, headers=request_headers,
+                                         timeout=self._request_timeout())
+            self._record_timings(response.timings)
+            if not response.ok:
+                return False, response.status, f"HTTP Error {response.status}: {response.reason}", {}
+            return True, response.status, response.text, response.headers
         except Exception as e:
-            duration = (time.time() - start) * 1000
             return False, 0, str(e), {}
     
+    def _add_check(self, test_name: str, category: str, check: Callable[[], Tuple[bool, str]]):
+        """Queue a check for run_all_tests."""
+        self.checks.append((test_name, category, check))
+    
+    def _record_timings(self, timings: Dict[str, float]):
+        phases = getattr(self._recorder, "phases", None)
+        if phases is None:
+            return
+        for phase, value_ms in timings.items():
+            phases.setdefault(phase, LatencyHistogram()).record(value_ms)
+    
+    def _sample(self, check: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str, float, Dict[str, LatencyHistogram]]:
+        """Run a check smoke_test_samples times; it passes only if every sample passes.
+        
+        Returns the message of the first failing (or the last) sample, the
+        median check duration and the phase histograms.
+        """
+        phases: Dict[str, LatencyHistogram] = {}
+        durations = LatencyHistogram()
+        self._recorder.phases = phases
+        passed, message = True, ""
+        try:
+            for _ in range(max(self.config.smoke_test_samples, 1)):
+                if self.deadline is not None and time.monotonic() >= self.deadline and durations.count:
+                    break
+                start = time.time()
+                try:
+                    sample_passed, sample_message = check()
+                except Exception as e:
+                    sample_passed, sample_message = False, f"Error: {str(e)[:50]}"
+                durations.record((time.time() - start) * 1000)
+                if passed:
+                    message = sample_message
+                passed = passed and sample_passed
+        finally:
+            self._recorder.phases = None
+        return passed, message, durations.percentile(50), phases
+    
     def run_all_tests(self) -> List[SmokeTestResult]:
         """Run all smoke tests."""
         self._log("info", "=" * 50)
@@ -363,31 +522,49 @@ class SmokeTestRunner:
         self._log("info", "=" * 50)
         
         self.results = []
+        self.checks = []
         
-        # Health checks
         self._run_health_tests()
-        
-        # API tests
         self._run_api_tests()
-        
-        # UI tests
         self._run_ui_tests()
-        
-        # CORS tests
         self._run_cors_tests()
         
+        started = time.monotonic()
+        self.deadline = started + self.config.smoke_test_deadline if self.config.smoke_test_deadline else None
+        pool = ThreadPoolExecutor(max_workers=max(1, self.config.smoke_test_parallelism))
+        try:
+            futures = [pool.submit(self._sample, check) for _, _, check in self.checks]
+            category = None
+            for (test_name, check_category, _), future in zip(self.checks, futures):
+                if check_category != category:
+                    category = check_category
+                    self._log("info", f"\n--- {self.CATEGORY_TITLES.get(category, category)} ---")
+                remaining = None if self.deadline is None else max(self.deadline - time.monotonic(), 0)
+                try:
+                    passed, message, duration, latency = future.result(timeout=remaining)
+                except FuturesTimeout:
+                    passed, message = False, f"Not finished within the {self.config.smoke_test_deadline}s deadline"
+                    duration, latency = (time.monotonic() - started) * 1000, {}
+                self._add_result(test_name, category, passed, duration, message, latency=latency)
+        finally:
+            # Requests still running end by the deadline through their timeout
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.deadline = None
+        
         # Log summary
         passed = sum(1 for r in self.results if r.passed)
         failed = len(self.results) - passed
         
         self._log("info", "=" * 50)
-        self._log("info", f"SMOKE TEST SUMMARY: {passed} passed, {failed} failed")
+        self._log("info", f"SMOKE TEST SUMMARY: {passed} passed, {failed} failed "
+                          f"({time.monotonic() - started:.1f}s)")
         self._log("info", "=" * 50)
         
         return self.results
     
     def _add_result(self, test_name: str, category: str, passed: bool, 
-                   duration_ms: float, message: str = "", details: Dict = None):
+                   duration_ms: float, message: str = "", details: Dict = None,
+                   latency: Dict[str, LatencyHistogram] = None):
         """Add a test result."""
         result = SmokeTestResult(
             test_name=test_name,
@@ -395,7 +572,8 @@ class SmokeTestRunner:
             passed=passed,
             duration_ms=duration_ms,
             message=message,
-            details=details or {}
+            details=details or {},
+            latency=latency or {}
         )
         self.results.append(result)
         self.resource_log.add_test_result(result)
@@ -404,140 +582,256 @@ class SmokeTestRunner:
         level = "success" if passed else "error"
         self._log(level, f"{icon} {test_name}: {message or ('PASSED' if passed else 'FAILED')}")
     
-    def _run_health_tests(self):
-        """Run health endpoint tests."""
-        self._log("info", "\n--- Health Check Tests ---")
-        
-        protocol = "https" if self.config.ssl_enabled else "http"
-        
-        # API health
-        start = time.time()
-        api_url = f"{protocol}://{self.config.domain}:{self.config.api_port}/health"
-        success, status, body, headers = self._make_request(api_url)
-        duration = (time.time() - start) * 1000
-        self._add_result("API Health Check", "health", success and status < 400, duration,
-                        f"Status: {status}" if success else f"Failed: {body[:100]}")
-        
-        # Frontend health
-        start = time.time()
-        frontend_url = f"{protocol}://{self.config.domain}:{self.config.frontend_port}"
-        success, status, body, headers = self._make_request(frontend_url)
-        duration = (time.time() - start) * 1000
-        self._add_result("Frontend Health Check", "health", success and status < 400, duration,
-                        f"Status: {status}" if success else f"Failed: {body[:100]}")
-        
-        # Database connectivity (via API)
-        start = time.time()
-        db_url = f"{protocol}://{self.config.domain}:{self.config.api_port}/api/health/database"
-        success, status, body, headers = self._make_request(db_url)
-        duration = (time.time() - start) * 1000
-        # This endpoint may not exist, so we check if API is up as fallback
-        self._add_result("Database Connectivity", "health", success and status < 400, duration,
-                        f"Status: {status}" if success else "Endpoint not available (API may not expose this)")
-    
-    def _run_api_tests(self):
-        """Run API endpoint tests."""
-        self._log("info", "\n--- API Endpoint Tests ---")
-        
+    def endpoint_catalog(self) -> List[Tuple[str, str, str]]:
+        """(test name, category, URL) of every endpoint the health, API and UI tests request."""
         protocol = "https" if self.config.ssl_enabled else "http"
-        base_url = f"{protocol}://{self.config.domain}:{self.config.api_port}"
-        
-        # Common API endpoints to test
-        endpoints = [
-            ("/api/version", "API Version Endpoint"),
-            ("/api/auth/status", "Auth Status Endpoint"),
-            ("/swagger", "Swagger Documentation"),
-            ("/api/customers", "Customers API (may require auth)"),
+        api_base = f"{protocol}://{self.config.domain}:{self.config.api_port}"
+        frontend_base = f"{protocol}://{self.config.domain}:{self.config.frontend_port}"
+        
+        catalog = [
+            ("API Health Check", "health", f"{api_base}/health"),
+            ("Frontend Health Check", "health", frontend_base),
+            # Database connectivity (via API)
+            ("Database Connectivity", "health", f"{api_base}/api/health/database"),
         ]
-        
-        for endpoint, name in endpoints:
-            start = time.time()
-            url = f"{base_url}{endpoint}"
-            success, status, body, headers = self._make_request(url)
-            duration = (time.time() - start) * 1000
-            
+        catalog += [(name, "api", f"{api_base}{endpoint}") for endpoint, name in self.API_ENDPOINTS]
+        catalog += [(name, "ui", f"{frontend_base}{page}") for page, name in self.UI_PAGES]
+        return catalog
+    
+    @staticmethod
+    def is_acceptable(category: str, success: bool, status: int) -> bool:
+        """Whether a response counts as a working endpoint."""
+        if category == "api":
             # 401/403 is acceptable - means endpoint exists but requires auth
-            is_ok = status in [200, 201, 204, 401, 403] if success else False
-            self._add_result(name, "api", success or status in [401, 403], duration,
-                           f"Status: {status}" if status else f"Failed: {body[:50]}")
+            return success or status in [401, 403]
+        if category == "ui":
+            # React apps often return 200 for all routes (SPA)
+            return success and status == 200
+        return success and status < 400
+    
+    def _run_health_tests(self):
+        """Queue health endpoint tests."""
+        def check_status(url: str, failure: str = None) -> Callable[[], Tuple[bool, str]]:
+            def check() -> Tuple[bool, str]:
+                success, status, body, headers = self._make_request(url)
+                return (self.is_acceptable("health", success, status),
+                        f"Status: {status}" if success else failure or f"Failed: {body[:100]}")
+            return check
+        
+        for name, category, url in self.endpoint_catalog():
+            if category != "health":
+                continue
+            if name == "Database Connectivity":
+                # This endpoint may not exist, so we check if API is up as fallback
+                self._add_check(name, category, check_status(url, "Endpoint not available (API may not expose this)"))
+            else:
+                self._add_check(name, category, check_status(url))
+    
+    def _run_api_tests(self):
+        """Queue API endpoint tests."""
+        def check_endpoint(url: str) -> Callable[[], Tuple[bool, str]]:
+            def check() -> Tuple[bool, str]:
+                success, status, body, headers = self._make_request(url)
+                return (self.is_acceptable("api", success, status),
+                        f"Status: {status}" if status else f"Failed: {body[:50]}")
+            return check
+        
+        for name, category, url in self.endpoint_catalog():
+            if category == "api":
+                self._add_check(name, category, check_endpoint(url))
     
     def _run_ui_tests(self):
-        """Run UI page accessibility tests."""
-        self._log("info", "\n--- UI Page Tests ---")
-        
-        protocol = "https" if self.config.ssl_enabled else "http"
-        base_url = f"{protocol}://{self.config.domain}:{self.config.frontend_port}"
-        
-        # UI pages to test
-        pages = [
-            ("/", "Home Page"),
-            ("/login", "Login Page"),
-            ("/dashboard", "Dashboard Page"),
-            ("/customers", "Customers Page"),
-            ("/settings", "Settings Page"),
-        ]
-        
-        for page, name in pages:
-            start = time.time()
-            url = f"{base_url}{page}"
-            success, status, body, headers = self._make_request(url)
-            duration = (time.time() - start) * 1000
-            
-            # Check if it returns HTML
-            is_html = "<html" in body.lower() if body else False
-            is_ok = success and status == 200 and is_html
-            
-            # React apps often return 200 for all routes (SPA)
-            self._add_result(name, "ui", success and status == 200, duration,
-                           f"Status: {status}, HTML: {is_html}")
+        """Queue UI page accessibility tests."""
+        def check_page(url: str) -> Callable[[], Tuple[bool, str]]:
+            def check() -> Tuple[bool, str]:
+                success, status, body, headers = self._make_request(url)
+                # Check if it returns HTML
+                is_html = "<html" in body.lower() if body else False
+                return self.is_acceptable("ui", success, status), f"Status: {status}, HTML: {is_html}"
+            return check
+        
+        for name, category, url in self.endpoint_catalog():
+            if category == "ui":
+                self._add_check(name, category, check_page(url))
     
     def _run_cors_tests(self):
-        """Run CORS configuration tests."""
-        self._log("info", "\n--- CORS Tests ---")
-        
+        """Queue CORS configuration tests."""
         protocol = "https" if self.config.ssl_enabled else "http"
         api_url = f"{protocol}://{self.config.domain}:{self.config.api_port}/api/version"
         
-        start = time.time()
-        success, status, body, headers = self._make_request(api_url, check_cors=True)
-        duration = (time.time() - start) * 1000
-        
-        # Check for CORS headers
-        cors_header = headers.get("Access-Control-Allow-Origin", "")
-        has_cors = bool(cors_header)
+        def check_headers() -> Tuple[bool, str]:
+            success, status, body, headers = self._make_request(api_url, check_cors=True)
+            # Check for CORS headers
+            cors_header = headers.get("Access-Control-Allow-Origin", "")
+            has_cors = bool(cors_header)
+            return has_cors, (f"Access-Control-Allow-Origin: {cors_header}" if has_cors else "No CORS headers")
+        
+        def check_preflight() -> Tuple[bool, str]:
+            response = self.http.request(api_url, method="OPTIONS", timeout=self._request_timeout(), headers={
+                "Origin": f"http://{self.config.domain}:{self.config.frontend_port}",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "Content-Type",
+            })
+            self._record_timings(response.timings)
+            if not response.ok:
+                raise Exception(f"HTTP Error {response.status}: {response.reason}")
+            allow_methods = response.header("Access-Control-Allow-Methods")
+            return bool(allow_methods), (f"Allowed methods: {allow_methods}" if allow_methods else "No preflight response")
+        
+        self._add_check("CORS Headers Present", "cors", check_headers)
+        # Errors are reported by _sample as "Error: ..."
+        self._add_check("CORS Preflight", "cors", check_preflight)
+
+
+class LoadTestRunner(SmokeTestRunner):
+    """Drives the smoke test endpoints under load and gates the result on SLOs.
+    
+    By default load_test_concurrency workers each send their next request as
+    soon as the previous one returns (closed loop). With load_test_target_rps
+    set, requests are sent on a fixed schedule instead and latency is counted
+    from the scheduled send time, so a slow server shows up as latency rather
+    than as a lower request rate. Requests rotate through the endpoint catalog.
+    """
+    
+    def __init__(self, config: 'DeploymentConfig', resource_log: DeploymentResourceLog, 
+                 log_callback: Callable[[str, str], None] = None):
+        super().__init__(config, resource_log, log_callback)
+        self.http = HTTPClient(max_idle_per_host=max(self.config.load_test_concurrency, 1))
+        self.load_results: List[LoadTestResult] = []
+        self.total_rps = 0.0
+        self.slo_passed = False
+    
+    def _warm_up(self) -> List[Tuple[str, str, str]]:
+        """Endpoints that answer before the test; the others are left out of the load."""
+        available = []
+        for name, category, url in self.endpoint_catalog():
+            try:
+                response = self.http.request(url, timeout=self.REQUEST_TIMEOUT)
+                ok = self.is_acceptable(category, response.ok, response.status)
+            except Exception:
+                ok = False
+            if ok:
+                available.append((name, category, url))
+            else:
+                self._log("warning", f"Skipping {name}: not available before the load test")
+        return available
+    
+    def run_load_test(self) -> List[LoadTestResult]:
+        """Run the load test and record per-endpoint statistics in the resource log."""
+        duration = self.config.load_test_duration
+        concurrency = max(self.config.load_test_concurrency, 1)
+        target_rps = self.config.load_test_target_rps
         
-        self._add_result("CORS Headers Present", "cors", has_cors, duration,
-                        f"Access-Control-Allow-Origin: {cors_header}" if has_cors else "No CORS headers")
+        self._log("info", "=" * 50)
+        self._log("info", f"RUNNING LOAD TEST: {duration}s, {concurrency} workers"
+                          + (f", {target_rps:g} req/s target" if target_rps else ""))
+        self._log("info", "=" * 50)
         
-        # Preflight test
-        start = time.time()
-        try:
-            import urllib.request
-            import ssl
-            
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            req = urllib.request.Request(api_url, method="OPTIONS")
-            req.add_header("Origin", f"http://{self.config.domain}:{self.config.frontend_port}")
-            req.add_header("Access-Control-Request-Method", "POST")
-            req.add_header("Access-Control-Request-Headers", "Content-Type")
+        self.load_results = []
+        catalog = self._warm_up()
+        if not catalog:
+            self._log("error", "No endpoint is available, load test skipped")
+            self.slo_passed = False
+            return self.load_results
+        
+        latencies: Dict[str, LatencyHistogram] = {name: LatencyHistogram() for name, _, _ in catalog}
+        errors: Dict[str, int] = {name: 0 for name, _, _ in catalog}
+        lock = threading.Lock()
+        next_index = 0
+        start = time.monotonic()
+        end = start + duration
+        
+        def worker():
+            nonlocal next_index
+            while True:
+                with lock:
+                    index = next_index
+                    next_index += 1
+                if target_rps:
+                    scheduled = start + index / target_rps
+                    if scheduled >= end:
+                        return
+                    delay = scheduled - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    scheduled = time.monotonic()
+                    if scheduled >= end:
+                        return
+                name, category, url = catalog[index % len(catalog)]
+                try:
+                    response = self.http.request(url, timeout=self.REQUEST_TIMEOUT)
+                    ok = self.is_acceptable(category, response.ok, response.status)
+                except Exception:
+                    ok = False
+                elapsed_ms = (time.monotonic() - scheduled) * 1000
+                with lock:
+                    latencies[name].record(elapsed_ms)
+                    if not ok:
+                        errors[name] += 1
+        
+        workers = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.monotonic() - start
+        self.http.close()
+        
+        slo_p99 = self.config.load_test_slo_p99_ms
+        slo_errors = self.config.load_test_slo_error_rate
+        for name, category, _ in catalog:
+            histogram = latencies[name]
+            result = LoadTestResult(
+                test_name=name,
+                category=category,
+                requests=histogram.count,
+                errors=errors[name],
+                duration_s=elapsed,
+                p50_ms=histogram.percentile(50),
+                p90_ms=histogram.percentile(90),
+                p99_ms=histogram.percentile(99),
+                max_ms=histogram.max,
+            )
+            violations = []
+            if result.p99_ms > slo_p99:
+                violations.append(f"p99 {result.p99_ms:.0f}ms > {slo_p99:.0f}ms")
+            if result.error_rate > slo_errors:
+                violations.append(f"errors {result.error_rate:.1f}% > {slo_errors:.1f}%")
+            result.passed = not violations
+            result.message = "; ".join(violations)
+            self.load_results.append(result)
+            self.resource_log.add_load_test_result(result)
             
-            with urllib.request.urlopen(req, timeout=15, context=ctx) as response:
-                preflight_headers = dict(response.headers)
-                allow_methods = preflight_headers.get("Access-Control-Allow-Methods", "")
-                duration = (time.time() - start) * 1000
-                self._add_result("CORS Preflight", "cors", bool(allow_methods), duration,
-                               f"Allowed methods: {allow_methods}" if allow_methods else "No preflight response")
-        except Exception as e:
-            duration = (time.time() - start) * 1000
-            self._add_result("CORS Preflight", "cors", False, duration, f"Error: {str(e)[:50]}")
+            level = "success" if result.passed else "error"
+            self._log(level, f"{'✓' if result.passed else '✗'} {name}: {result.rps:.1f} req/s, "
+                             f"{result.error_rate:.1f}% errors, p50 {result.p50_ms:.0f}ms, "
+                             f"p90 {result.p90_ms:.0f}ms, p99 {result.p99_ms:.0f}ms, max {result.max_ms:.0f}ms")
+        
+        self.total_rps = sum(r.requests for r in self.load_results) / elapsed if elapsed else 0.0
+        throughput_ok = self.total_rps >= self.config.load_test_slo_min_rps
+        self.slo_passed = throughput_ok and all(r.passed for r in self.load_results)
+        
+        self._log("info", "=" * 50)
+        if not throughput_ok:
+            self._log("error", f"Throughput {self.total_rps:.1f} req/s below the "
+                               f"{self.config.load_test_slo_min_rps:.1f} req/s SLO")
+        self._log("success" if self.slo_passed else "error",
+                  f"LOAD TEST {'PASSED' if self.slo_passed else 'FAILED'}: {self.total_rps:.1f} req/s")
+        self._log("info", "=" * 50)
+        return self.load_results
 
 
 class ResourceDecommissioner:
     """Handles cleanup/decommissioning of deployed resources."""
     
+    # Attempts per docker call and the first backoff delay in seconds (doubled on each retry)
+    MAX_ATTEMPTS = 3
+    RETRY_DELAY = 1.0
+    # Errors for resources that are already gone
+    GONE_MARKERS = ("No such container", "No such volume", "No such network", "No such image",
+                    "not found")
+    
     def __init__(self, resource_log: DeploymentResourceLog, config: 'DeploymentConfig',
                  log_callback: Callable[[str, str], None] = None):
         self.resource_log = resource_log
@@ -547,7 +841,6 @@ class ResourceDecommissioner:
     def _log(self, msg_type: str, message: str):
         """Log a message."""
         self.log_callback(msg_type, message)
-        self.resource_log.log_event("decommission", message)
     
     def _run_command(self, cmd: str) -> Tuple[bool, str]:
         """Run a shell command."""
@@ -557,98 +850,126 @@ class ResourceDecommissioner:
         except Exception as e:
             return False, str(e)
     
-    def decommission_all(self) -> bool:
-        """Decommission all resources."""
-        self._log("info", "=" * 50)
-        self._log("info", "DECOMMISSIONING RESOURCES")
-        self._log("info", "=" * 50)
-        
-        success = True
-        
-        # Stop and remove containers
-        containers = self.resource_log.get_resources_by_type("container")
-        if containers:
-            self._log("info", "\n--- Stopping Containers ---")
-            for container in containers:
-                if container.status != "deleted":
-                    self._log("info", f"Stopping: {container.name}")
-                    ok, output = self._run_command(f"docker stop {container.name} 2>/dev/null")
-                    if ok:
-                        self._log("success", f"✓ Stopped: {container.name}")
-                    
-                    self._log("info", f"Removing: {container.name}")
-                    ok, output = self._run_command(f"docker rm -f {container.name} 2>/dev/null")
-                    if ok:
-                        self._log("success", f"✓ Removed: {container.name}")
-                        self.resource_log.update_resource_status(container.name, "deleted")
-                    else:
-                        self._log("warning", f"Could not remove: {container.name}")
-                        success = False
-        
-        # Remove volumes
-        volumes = self.resource_log.get_resources_by_type("volume")
-        if volumes:
-            self._log("info", "\n--- Removing Volumes ---")
-            for volume in volumes:
-                if volume.status != "deleted":
-                    self._log("info", f"Removing volume: {volume.name}")
-                    ok, output = self._run_command(f"docker volume rm {volume.name} 2>/dev/null")
-                    if ok:
-                        self._log("success", f"✓ Removed: {volume.name}")
-                        self.resource_log.update_resource_status(volume.name, "deleted")
-                    else:
-                        self._log("warning", f"Could not remove volume: {volume.name}")
-        
-        # Remove networks
-        networks = self.resource_log.get_resources_by_type("network")
-        if networks:
-            self._log("info", "\n--- Removing Networks ---")
-            for network in networks:
-                if network.status != "deleted" and network.name != "bridge":
-                    self._log("info", f"Removing network: {network.name}")
-                    ok, output = self._run_command(f"docker network rm {network.name} 2>/dev/null")
-                    if ok:
-                        self._log("success", f"✓ Removed: {network.name}")
-                        self.resource_log.update_resource_status(network.name, "deleted")
-        
-        # Remove images (optional - they can be reused)
-        images = self.resource_log.get_resources_by_type("image")
-        if images:
-            self._log("info", "\n--- Removing Images ---")
-            for image in images:
-                if image.status != "deleted":
-                    self._log("info", f"Removing image: {image.name}")
-                    ok, output = self._run_command(f"docker rmi {image.name} 2>/dev/null")
-                    if ok:
-                        self._log("success", f"✓ Removed: {image.name}")
-                        self.resource_log.update_resource_status(image.name, "deleted")
-                    else:
-                        self._log("warning", f"Could not remove image (may be in use): {image.name}")
-        
-        # Cloud resources
-        cloud_resources = self.resource_log.get_resources_by_type("cloud_resource")
-        if cloud_resources:
-            self._log("info", "\n--- Decommissioning Cloud Resources ---")
-            for resource in cloud_resources:
-                if resource.status != "deleted":
-                    self._log("info", f"Decommissioning: {resource.name}")
-                    # Cloud-specific cleanup would go here
-                    self.resource_log.update_resource_status(resource.name, "deleted")
-        
+    def _run_with_retry(self, cmd: str) -> Tuple[bool, str]:
+        """Run a command, retrying failures with exponential backoff (not for resources that are gone)."""
+        delay = self.RETRY_DELAY
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            ok, output = self._run_command(cmd)
+            gone = any(marker in output for marker in self.GONE_MARKERS)
+            if ok or gone or attempt == self.MAX_ATTEMPTS:
+                return ok, output
+            time.sleep(delay)
+            delay *= 2
+        return False, ""
+    
+    def _remove_batch(self, command: str, names: List[str]) -> List[str]:
+        """Remove resources with one multi-argument docker call; returns the names that could not be removed.
+        
+        If the batch fails (one bad resource fails the whole call), every
+        resource is retried on its own so only the actual failures remain.
+        A resource that no longer exists counts as removed.
+        """
+        if not names:
+            return []
+        ok, _ = self._run_command(f"{command} {' '.join(names)}")
+        failed = []
+        for name in names:
+            if not ok:
+                removed, output = self._run_with_retry(f"{command} {name}")
+                if not (removed or any(marker in output for marker in self.GONE_MARKERS)):
+                    failed.append(name)
+                    continue
+            self._log("success", f"✓ Removed: {name}")
+            self.resource_log.update_resource_status(name, "deleted")
+        return failed
+    
+    def _pending(self, resource_type: str) -> List[str]:
+        return [resource.name for resource in self.resource_log.get_resources_by_type(resource_type)
+                if resource.status != "deleted"]
+    
+    def _remove_containers(self) -> bool:
+        names = self._pending("container")
+        if not names:
+            return True
+        self._log("info", f"Stopping containers: {', '.join(names)}")
+        self._run_command(f"docker stop {' '.join(names)}")
+        failed = self._remove_batch("docker rm -f", names)
+        for name in failed:
+            self._log("warning", f"Could not remove: {name}")
+        return not failed
+    
+    def _remove_volumes(self) -> bool:
+        names = self._pending("volume")
+        if names:
+            self._log("info", f"Removing volumes: {', '.join(names)}")
+        for name in self._remove_batch("docker volume rm", names):
+            self._log("warning", f"Could not remove volume: {name}")
+        return True
+    
+    def _remove_networks(self) -> bool:
+        names = [name for name in self._pending("network") if name != "bridge"]
+        if names:
+            self._log("info", f"Removing networks: {', '.join(names)}")
+        for name in self._remove_batch("docker network rm", names):
+            self._log("warning", f"Could not remove network: {name}")
+        return True
+    
+    def _remove_images(self) -> bool:
+        # Optional - images can be reused
+        names = self._pending("image")
+        if names:
+            self._log("info", f"Removing images: {', '.join(names)}")
+        for name in self._remove_batch("docker rmi", names):
+            self._log("warning", f"Could not remove image (may be in use): {name}")
+        return True
+    
+    def _remove_cloud_resources(self) -> bool:
+        for name in self._pending("cloud_resource"):
+            self._log("info", f"Decommissioning: {name}")
+            # Cloud-specific cleanup would go here
+            self.resource_log.update_resource_status(name, "deleted")
+        return True
+    
+    def _compose_down(self) -> bool:
         # Use docker-compose down if available
         generated_dir = Path(__file__).parent / "generated"
         compose_file = generated_dir / "docker-compose.yml"
         if compose_file.exists():
-            self._log("info", "\n--- Running docker-compose down ---")
-            ok, output = self._run_command(f"cd {generated_dir} && docker compose down -v 2>/dev/null")
+            self._log("info", "Running docker-compose down")
+            ok, output = self._run_with_retry(f"cd {generated_dir} && docker compose down -v")
             if ok:
                 self._log("success", "✓ docker-compose down completed")
             else:
                 self._log("warning", "docker-compose down had issues")
+        return True
+    
+    def decommission_all(self) -> bool:
+        """Decommission all resources.
+        
+        Each resource class is removed with batched docker calls. Volumes,
+        networks and images wait for the containers using them; cloud
+        resources are independent and are removed alongside.
+        """
+        self._log("info", "=" * 50)
+        self._log("info", "DECOMMISSIONING RESOURCES")
+        self._log("info", "=" * 50)
+        
+        # Failed removals are reported as warnings, so no step blocks the ones after it
+        scheduler = StepScheduler(max_workers=4)
+        scheduler.add("containers", self._remove_containers, required=False)
+        scheduler.add("volumes", self._remove_volumes, ["containers"], required=False)
+        scheduler.add("networks", self._remove_networks, ["containers"], required=False)
+        scheduler.add("images", self._remove_images, ["containers"], required=False)
+        scheduler.add("cloud", self._remove_cloud_resources, required=False)
+        scheduler.add("compose-down", self._compose_down, ["volumes", "networks", "images", "cloud"],
+                      required=False)
+        outcomes = scheduler.run()
+        success = all(outcome.status == "success" for outcome in outcomes.values())
         
         self._log("info", "\n" + "=" * 50)
         self._log("success" if success else "warning", 
                  "DECOMMISSION COMPLETE" if success else "DECOMMISSION COMPLETED WITH WARNINGS")
+        self._log("info", scheduler.report()[-1])
         self._log("info", "=" * 50)
         
         return success
@@ -712,10 +1033,23 @@ class DeploymentConfig:
     seed_master_data: bool = True
     seed_demo_data: bool = False
     seed_zip_codes: bool = False
+    zip_code_countries: str = ""  # Comma-separated country codes, empty = all partitions
     
     # Testing
     run_bvt_tests: bool = False
     run_smoke_tests: bool = True
+    smoke_test_parallelism: int = 8  # checks running at the same time
+    smoke_test_deadline: int = 60  # seconds for the whole smoke test suite
+    smoke_test_samples: int = 1  # requests per check, for latency percentiles
+    
+    # Load Testing
+    run_load_test: bool = False
+    load_test_duration: int = 30  # seconds
+    load_test_concurrency: int = 10  # workers sending requests
+    load_test_target_rps: float = 0  # 0 = closed loop, as fast as the workers get responses
+    load_test_slo_p99_ms: float = 1000
+    load_test_slo_error_rate: float = 1.0  # percent
+    load_test_slo_min_rps: float = 0
     
     # Microservices
     deploy_identity_service: bool = True
@@ -782,6 +1116,10 @@ class DeploymentConfig:
     build_docker_api_cmd: str = "docker build -t crm-api:latest -f docker/Dockerfile.backend ."
     build_docker_frontend_cmd: str = "docker build -t crm-frontend:latest -f docker/Dockerfile.frontend ."
     
+    # Build Concurrency
+    build_parallel: bool = False  # run independent component builds side by side
+    build_max_parallel: int = 2
+    
     # Cloud Build
     github_actions_workflow: str = ".github/workflows/build-deploy.yml"
     azure_devops_org: str = ""
@@ -974,54 +1312,95 @@ class PrerequisiteChecker:
         }
     }
     
+    # Concurrent local probes; remote hosts are checked in a single SSH session
+    MAX_PROBE_WORKERS = 8
+    PROBE_MARKER = "__CRM_PREREQ__"
+    
     def __init__(self, ssh_cmd: str = ""):
         self.ssh_cmd = ssh_cmd
+        self.ssh = SSHConnection.shared(ssh_cmd) if ssh_cmd else None
         self.results: Dict[str, Dict[str, Any]] = {}
         self.is_mac = sys.platform == "darwin"
     
     def _run_command(self, cmd: str, timeout: int = 30) -> Tuple[bool, str]:
         """Run a command and return success status and output."""
         try:
-            if self.ssh_cmd:
-                cmd = f'{self.ssh_cmd} "{cmd}"'
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=timeout
-            )
+            if self.ssh:
+                result = self.ssh.run(cmd, timeout=timeout, idempotent=True)
+            else:
+                result = subprocess.run(
+                    cmd, shell=True, capture_output=True, text=True, timeout=timeout
+                )
             return result.returncode == 0, result.stdout.strip()
         except Exception as e:
             return False, str(e)
     
+    def _build_probe_script(self, names: List[str]) -> str:
+        """Build one shell script that runs every check and frames each result."""
+        lines = []
+        for name in names:
+            lines.append(f'out=$( {{ {self.PREREQUISITES[name]["check_cmd"]} ; }} 2>/dev/null ); rc=$?')
+            lines.append(f"printf '%s %s %s\\n' '{self.PROBE_MARKER}' '{name}' \"$rc\"")
+            lines.append('printf \'%s\\n\' "$out"')
+        return "\n".join(lines) + "\n"
+    
+    def _parse_probe_output(self, output: str) -> Dict[str, Tuple[bool, str]]:
+        """Split framed probe script output into (success, output) per tool."""
+        probes: Dict[str, Tuple[bool, str]] = {}
+        name, returncode, body = None, None, []
+        for line in output.splitlines() + [f"{self.PROBE_MARKER} - -"]:
+            if line.startswith(self.PROBE_MARKER + " "):
+                if name is not None:
+                    probes[name] = (returncode == "0", "\n".join(body).strip())
+                _, name, returncode = line.split(" ", 2)
+                body = []
+            elif name is not None:
+                body.append(line)
+        return probes
+    
+    def _probe_remote(self, names: List[str], timeout: int = 60) -> Dict[str, Tuple[bool, str]]:
+        """Run every check on the remote host in one SSH session."""
+        try:
+            result = self.ssh.run("sh -s", timeout=timeout, input=self._build_probe_script(names), idempotent=True)
+            probes = self._parse_probe_output(result.stdout)
+            error = result.stderr.strip() or f"exit code {result.returncode}"
+        except Exception as e:
+            probes, error = {}, str(e)
+        # Tools missing from the output mean the session itself failed
+        return {name: probes.get(name, (False, error)) for name in names}
+    
+    def _probe(self, names: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """Run the version checks for the given prerequisites concurrently."""
+        if not names:
+            return {}
+        if self.ssh:
+            return self._probe_remote(names)
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PROBE_WORKERS, len(names))) as pool:
+            outcomes = pool.map(lambda name: self._run_command(self.PREREQUISITES[name]["check_cmd"]), names)
+            return dict(zip(names, outcomes))
+    
+    def _make_result(self, name: str, success: bool, output: str) -> Dict[str, Any]:
+        """Build the result entry for one prerequisite."""
+        prereq = self.PREREQUISITES[name]
+        return {
+            "installed": success,
+            "version": output if success else None,
+            "required": prereq["required"],
+            "category": prereq.get("category", "other"),
+            "install_cmd": prereq.get("install_cmd_mac" if self.is_mac else "install_cmd_linux", "")
+        }
+    
     def check_all(self) -> Dict[str, Dict[str, Any]]:
         """Check all prerequisites."""
-        self.results = {}
-        
-        for name, prereq in self.PREREQUISITES.items():
-            success, output = self._run_command(prereq["check_cmd"])
-            install_cmd = prereq.get("install_cmd_mac" if self.is_mac else "install_cmd_linux", "")
-            self.results[name] = {
-                "installed": success,
-                "version": output if success else None,
-                "required": prereq["required"],
-                "category": prereq.get("category", "other"),
-                "install_cmd": install_cmd
-            }
-        
+        probes = self._probe(list(self.PREREQUISITES))
+        self.results = {name: self._make_result(name, *probes[name]) for name in self.PREREQUISITES}
         return self.results
     
     def check_by_category(self, category: str) -> Dict[str, Dict[str, Any]]:
         """Check prerequisites by category."""
-        results = {}
-        for name, prereq in self.PREREQUISITES.items():
-            if prereq.get("category") == category:
-                success, output = self._run_command(prereq["check_cmd"])
-                install_cmd = prereq.get("install_cmd_mac" if self.is_mac else "install_cmd_linux", "")
-                results[name] = {
-                    "installed": success,
-                    "version": output if success else None,
-                    "required": prereq["required"],
-                    "install_cmd": install_cmd
-                }
-        return results
+        names = [name for name, prereq in self.PREREQUISITES.items() if prereq.get("category") == category]
+        probes = self._probe(names)
+        return {name: self._make_result(name, *probes[name]) for name in names}
     
     def install_prerequisite(self, name: str, log_callback: Callable[[str, str], None] = None) -> bool:
         """Install a specific prerequisite."""
@@ -1379,25 +1758,14 @@ class CloudDeployer:
     def __init__(self, config: DeploymentConfig, log_callback: Callable[[str, str], None]):
         self.config = config
         self.log = log_callback
+        self.runner = CommandRunner(log_callback)
     
     def _run_command(self, cmd: str, timeout: int = 300) -> Tuple[bool, str]:
-        """Run a command and return success status and output."""
-        try:
-            self.log("cmd", f"$ {cmd}")
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=timeout
-            )
-            if result.stdout:
-                self.log("output", result.stdout.strip())
-            if result.stderr and result.returncode != 0:
-                self.log("error", result.stderr.strip())
-            return result.returncode == 0, result.stdout + result.stderr
-        except subprocess.TimeoutExpired:
-            self.log("error", f"Command timed out after {timeout}s")
+        """Run a command, streaming its output, and return success status and output."""
+        result = self.runner.run(cmd, timeout=timeout)
+        if result.timed_out:
             return False, "Timeout"
-        except Exception as e:
-            self.log("error", str(e))
-            return False, str(e)
+        return result.success, result.stdout + result.stderr
     
     def check_cli(self) -> bool:
         """Check if cloud CLI is installed."""
@@ -2036,34 +2404,118 @@ class GCPDeployer(CloudDeployer):
 class BuildEngine:
     """Build engine for compiling and creating Docker images."""
     
-    def __init__(self, config: DeploymentConfig, log_callback: Callable[[str, str], None]):
+    # Files each build step reads, relative to the source root (see build_cache.py)
+    FRONTEND_INPUTS = (
+        "CRM.Frontend/src", "CRM.Frontend/public", "CRM.Frontend/package.json",
+        "CRM.Frontend/package-lock.json", "CRM.Frontend/tsconfig.json",
+        "CRM.Frontend/tsconfig.node.json", "CRM.Frontend/craco.config.js",
+    )
+    API_INPUTS = ("CRM.Backend/src", "CRM.Backend/CRM.sln", "CRM.Backend/NuGet.config")
+    DOCKER_API_INPUTS = ("CRM.Backend/src", "CRM.Backend/CRM.sln", "docker/Dockerfile.backend")
+    DOCKER_FRONTEND_INPUTS = FRONTEND_INPUTS + (
+        "docker/Dockerfile.frontend", "docker/nginx-frontend.conf", "version.json",
+    )
+    
+    def __init__(self, config: DeploymentConfig, log_callback: Callable[[str, str], None],
+                 force: bool = False):
         self.config = config
-        self.log = log_callback
         self.is_running = False
+        self.cancelled = False
         self.build_dir = ""
+        # Persistent git mirror the build directory is checked out from (see git_mirror.py)
+        self.mirror: Optional[GitMirror] = None
+        # Messages from a component build running on a worker thread are tagged with its name
+        self._log_callback = log_callback
+        self._channel = threading.local()
+        self.log = self._channel_log
+        self.runner = CommandRunner(self.log)
+        # force ignores the build cache and rebuilds every step
+        self.force = force
+        self.cache = BuildCache()
     
     def _run_command(self, cmd: str, cwd: str = None, timeout: int = 600) -> Tuple[bool, str]:
-        """Run a command and return success status and output."""
+        """Run a command, streaming its output, and return success status and output."""
+        result = self.runner.run(cmd, cwd=cwd, timeout=timeout)
+        if result.timed_out:
+            return False, "Timeout"
+        return result.success, result.stdout + result.stderr
+    
+    def cancel(self):
+        """Stop the running build command and its child processes."""
+        self.is_running = False
+        self.cancelled = True
+        self.runner.cancel()
+    
+    def _channel_log(self, msg_type: str, message: str):
+        channel = getattr(self._channel, "name", "")
+        self._log_callback(msg_type, f"[{channel}] {message}" if channel else message)
+    
+    def _source_root(self) -> Path:
+        return Path(self.build_dir) if self.build_dir else Path.cwd()
+    
+    @staticmethod
+    def _image_tag(cmd: str) -> str:
+        """Image tag from a docker build command (-t option)."""
+        parts = cmd.split()
+        for flag in ("-t", "--tag"):
+            if flag in parts and parts.index(flag) + 1 < len(parts):
+                return parts[parts.index(flag) + 1]
+        return ""
+    
+    def _image_id(self, tag: str) -> str:
+        if not tag:
+            return ""
         try:
-            self.log("cmd", f"$ {cmd}")
             result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, 
-                timeout=timeout, cwd=cwd
+                f"docker image inspect --format {{{{.Id}}}} {tag}", shell=True,
+                capture_output=True, text=True, timeout=30
             )
-            if result.stdout:
-                self.log("output", result.stdout.strip()[:500])  # Truncate long output
-            if result.stderr and result.returncode != 0:
-                self.log("error", result.stderr.strip()[:500])
-            return result.returncode == 0, result.stdout + result.stderr
-        except subprocess.TimeoutExpired:
-            self.log("error", f"Command timed out after {timeout}s")
-            return False, "Timeout"
-        except Exception as e:
-            self.log("error", str(e))
-            return False, str(e)
+            return result.stdout.strip() if result.returncode == 0 else ""
+        except Exception:
+            return ""
+    
+    def _cached_step(self, step: str, label: str, cmd: str, inputs: Tuple[str, ...],
+                     build: Callable[[], bool], artifact: str = "", image: str = "") -> bool:
+        """Run a build step unless its inputs are unchanged since the last successful build.
+        
+        A step is only skipped while its output still exists: the artifact
+        directory for local builds, the same image ID for docker builds. Git
+        builds run in a fresh worktree, so there the artifact is restored from
+        the copy stored with the cache entry.
+        """
+        root = self._source_root()
+        key = fingerprint(root, inputs, extra=cmd)
+        entry = self.cache.get(step)
+        if not self.force and entry and entry.get("key") == key:
+            if image:
+                fresh = bool(entry.get("image_id")) and self._image_id(image) == entry["image_id"]
+            else:
+                # Without a known output there is nothing to check, so always rebuild
+                fresh = bool(artifact) and ((root / artifact).exists()
+                                            or self.cache.restore_artifact(entry, root / artifact))
+            if fresh:
+                self.log("success", f"{label} unchanged, skipping (build cache)")
+                return True
+        
+        if not build():
+            self.cache.invalidate(step)
+            return False
+        details = {}
+        if image:
+            details["image"] = image
+            details["image_id"] = self._image_id(image)
+        elif artifact:
+            details["artifact"] = artifact
+            # The worktree is removed after the build; keep the output for the next one
+            if self.build_dir and (root / artifact).is_dir():
+                stored = self.cache.store_artifact(step, root / artifact)
+                if stored:
+                    details["stored_artifact"] = stored
+        self.cache.record(step, key, **details)
+        return True
     
     def clone_repository(self) -> bool:
-        """Clone or pull the git repository."""
+        """Fetch the branch into the cached git mirror and check it out into a build directory."""
         if self.config.build_source != "git":
             self.log("info", "Using local source code")
             return True
@@ -2075,40 +2527,40 @@ class BuildEngine:
             self.log("error", "Git repository URL not configured")
             return False
         
-        self.log("info", f"Cloning repository: {repo_url}")
+        self.log("info", f"Fetching repository: {repo_url}")
         self.log("info", f"Branch: {branch}")
         
-        # Create build directory
-        self.build_dir = f"/tmp/crm-build-{secrets.token_hex(4)}"
-        
         # Construct git URL with authentication
+        env_prefix = ""
+        fetch_url = repo_url
         if self.config.git_use_ssh:
             # Use SSH key
             if self.config.git_ssh_key:
-                git_cmd = f"GIT_SSH_COMMAND='ssh -i {self.config.git_ssh_key} -o StrictHostKeyChecking=no'"
-            else:
-                git_cmd = ""
-            clone_cmd = f"{git_cmd} git clone --branch {branch} --single-branch {repo_url} {self.build_dir}"
-        else:
-            # Use HTTPS with token
-            if self.config.git_token and self.config.git_username:
-                # Insert credentials into URL
-                if "github.com" in repo_url:
-                    auth_url = repo_url.replace("https://", f"https://{self.config.git_username}:{self.config.git_token}@")
-                elif "dev.azure.com" in repo_url:
-                    auth_url = repo_url.replace("https://", f"https://{self.config.git_username}:{self.config.git_token}@")
-                else:
-                    auth_url = repo_url.replace("https://", f"https://{self.config.git_username}:{self.config.git_token}@")
-                clone_cmd = f"git clone --branch {branch} --single-branch {auth_url} {self.build_dir}"
-            else:
-                clone_cmd = f"git clone --branch {branch} --single-branch {repo_url} {self.build_dir}"
+                env_prefix = f"GIT_SSH_COMMAND='ssh -i {self.config.git_ssh_key} -o StrictHostKeyChecking=no'"
+        elif self.config.git_token and self.config.git_username:
+            # Use HTTPS with token; the credentials are only passed to fetch, never stored in the mirror
+            fetch_url = repo_url.replace("https://", f"https://{self.config.git_username}:{self.config.git_token}@")
+        
+        def run_git(cmd: str, timeout: int = 600) -> Tuple[bool, str]:
+            shown = cmd.replace(self.config.git_token, "***") if self.config.git_token else cmd
+            result = self.runner.run(cmd, timeout=timeout, log_command=shown)
+            return result.success, result.stdout + result.stderr
+        
+        self.mirror = GitMirror(fetch_url, env_prefix=env_prefix, run_command=run_git)
+        success, _ = self.mirror.update(branch)
+        if not success:
+            self.log("error", "Failed to fetch repository")
+            return False
         
-        success, _ = self._run_command(clone_cmd)
+        # Check out a worktree from the mirror into a new build directory
+        self.build_dir = f"/tmp/crm-build-{secrets.token_hex(4)}"
+        commit = self.mirror.revision(f"refs/heads/{branch}")
+        success, _ = self.mirror.add_worktree(self.build_dir, commit)
         
         if success:
-            self.log("success", f"Repository cloned to {self.build_dir}")
+            self.log("success", f"Repository checked out to {self.build_dir} at {commit[:12]}")
         else:
-            self.log("error", "Failed to clone repository")
+            self.log("error", "Failed to check out repository")
         
         return success
     
@@ -2119,14 +2571,16 @@ class BuildEngine:
         cwd = self.build_dir if self.build_dir else None
         cmd = self.config.build_frontend_cmd
         
-        success, _ = self._run_command(cmd, cwd=cwd, timeout=300)
-        
-        if success:
-            self.log("success", "Frontend build complete")
-        else:
-            self.log("error", "Frontend build failed")
+        def build() -> bool:
+            success, _ = self._run_command(cmd, cwd=cwd, timeout=300)
+            if success:
+                self.log("success", "Frontend build complete")
+            else:
+                self.log("error", "Frontend build failed")
+            return success
         
-        return success
+        return self._cached_step("frontend", "Frontend", cmd, self.FRONTEND_INPUTS, build,
+                                 artifact="CRM.Frontend/build")
     
     def build_api(self) -> bool:
         """Build the API application."""
@@ -2135,45 +2589,146 @@ class BuildEngine:
         cwd = self.build_dir if self.build_dir else None
         cmd = self.config.build_api_cmd
         
-        success, _ = self._run_command(cmd, cwd=cwd, timeout=300)
-        
-        if success:
-            self.log("success", "API build complete")
-        else:
-            self.log("error", "API build failed")
+        def build() -> bool:
+            success, _ = self._run_command(cmd, cwd=cwd, timeout=300)
+            if success:
+                self.log("success", "API build complete")
+            else:
+                self.log("error", "API build failed")
+            return success
         
-        return success
+        return self._cached_step("api", "API", cmd, self.API_INPUTS, build,
+                                 artifact="CRM.Backend/publish")
     
-    def build_docker_images(self) -> bool:
-        """Build Docker images."""
-        self.log("info", "Building Docker images...")
+    def build_docker_api_image(self) -> bool:
+        """Build the API Docker image."""
+        self.log("info", "Building API Docker image...")
         
         cwd = self.build_dir if self.build_dir else None
+        cmd = self.config.build_docker_api_cmd
+        image = self._image_tag(cmd)
         
-        # Build API image
-        if self.config.deploy_api:
-            self.log("info", "Building API Docker image...")
-            success, _ = self._run_command(self.config.build_docker_api_cmd, cwd=cwd)
+        def build() -> bool:
+            success, _ = self._run_command(cmd, cwd=cwd)
             if not success:
                 self.log("error", "API Docker build failed")
                 return False
-            self.log("success", "API Docker image built: crm-api:latest")
+            self.log("success", f"API Docker image built: {image}")
+            return True
         
-        # Build Frontend image
-        if self.config.deploy_frontend:
-            self.log("info", "Building Frontend Docker image...")
-            success, _ = self._run_command(self.config.build_docker_frontend_cmd, cwd=cwd)
+        return self._cached_step("docker-api", "API Docker image", cmd, self.DOCKER_API_INPUTS,
+                                 build, image=image)
+    
+    def build_docker_frontend_image(self) -> bool:
+        """Build the frontend Docker image."""
+        self.log("info", "Building Frontend Docker image...")
+        
+        cwd = self.build_dir if self.build_dir else None
+        cmd = self.config.build_docker_frontend_cmd
+        image = self._image_tag(cmd)
+        
+        def build() -> bool:
+            success, _ = self._run_command(cmd, cwd=cwd)
             if not success:
                 self.log("error", "Frontend Docker build failed")
                 return False
-            self.log("success", "Frontend Docker image built: crm-frontend:latest")
+            self.log("success", f"Frontend Docker image built: {image}")
+            return True
         
-        return True
+        return self._cached_step("docker-frontend", "Frontend Docker image", cmd,
+                                 self.DOCKER_FRONTEND_INPUTS, build, image=image)
+    
+    def build_docker_images(self) -> bool:
+        """Build Docker images."""
+        self.log("info", "Building Docker images...")
+        return self.build_components(self.docker_components())
+    
+    def local_components(self) -> List[Tuple[str, Callable[[], bool]]]:
+        """Frontend and API builds for the enabled components."""
+        components = []
+        if self.config.deploy_frontend:
+            components.append(("frontend", self.build_frontend))
+        if self.config.deploy_api:
+            components.append(("api", self.build_api))
+        return components
+    
+    def docker_components(self) -> List[Tuple[str, Callable[[], bool]]]:
+        """Docker image builds for the enabled components."""
+        components = []
+        if self.config.deploy_api:
+            components.append(("docker-api", self.build_docker_api_image))
+        if self.config.deploy_frontend:
+            components.append(("docker-frontend", self.build_docker_frontend_image))
+        return components
+    
+    def build_components(self, components: List[Tuple[str, Callable[[], bool]]],
+                         depends_on: Optional[Dict[str, Tuple[str, ...]]] = None) -> bool:
+        """Run component builds, side by side when config.build_parallel is set.
+        
+        Components are run in list order, or in parallel as far as depends_on
+        (component name -> names it waits for) allows. In parallel mode at most
+        config.build_max_parallel builds run at once and each logs on its own
+        channel ("[frontend] ..."). The first failure terminates the commands
+        of the other running builds and skips those that have not started.
+        """
+        if not self.config.build_parallel or len(components) < 2:
+            for _, build in components:
+                if not build():
+                    return False
+            return True
+        
+        failed = threading.Event()
+        
+        def on_status(name: str, outcome):
+            if outcome.status == "failed" and not failed.is_set():
+                failed.set()
+                self.log("error", f"{name} build failed, cancelling the other builds")
+                self.runner.cancel()
+        
+        def on_channel(name: str, build: Callable[[], bool]) -> Callable[[], bool]:
+            def run() -> bool:
+                self._channel.name = name
+                try:
+                    return build()
+                finally:
+                    self._channel.name = ""
+            return run
+        
+        scheduler = StepScheduler(max_workers=max(1, self.config.build_max_parallel),
+                                  on_status=on_status,
+                                  should_continue=lambda: not failed.is_set() and not self.runner.is_cancelled)
+        depends_on = depends_on or {}
+        for name, build in components:
+            scheduler.add(name, on_channel(name, build), depends_on=depends_on.get(name, ()))
+        scheduler.run()
+        if failed.is_set() and not self.cancelled:
+            # Sibling builds were cancelled by us, not by the user: allow later commands again
+            self.runner.reset()
+        
+        for line in scheduler.report():
+            self.log("info", line)
+        return all(outcome.status == "success" for outcome in scheduler.outcomes.values())
+    
+    def build_all(self) -> bool:
+        """Clone (for git sources) and build every enabled component."""
+        if not self.clone_repository():
+            return False
+        local = self.local_components()
+        docker = self.docker_components()
+        # docker build reads the source tree the local builds write into (node_modules,
+        # build, bin, obj), so the image builds wait for every local build
+        local_names = tuple(name for name, _ in local)
+        success = self.build_components(local + docker, {name: local_names for name, _ in docker})
+        self.cleanup()
+        return success
     
     def cleanup(self):
         """Clean up build directory."""
         if self.build_dir and self.build_dir.startswith("/tmp/"):
-            self._run_command(f"rm -rf {self.build_dir}")
+            if self.mirror:
+                self.mirror.remove_worktree(self.build_dir)
+            else:
+                self._run_command(f"rm -rf {self.build_dir}")
             self.log("info", f"Cleaned up build directory: {self.build_dir}")
 
 
@@ -2183,22 +2738,12 @@ class CloudBuildEngine:
     def __init__(self, config: DeploymentConfig, log_callback: Callable[[str, str], None]):
         self.config = config
         self.log = log_callback
+        self.runner = CommandRunner(log_callback)
     
     def _run_command(self, cmd: str, timeout: int = 300) -> Tuple[bool, str]:
-        """Run a command and return success status and output."""
-        try:
-            self.log("cmd", f"$ {cmd}")
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=timeout
-            )
-            if result.stdout:
-                self.log("output", result.stdout.strip())
-            if result.stderr and result.returncode != 0:
-                self.log("error", result.stderr.strip())
-            return result.returncode == 0, result.stdout + result.stderr
-        except Exception as e:
-            self.log("error", str(e))
-            return False, str(e)
+        """Run a command, streaming its output, and return success status and output."""
+        result = self.runner.run(cmd, timeout=timeout)
+        return result.success, result.stdout + result.stderr
     
     def trigger_github_actions(self) -> bool:
         """Trigger GitHub Actions workflow."""
@@ -2583,6 +3128,8 @@ class DeploymentEngine:
         self.config = config
         self.log = log_callback
         self.ssh_cmd = ""
+        self.ssh: Optional[SSHConnection] = None
+        self.runner = CommandRunner(log_callback)
         self.is_running = False
         self.is_paused = False
         
@@ -2591,31 +3138,35 @@ class DeploymentEngine:
                 self.ssh_cmd = f"ssh -i {config.build_server_ssh_key} {config.build_server_user}@{config.build_server_host}"
             else:
                 self.ssh_cmd = f"ssh {config.build_server_user}@{config.build_server_host}"
-    
-    def _run_command(self, cmd: str, timeout: int = 300) -> Tuple[bool, str]:
-        """Run a command on the build server."""
-        try:
-            if self.ssh_cmd:
-                cmd = f'{self.ssh_cmd} "{cmd}"'
-            
-            self.log("cmd", f"$ {cmd}")
-            
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=timeout
-            )
-            
-            if result.stdout:
-                self.log("output", result.stdout.strip())
-            if result.stderr and result.returncode != 0:
-                self.log("error", result.stderr.strip())
-            
-            return result.returncode == 0, result.stdout + result.stderr
-        except subprocess.TimeoutExpired:
-            self.log("error", f"Command timed out after {timeout}s")
+            # One multiplexed connection for every remote command of this deployment
+            self.ssh = SSHConnection.shared(self.ssh_cmd)
+    
+    def _run_command(self, cmd: str, timeout: int = 300, idempotent: bool = False) -> Tuple[bool, str]:
+        """Run a command on the build server, streaming its output.
+        
+        When the SSH connection drops, it is re-established; only an idempotent
+        command is retried, as any other may already have run (see SSHConnection.run).
+        """
+        if self.ssh:
+            self.ssh.ensure_connected()
+            result = self.runner.run(self.ssh.wrap(cmd), timeout=timeout, log_command=f'{self.ssh_cmd} "{cmd}"')
+            if not result.cancelled and self.ssh.reconnect_after(result.returncode):
+                if idempotent:
+                    self.log("warning", "SSH connection lost, reconnected; retrying the command")
+                    result = self.runner.run(self.ssh.wrap(cmd), timeout=timeout,
+                                             log_command=f'{self.ssh_cmd} "{cmd}"')
+                else:
+                    self.log("warning", "SSH connection lost and re-established; the command may not have completed")
+        else:
+            result = self.runner.run(cmd, timeout=timeout)
+        if result.timed_out:
             return False, "Timeout"
-        except Exception as e:
-            self.log("error", str(e))
-            return False, str(e)
+        return result.success, result.stdout + result.stderr
+    
+    def cancel(self):
+        """Stop the deployment and the command that is currently running."""
+        self.is_running = False
+        self.runner.cancel()
     
     def _wait_if_paused(self):
         """Wait if deployment is paused."""
@@ -2837,7 +3388,7 @@ volumes:
         network_name = NAMING_CONVENTIONS["network_name"]
         self.log("info", f"Creating Docker network: {network_name}")
         
-        self._run_command(f"docker network create {network_name} 2>/dev/null || true")
+        self._run_command(f"docker network create {network_name} 2>/dev/null || true", idempotent=True)
         return True
     
     def deploy_master_data(self) -> bool:
@@ -2864,6 +3415,75 @@ volumes:
         self.log("success", "Master data deployed successfully")
         return True
     
+    def select_zip_code_partitions(self, partitions_dir: Path = ZIP_CODE_PARTITIONS_DIR) -> List[Path]:
+        """Select the ZIP code partition files for the configured countries."""
+        manifest_path = partitions_dir / "manifest.json"
+        if not manifest_path.exists():
+            self.log("warning", f"ZIP code manifest not found: {manifest_path}")
+            return []
+        
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        
+        if manifest.get("format") != "sql":
+            self.log("warning", f"Unsupported ZIP code partition format: {manifest.get('format')}")
+            return []
+        
+        countries = {c.strip().upper() for c in self.config.zip_code_countries.split(",") if c.strip()}
+        selected = []
+        for partition in manifest.get("partitions", []):
+            if countries and partition["country_code"] not in countries:
+                continue
+            selected.append(partitions_dir / partition["file"])
+        
+        missing = countries - {p["country_code"] for p in manifest.get("partitions", [])}
+        if missing:
+            self.log("warning", f"No ZIP code partitions for: {', '.join(sorted(missing))}")
+        
+        return selected
+    
+    def deploy_zip_codes(self) -> bool:
+        """Load the selected ZIP code partitions into the database."""
+        if not self.config.seed_zip_codes:
+            self.log("info", "Skipping ZIP code data (disabled)")
+            return True
+        
+        partitions = self.select_zip_code_partitions()
+        if not partitions:
+            self.log("warning", "No ZIP code partitions selected")
+            return True
+        
+        db_container = NAMING_CONVENTIONS["service_names"]["database"]
+        self.log("info", f"Loading {len(partitions)} ZIP code partition(s)...")
+        
+        # Compressed partitions are piped through the decompressor into the client
+        readers = {".gz": "gzip -dc", ".zst": "zstd -dc"}
+        
+        def load_command(partition: Path, password: str) -> str:
+            # The partitions are local files: read them here and stream them into the
+            # client, through SSH when the database runs on the build server
+            client = f"docker exec -i {db_container} mysql -u root -p{password} {self.config.database_name}"
+            if self.ssh:
+                client = self.ssh.wrap(client)
+            reader = readers.get(partition.suffix, "cat")
+            # pipefail: a failing reader must fail the load, not only a failing client
+            return "bash -c " + shlex.quote(f"set -o pipefail; {reader} {shlex.quote(str(partition))} | {client}")
+        
+        if self.ssh:
+            self.ssh.ensure_connected()
+        for partition in partitions:
+            self.log("info", f"  Applying {partition.name}...")
+            result = self.runner.run(
+                load_command(partition, self.config.database_root_password), timeout=1800,
+                log_command=load_command(partition, "********")
+            )
+            if not result.success:
+                self.log("error", f"Failed to load {partition.name}" + (" (timeout)" if result.timed_out else ""))
+                return False
+        
+        self.log("success", "ZIP code data deployed successfully")
+        return True
+    
     def run_smoke_tests(self) -> List[TestResult]:
         """Run smoke tests."""
         results = []
@@ -2884,16 +3504,15 @@ volumes:
             ("Frontend Load", f"{protocol}://{domain}:{frontend_port}"),
         ]
         
-        # Create SSL context that doesn't verify certificates (for self-signed certs)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        # Pooled keep-alive connections; certificates are not verified (self-signed certs)
+        http = HTTPClient.shared()
         
         for test_name, url in tests:
             start_time = time.time()
             try:
-                req = urllib.request.Request(url, headers={"User-Agent": "CRM-Deploy-Tool"})
-                response = urllib.request.urlopen(req, timeout=10, context=ssl_context)
+                response = http.request(url, timeout=10)
+                if not response.ok:
+                    raise Exception(f"HTTP Error {response.status}: {response.reason}")
                 duration = int((time.time() - start_time) * 1000)
                 
                 if response.status == 200:
@@ -2941,18 +3560,14 @@ volumes:
         api_port = self.config.api_port
         protocol = "https" if self.config.ssl_enabled else "http"
         
-        # Create SSL context that doesn't verify certificates (for self-signed certs)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
         try:
             bvt_url = f"{protocol}://{domain}:{api_port}/api/monitoring/bvt"
-            req = urllib.request.Request(bvt_url, headers={"User-Agent": "CRM-Deploy-Tool"})
-            response = urllib.request.urlopen(req, timeout=60, context=ssl_context)
+            response = HTTPClient.shared().request(bvt_url, timeout=60)
+            if not response.ok:
+                raise Exception(f"HTTP Error {response.status}: {response.reason}")
             
             if response.status == 200:
-                bvt_data = json.loads(response.read().decode('utf-8'))
+                bvt_data = json.loads(response.body.decode('utf-8'))
                 for test in bvt_data.get("tests", []):
                     results.append(TestResult(
                         name=test.get("name", "Unknown"),
@@ -3267,7 +3882,12 @@ your network and system speed.
         # Configuration
         self.config = DeploymentConfig()
         self.config_path = Path(__file__).parent / "config" / "deployment_config.json"
-        self.log_queue = queue.Queue()
+        # Activity log shared with the deployment session log; entries beyond its
+        # capacity are moved to a file under generated/logs
+        self.log_store = LogStore(spill_path=Path(__file__).parent / "generated" / "logs" /
+                                  f"activity-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl")
+        self._log_cursor = 0
+        self.errors_only_var = tk.BooleanVar(value=False)
         self.deployment_thread: Optional[threading.Thread] = None
         self.engine: Optional[DeploymentEngine] = None
         
@@ -3277,8 +3897,9 @@ your network and system speed.
         self.wizard_log: List[Dict] = []  # Log all wizard actions
         
         # Resource tracking and test mode
-        self.resource_log = DeploymentResourceLog()
+        self.resource_log = DeploymentResourceLog(self.log_store)
         self.is_test_mode = tk.BooleanVar(value=False)
+        self.run_load_test_var = tk.BooleanVar(value=False)
         self.summary_path: Optional[Path] = None
         
         # DEPLOYMENT TARGET - Primary selection that drives everything else
@@ -3419,28 +4040,61 @@ your network and system speed.
             log_msg += f": {value}"
         self.log_message("info", log_msg)
     
+    # Lines kept in the log panel; older ones stay in the log store
+    LOG_PANEL_LINES = 2000
+    
     def log_message(self, msg_type: str, message: str):
-        """Queue a log message."""
-        self.log_queue.put((msg_type, message))
+        """Add a message to the activity log; safe to call from any thread."""
+        self.log_store.append(msg_type, message)
     
     def process_logs(self):
-        """Process queued log messages."""
-        try:
-            while True:
-                msg_type, message = self.log_queue.get_nowait()
-                self._write_log(msg_type, message)
-        except queue.Empty:
-            pass
+        """Write log entries added since the last call to the log panel."""
+        entries = self.log_store.after(self._log_cursor)
+        if entries:
+            self._log_cursor = entries[-1].seq
+            if self.errors_only_var.get():
+                entries = [entry for entry in entries if entry.level == "error"]
+            else:
+                entries = [entry for entry in entries
+                           if not entry.level.startswith(DeploymentResourceLog.EVENT_PREFIX)]
+            for entry in entries[-self.LOG_PANEL_LINES:]:
+                self._write_log(entry.level, entry.message, entry.timestamp)
+            self._trim_log_panel()
         self.root.after(100, self.process_logs)
     
-    def _write_log(self, msg_type: str, message: str):
+    def _trim_log_panel(self):
+        if not hasattr(self, 'log_text'):
+            return
+        excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - self.LOG_PANEL_LINES
+        if excess > 0:
+            self.log_text.configure(state=tk.NORMAL)
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+            self.log_text.configure(state=tk.DISABLED)
+    
+    def _refill_log_panel(self):
+        """Redraw the log panel from the store, e.g. after toggling "Errors only"."""
+        if not hasattr(self, 'log_text'):
+            return
+        self.log_text.configure(state=tk.NORMAL)
+        self.log_text.delete('1.0', tk.END)
+        self.log_text.configure(state=tk.DISABLED)
+        if self.errors_only_var.get():
+            entries = self.log_store.by_level("error")
+        else:
+            entries = [entry for entry in self.log_store.after(self.log_store.last_seq - self.LOG_PANEL_LINES)
+                       if not entry.level.startswith(DeploymentResourceLog.EVENT_PREFIX)]
+        for entry in entries[-self.LOG_PANEL_LINES:]:
+            self._write_log(entry.level, entry.message, entry.timestamp)
+        self._log_cursor = self.log_store.last_seq
+    
+    def _write_log(self, msg_type: str, message: str, when: Optional[datetime] = None):
         """Write message to log panel."""
         if not hasattr(self, 'log_text'):
             return
         
         self.log_text.configure(state=tk.NORMAL)
         
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = (when or datetime.now()).strftime("%H:%M:%S")
         
         # Color coding
         tag = msg_type
@@ -3532,7 +4186,9 @@ your network and system speed.
         log_header = ttk.Frame(right_frame)
         log_header.pack(fill=tk.X, pady=(0, 8))
         ttk.Label(log_header, text="📋 Activity Log", 
-                 font=self.UI_CONFIG["heading_font"]).pack(anchor=tk.W)
+                 font=self.UI_CONFIG["heading_font"]).pack(side=tk.LEFT)
+        ttk.Checkbutton(log_header, text="Errors only", variable=self.errors_only_var,
+                        command=self._refill_log_panel).pack(side=tk.RIGHT)
         
         # Create log frame with better styling
         log_frame = ttk.Frame(right_frame)
@@ -5484,6 +6140,10 @@ Click 'Next' to begin!"""
             tk.Label(test_desc, text=step, font=("Helvetica", 11), 
                     fg="#555", bg="#fff3e0").pack(anchor=tk.W, padx=20)
         
+        tk.Checkbutton(test_card, text="Also run a load test against the SLOs (results in the summary)",
+                      variable=self.run_load_test_var, font=("Helvetica", 11),
+                      bg="#fff3e0").pack(anchor=tk.W, padx=20)
+        
         test_btn_frame = tk.Frame(test_card, bg="#fff3e0")
         test_btn_frame.pack(fill=tk.X, pady=(15, 0))
         
@@ -5512,7 +6172,7 @@ Click 'Next' to begin!"""
     def _start_test_deployment(self):
         """Start a test deployment with smoke tests and decommissioning."""
         self.is_test_mode.set(True)
-        self.resource_log = DeploymentResourceLog()  # Fresh log
+        self.resource_log = DeploymentResourceLog(self.log_store)  # Fresh session
         self.resource_log.log_event("test_mode_start", "Test deployment initiated")
         self.log_wizard_action("test_deployment_start", "Test deployment initiated")
         
@@ -5602,10 +6262,10 @@ Click 'Next' to begin!"""
         self.is_test_mode.set(test_mode)
         
         if test_mode:
-            self.resource_log = DeploymentResourceLog()
+            self.resource_log = DeploymentResourceLog(self.log_store)
             self.resource_log.log_event("deployment_start", "Test deployment initiated")
         else:
-            self.resource_log = DeploymentResourceLog()
+            self.resource_log = DeploymentResourceLog(self.log_store)
             self.resource_log.log_event("deployment_start", "Production deployment initiated")
         
         self.log_wizard_action("deployment_start", f"{'Test' if test_mode else 'Production'} deployment initiated")
@@ -5625,44 +6285,58 @@ Click 'Next' to begin!"""
         config = self._get_current_config()
         
         def log_callback(msg_type: str, message: str):
+            # The activity log is the session log's store, so this also records the event
             self.log_message(msg_type, message)
-            self.resource_log.log_event(msg_type, message)
             self.root.after(0, lambda: self.deploy_status_var.set(message[:60] + "..." if len(message) > 60 else message))
         
         def do_deploy():
             try:
                 total_steps = 7 if test_mode else 5
                 
-                # Step 1: Generate scripts
-                self.root.after(0, lambda: self.deploy_step_var.set(f"Step 1/{total_steps}: Generating deployment scripts..."))
-                log_callback("info", "=== Generating Deployment Scripts ===")
-                
                 output_dir = Path(__file__).parent / "generated"
                 output_dir.mkdir(parents=True, exist_ok=True)
                 
-                # Generate docker-compose or kubernetes files
-                if config.hosting_platform == "docker":
-                    self._generate_docker_compose_with_logging(config, output_dir, log_callback)
-                elif config.hosting_platform == "kubernetes":
-                    self._generate_kubernetes(config, output_dir, log_callback)
-                elif config.hosting_platform == "cloud":
-                    self._generate_cloud_scripts(config, output_dir, log_callback)
-                
-                log_callback("success", "✓ Deployment scripts generated")
-                
-                # Step 2: Check prerequisites
-                self.root.after(0, lambda: self.deploy_step_var.set(f"Step 2/{total_steps}: Checking prerequisites..."))
-                log_callback("info", "=== Checking Prerequisites ===")
+                # Step 1: Generate scripts
+                def generate_scripts():
+                    log_callback("info", "=== Generating Deployment Scripts ===")
+                    
+                    # Generate docker-compose or kubernetes files
+                    if config.hosting_platform == "docker":
+                        self._generate_docker_compose_with_logging(config, output_dir, log_callback)
+                    elif config.hosting_platform == "kubernetes":
+                        self._generate_kubernetes(config, output_dir, log_callback)
+                    elif config.hosting_platform == "cloud":
+                        self._generate_cloud_scripts(config, output_dir, log_callback)
+                    
+                    log_callback("success", "✓ Deployment scripts generated")
+                    return True
                 
-                checker = PrerequisiteChecker()
-                prereqs = checker.check_all()
-                missing = [p for p in prereqs if not p["installed"]]
+                # Step 2: Check prerequisites (independent of step 1, so both run at once)
+                def check_prerequisites():
+                    log_callback("info", "=== Checking Prerequisites ===")
+                    
+                    checker = PrerequisiteChecker()
+                    prereqs = checker.check_all()
+                    missing = [name for name, result in prereqs.items() if not result["installed"]]
+                    
+                    if missing:
+                        for name in missing:
+                            log_callback("warning", f"Missing: {name}")
+                    else:
+                        log_callback("success", "✓ All prerequisites satisfied")
+                    return True
                 
-                if missing:
-                    for p in missing:
-                        log_callback("warning", f"Missing: {p['name']}")
-                else:
-                    log_callback("success", "✓ All prerequisites satisfied")
+                self.root.after(0, lambda: self.deploy_step_var.set(
+                    f"Steps 1-2/{total_steps}: Generating scripts and checking prerequisites..."))
+                scheduler = StepScheduler()
+                scheduler.add("Generate scripts", generate_scripts)
+                scheduler.add("Prerequisites", check_prerequisites)
+                scheduler.run()
+                for line in scheduler.report():
+                    log_callback("info", line)
+                generate_outcome = scheduler.outcomes["Generate scripts"]
+                if generate_outcome.error:
+                    raise RuntimeError(generate_outcome.error)
                 
                 # Step 3: Build (if local)
                 if config.build_type == "local":
@@ -5714,6 +6388,12 @@ Click 'Next' to begin!"""
                 else:
                     log_callback("warning", f"✗ Frontend not responding: {frontend_url}")
                 
+                # Optional load test; its results and SLO verdict go into the summary
+                if config.run_load_test:
+                    log_callback("info", "=== Running Load Test ===")
+                    load_runner = LoadTestRunner(config, self.resource_log, log_callback)
+                    load_runner.run_load_test()
+                
                 # Test mode: Run smoke tests and decommission
                 if test_mode:
                     # Step 6: Smoke tests
@@ -5761,7 +6441,6 @@ Click 'Next' to begin!"""
                 
             except Exception as e:
                 log_callback("error", f"Deployment failed: {str(e)}")
-                self.resource_log.log_event("error", str(e))
                 self.root.after(0, lambda: self._deployment_failed(str(e)))
         
         threading.Thread(target=do_deploy, daemon=True).start()
@@ -5965,13 +6644,7 @@ Click 'Open Summary' to view the detailed report.
     def _check_endpoint(self, url: str) -> bool:
         """Check if endpoint is healthy."""
         try:
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            request = urllib.request.Request(url, method='GET')
-            with urllib.request.urlopen(request, timeout=10, context=ctx) as response:
-                return response.status < 400
+            return HTTPClient.shared().request(url, timeout=10).ok
         except:
             return False
     
@@ -6252,6 +6925,7 @@ echo "✅ GCP deployment complete"
             redis_port=self.redis_port_var.get(),
             domain=self.domain_var.get(),
             ssl_enabled=self.ssl_var.get(),
+            run_load_test=self.run_load_test_var.get(),
             ssl_cert_path=self.ssl_cert_var.get(),
             ssl_key_path=self.ssl_key_var.get(),
             admin_username=self.admin_user_var.get(),
@@ -6338,7 +7012,8 @@ class DeploymentTool:
         # Configuration
         self.config = DeploymentConfig()
         self.config_path = Path(__file__).parent / "config" / "deployment_config.json"
-        self.log_queue = queue.Queue()
+        self.log_store = LogStore()
+        self._log_cursor = 0
         self.test_results: List[TestResult] = []
         self.deployment_thread: Optional[threading.Thread] = None
         self.engine: Optional[DeploymentEngine] = None
@@ -6604,6 +7279,17 @@ class DeploymentTool:
         ttk.Button(actions_frame2, text="📄 Generate CI/CD Config", 
                    command=self.generate_cicd_config).pack(side=tk.LEFT, padx=5)
         
+        self.build_force_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(actions_frame2, text="Force rebuild (ignore build cache)",
+                        variable=self.build_force_var).pack(side=tk.LEFT, padx=10)
+        
+        self.build_parallel_var = tk.BooleanVar(value=self.config.build_parallel)
+        ttk.Checkbutton(actions_frame2, text="Parallel builds, max:",
+                        variable=self.build_parallel_var).pack(side=tk.LEFT, padx=(10, 0))
+        self.build_max_parallel_var = tk.IntVar(value=self.config.build_max_parallel)
+        ttk.Spinbox(actions_frame2, from_=1, to=8, width=3,
+                    textvariable=self.build_max_parallel_var).pack(side=tk.LEFT, padx=5)
+        
         self.build_status_var = tk.StringVar(value="")
         ttk.Label(actions_frame2, textvariable=self.build_status_var).pack(side=tk.LEFT, padx=10)
         
@@ -6680,7 +7366,7 @@ class DeploymentTool:
     def run_local_build(self):
         """Run local build."""
         config = self.get_current_config()
-        build_engine = BuildEngine(config, self.log_message)
+        build_engine = BuildEngine(config, self.log_message, force=self.build_force_var.get())
         
         def do_build():
             self.build_status_var.set("Building...")
@@ -6692,15 +7378,9 @@ class DeploymentTool:
                     return
             
             # Build frontend and API
-            if config.deploy_frontend:
-                if not build_engine.build_frontend():
-                    self.build_status_var.set("✗ Frontend build failed")
-                    return
-            
-            if config.deploy_api:
-                if not build_engine.build_api():
-                    self.build_status_var.set("✗ API build failed")
-                    return
+            if not build_engine.build_components(build_engine.local_components()):
+                self.build_status_var.set("✗ Build failed")
+                return
             
             self.build_status_var.set("✓ Build complete")
             build_engine.cleanup()
@@ -6710,7 +7390,7 @@ class DeploymentTool:
     def run_docker_build(self):
         """Build Docker images."""
         config = self.get_current_config()
-        build_engine = BuildEngine(config, self.log_message)
+        build_engine = BuildEngine(config, self.log_message, force=self.build_force_var.get())
         
         def do_build():
             self.build_status_var.set("Building Docker images...")
@@ -7902,8 +8582,14 @@ class DeploymentTool:
         ref_frame.pack(fill=tk.X, pady=(0, 15))
         
         self.seed_zip_var = tk.BooleanVar(value=self.config.seed_zip_codes)
-        ttk.Checkbutton(ref_frame, text="US Zip Codes Database", 
+        ttk.Checkbutton(ref_frame, text="Zip Codes Database", 
                         variable=self.seed_zip_var).pack(anchor=tk.W, pady=3)
+        
+        zip_countries_row = ttk.Frame(ref_frame)
+        zip_countries_row.pack(fill=tk.X, pady=3)
+        ttk.Label(zip_countries_row, text="Countries (e.g. US,CA,GB; empty = all):").pack(side=tk.LEFT)
+        self.zip_countries_var = tk.StringVar(value=self.config.zip_code_countries)
+        ttk.Entry(zip_countries_row, textvariable=self.zip_countries_var, width=30).pack(side=tk.LEFT, padx=10)
     
     def create_testing_tab(self):
         """Create testing configuration tab."""
@@ -8136,6 +8822,7 @@ class DeploymentTool:
             seed_master_data=True,
             seed_demo_data=self.seed_demo_var.get(),
             seed_zip_codes=self.seed_zip_var.get(),
+            zip_code_countries=self.zip_countries_var.get(),
             run_bvt_tests=self.run_bvt_var.get(),
             run_smoke_tests=self.run_smoke_var.get(),
             deploy_identity_service=self.deploy_identity_var.get(),
@@ -8188,6 +8875,8 @@ class DeploymentTool:
             build_api_cmd=self.build_api_cmd_var.get(),
             build_docker_api_cmd=self.build_docker_api_cmd_var.get(),
             build_docker_frontend_cmd=self.build_docker_frontend_cmd_var.get(),
+            build_parallel=self.build_parallel_var.get(),
+            build_max_parallel=self.build_max_parallel_var.get(),
             github_actions_workflow=self.github_workflow_var.get(),
             azure_devops_org=self.azure_devops_org_var.get(),
             azure_devops_project=self.azure_devops_project_var.get(),
@@ -9029,21 +9718,25 @@ spec:
         
         return generated
     
+    # Lines kept in the log panel; older ones stay in the log store
+    LOG_PANEL_LINES = 2000
+    
     def log_message(self, msg_type: str, message: str):
-        """Add message to log queue."""
-        self.log_queue.put((msg_type, message))
+        """Add message to the log store; safe to call from any thread."""
+        self.log_store.append(msg_type, message)
     
     def process_logs(self):
-        """Process log queue and update UI."""
-        try:
-            while True:
-                msg_type, message = self.log_queue.get_nowait()
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                log_entry = f"[{timestamp}] {message}\n"
-                self.log_text.insert(tk.END, log_entry, msg_type)
-                self.log_text.see(tk.END)
-        except queue.Empty:
-            pass
+        """Write log entries added since the last call to the log panel."""
+        entries = self.log_store.after(self._log_cursor)
+        if entries:
+            self._log_cursor = entries[-1].seq
+            for entry in entries[-self.LOG_PANEL_LINES:]:
+                log_entry = f"[{entry.timestamp.strftime('%H:%M:%S')}] {entry.message}\n"
+                self.log_text.insert(tk.END, log_entry, entry.level)
+            excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - self.LOG_PANEL_LINES
+            if excess > 0:
+                self.log_text.delete('1.0', f'{excess + 1}.0')
+            self.log_text.see(tk.END)
         
         self.root.after(100, self.process_logs)
     
@@ -9089,34 +9782,40 @@ spec:
                 self.engine = DeploymentEngine(config, self.log_message)
                 self.engine.is_running = True
                 
+                # (name, function, dependencies); independent steps run concurrently
                 steps = [
-                    ("Prerequisites", self.engine.deploy_prerequisites, 10),
-                    ("Network", self.engine.create_docker_network, 20),
-                    ("Database", lambda: True, 40),
-                    ("API", lambda: True, 60),
-                    ("Frontend", lambda: True, 70),
-                    ("Data", self.engine.deploy_master_data, 85),
-                    ("Tests", lambda: self.run_tests_internal(config), 100),
+                    ("Prerequisites", self.engine.deploy_prerequisites, ()),
+                    ("Network", self.engine.create_docker_network, ("Prerequisites",)),
+                    ("Database", lambda: True, ("Network",)),
+                    ("API", lambda: True, ("Network",)),
+                    ("Frontend", lambda: True, ("Network",)),
+                    ("Data", lambda: self.engine.deploy_master_data() and self.engine.deploy_zip_codes(), ("Database",)),
+                    ("Tests", lambda: self.run_tests_internal(config), ("API", "Frontend", "Data")),
                 ]
                 
-                for step_name, step_func, progress in steps:
-                    if not self.engine.is_running:
-                        break
-                    
+                def run_step(step_name, step_func):
                     self.engine._wait_if_paused()
-                    
-                    self.update_step_status(step_name, "in_progress")
-                    self.progress_label.set(f"Running: {step_name}")
                     self.log_message("info", f"=== {step_name} ===")
-                    
-                    try:
-                        success = step_func()
-                        self.update_step_status(step_name, "success" if success else "failed")
-                    except Exception as e:
-                        self.log_message("error", f"Error in {step_name}: {str(e)}")
-                        self.update_step_status(step_name, "failed")
-                    
-                    self.progress_var.set(progress)
+                    return step_func()
+                
+                def on_status(step_name, outcome):
+                    if outcome.status == "running":
+                        self.update_step_status(step_name, "in_progress")
+                        self.progress_label.set(f"Running: {step_name}")
+                        return
+                    if outcome.error:
+                        self.log_message("error", f"Error in {step_name}: {outcome.error}")
+                    self.update_step_status(step_name, outcome.status)
+                    finished = sum(1 for o in scheduler.outcomes.values() if o.status in ("success", "failed", "skipped"))
+                    self.progress_var.set(finished * 100 / len(steps))
+                
+                scheduler = StepScheduler(on_status=on_status, should_continue=lambda: self.engine.is_running)
+                for step_name, step_func, depends_on in steps:
+                    scheduler.add(step_name, lambda name=step_name, func=step_func: run_step(name, func), depends_on)
+                scheduler.run()
+                
+                for line in scheduler.report():
+                    self.log_message("info", line)
                 
                 self.show_deployment_summary(config)
                 
@@ -9174,7 +9873,7 @@ spec:
     def stop_deployment(self):
         """Stop the deployment."""
         if self.engine:
-            self.engine.is_running = False
+            self.engine.cancel()
             self.log_message("warning", "Deployment stopped by user")
     
     def show_deployment_summary(self, config: DeploymentConfig):
@@ -9283,6 +9982,15 @@ def cli_mode():
     parser.add_argument("--db-password", type=str, help="Database password")
     parser.add_argument("--admin-email", type=str, default="admin@crm.local", help="Admin email")
     parser.add_argument("--admin-password", type=str, default="Admin@123", help="Admin password")
+    parser.add_argument("--zip-countries", type=str, help="Seed ZIP codes for these countries (e.g. US,CA,GB)")
+    parser.add_argument("--build", action="store_true", help="Build frontend, API and Docker images")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the build cache says inputs are unchanged")
+    parser.add_argument("--parallel-build", action="store_true", help="Build frontend, API and Docker images concurrently")
+    parser.add_argument("--load-test", action="store_true", help="Load test the deployed endpoints and check the SLOs")
+    parser.add_argument("--load-duration", type=int, help="Load test duration in seconds")
+    parser.add_argument("--load-concurrency", type=int, help="Load test workers")
+    parser.add_argument("--load-rps", type=float, help="Load test target requests per second (default: closed loop)")
+    parser.add_argument("--build-jobs", type=int, help="Maximum concurrent component builds with --parallel-build")
     
     args = parser.parse_args()
     
@@ -9309,6 +10017,19 @@ def cli_mode():
         config.admin_email = args.admin_email
     if args.admin_password:
         config.admin_password = args.admin_password
+    if args.zip_countries:
+        config.seed_zip_codes = True
+        config.zip_code_countries = args.zip_countries
+    if args.parallel_build:
+        config.build_parallel = True
+    if args.build_jobs:
+        config.build_max_parallel = args.build_jobs
+    if args.load_duration:
+        config.load_test_duration = args.load_duration
+    if args.load_concurrency:
+        config.load_test_concurrency = args.load_concurrency
+    if args.load_rps:
+        config.load_test_target_rps = args.load_rps
     
     def log_print(msg_type: str, message: str):
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -9317,7 +10038,7 @@ def cli_mode():
     
     engine = DeploymentEngine(config, log_print)
     
-    if args.generate or not args.deploy:
+    if args.generate or not (args.deploy or args.build or args.load_test):
         # Generate scripts
         output_dir = Path(args.output)
         output_dir.mkdir(exist_ok=True)
@@ -9341,6 +10062,12 @@ def cli_mode():
         print(f"  cd {output_dir.absolute()}")
         print(f"  docker compose up -d")
     
+    if args.build:
+        print("\n🔨 Building...")
+        build_engine = BuildEngine(config, log_print, force=args.force)
+        if not build_engine.build_all():
+            return 1
+    
     if args.deploy:
         print("\n🚀 Starting deployment...")
         engine.is_running = True
@@ -9351,6 +10078,7 @@ def cli_mode():
         
         engine.create_docker_network()
         engine.deploy_master_data()
+        engine.deploy_zip_codes()
         
         results = engine.run_smoke_tests()
         
@@ -9370,13 +10098,20 @@ def cli_mode():
         print(f"   Password: {config.admin_password}")
         print(f"=" * 50)
     
+    if args.load_test:
+        print("\n📈 Load testing...")
+        load_runner = LoadTestRunner(config, DeploymentResourceLog(), log_print)
+        load_runner.run_load_test()
+        if not load_runner.slo_passed:
+            return 1
+    
     return 0
 
 
 def main():
     """Main entry point."""
     # Check for CLI mode
-    if len(sys.argv) > 1 and sys.argv[1] in ['--generate', '--deploy', '--config', '--help', '-h']:
+    if len(sys.argv) > 1 and sys.argv[1] in ['--generate', '--deploy', '--build', '--load-test', '--config', '--help', '-h']:
         sys.exit(cli_mode())
     
     # Check for advanced mode (original tabbed interface)
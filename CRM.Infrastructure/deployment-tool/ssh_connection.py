@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Shared SSH Connections
+Multiplexes remote commands over one OpenSSH ControlMaster connection per
+host, so each command reuses an authenticated session instead of paying a
+new TCP and key exchange handshake.
+
+Used by the deployment engine, prerequisite checks and decommissioning in
+main.py and by the web UI.
+"""
+
+import atexit
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+
+class SSHConnection:
+    """One multiplexed SSH connection, shared by everything talking to a host."""
+
+    # Seconds the master stays up after the last command
+    CONTROL_PERSIST = 600
+    # Seconds between master health checks
+    HEALTH_CHECK_INTERVAL = 30
+    CONNECT_TIMEOUT = 15
+    # ssh exits with 255 when the connection itself failed
+    SSH_ERROR_EXIT = 255
+
+    _shared: Dict[str, 'SSHConnection'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ssh_cmd: str):
+        self.ssh_cmd = ssh_cmd
+        # ControlMaster is not available in the Windows OpenSSH client
+        self.multiplexed = sys.platform != "win32"
+        digest = hashlib.sha1(ssh_cmd.encode("utf-8")).hexdigest()[:12]
+        # Short path: unix socket paths are limited to ~104 characters. The PID keeps
+        # the master private to this process, so close_all() at exit cannot stop
+        # a master another deployment tool or web UI is still using.
+        self.control_path = os.path.join(tempfile.gettempdir(), f"crm-ssh-{digest}-{os.getpid()}")
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+
+    @classmethod
+    def shared(cls, ssh_cmd: str) -> 'SSHConnection':
+        """Return the connection for an ssh command line, creating it on first use."""
+        with cls._shared_lock:
+            if ssh_cmd not in cls._shared:
+                cls._shared[ssh_cmd] = cls(ssh_cmd)
+            return cls._shared[ssh_cmd]
+
+    @classmethod
+    def close_all(cls):
+        """Close every shared connection."""
+        with cls._shared_lock:
+            connections = list(cls._shared.values())
+            cls._shared.clear()
+        for connection in connections:
+            connection.close()
+
+    def _with_options(self, extra: str = "") -> str:
+        """The ssh command line with the multiplexing options (and extra options) before the host."""
+        if not self.multiplexed:
+            return self.ssh_cmd
+        program, _, rest = self.ssh_cmd.partition(" ")
+        options = (f'-o ControlMaster=auto -o ControlPath="{self.control_path}" '
+                   f'-o ControlPersist={self.CONTROL_PERSIST}')
+        if extra:
+            options += f" {extra}"
+        return f"{program} {options} {rest}"
+
+    @property
+    def command(self) -> str:
+        """The ssh command line with the multiplexing options added."""
+        return self._with_options()
+
+    def wrap(self, cmd: str) -> str:
+        """Shell command that runs cmd on the remote host."""
+        return f'{self.command} "{cmd}"'
+
+    def _control(self, operation: str, timeout: int = 10) -> bool:
+        """Send a control request (check, exit) to the master."""
+        try:
+            result = subprocess.run(
+                self._with_options(f"-O {operation}"), shell=True,
+                capture_output=True, text=True, timeout=timeout
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def is_alive(self) -> bool:
+        """Whether the master connection is up."""
+        return self.multiplexed and self._control("check")
+
+    def connect(self) -> bool:
+        """Start the master connection in the background."""
+        if not self.multiplexed:
+            return True
+        # A stale socket from a crashed master would make every command fail
+        if os.path.exists(self.control_path) and not self.is_alive():
+            try:
+                os.remove(self.control_path)
+            except OSError:
+                pass
+        try:
+            result = subprocess.run(
+                self._with_options(f"-o ConnectTimeout={self.CONNECT_TIMEOUT} -f -N"), shell=True,
+                capture_output=True, text=True, timeout=self.CONNECT_TIMEOUT + 5
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def ensure_connected(self) -> bool:
+        """Health-check the master (at most every HEALTH_CHECK_INTERVAL seconds), reconnecting if needed."""
+        if not self.multiplexed:
+            return True
+        with self._lock:
+            if time.monotonic() - self._last_check < self.HEALTH_CHECK_INTERVAL:
+                return True
+            ok = self.is_alive() or self.connect()
+            if ok:
+                self._last_check = time.monotonic()
+            return ok
+
+    def reconnect_after(self, returncode: Optional[int]) -> bool:
+        """After a command exited with returncode: if ssh lost the master, reconnect.
+
+        True means the connection is back. The command itself may or may not
+        have run: the master can drop while the command runs, and ssh exits
+        with 255 either way.
+        """
+        if returncode != self.SSH_ERROR_EXIT or not self.multiplexed or self.is_alive():
+            return False
+        self._last_check = 0.0
+        return self.ensure_connected()
+
+    def run(self, cmd: str, timeout: int = 300, input: Optional[str] = None,
+            idempotent: bool = False) -> subprocess.CompletedProcess:
+        """Run cmd on the remote host; the return code is the remote command's exit code.
+
+        If ssh reports a connection failure and the master turns out to be
+        gone, the connection is re-established for the next command. Only an
+        idempotent command (a check, a read) is retried: any other command may
+        already have run before the connection dropped.
+        """
+        self.ensure_connected()
+        result = subprocess.run(
+            self.wrap(cmd), shell=True, input=input,
+            capture_output=True, text=True, timeout=timeout
+        )
+        if self.reconnect_after(result.returncode) and idempotent:
+            result = subprocess.run(
+                self.wrap(cmd), shell=True, input=input,
+                capture_output=True, text=True, timeout=timeout
+            )
+        return result
+
+    def close(self):
+        """Stop the master connection."""
+        if self.multiplexed and os.path.exists(self.control_path):
+            self._control("exit")
+        self._last_check = 0.0
+
+
+atexit.register(SSHConnection.close_all)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+CRM Solution - Deployment Step Scheduler
+Runs deployment steps as a dependency graph: every step starts as soon as
+the steps it depends on have finished, so independent steps (building
+images while the database starts, health checks next to smoke tests)
+overlap instead of running one after another.
+
+After a run the scheduler reports per-step timing and the critical path,
+the chain of dependent steps that determined the total deployment time.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class Step:
+    """A deployment step and the steps it waits for."""
+    name: str
+    func: Callable[[], Any]
+    depends_on: Tuple[str, ...] = ()
+    # Dependents of a failed optional step still run
+    required: bool = True
+
+
+@dataclass
+class StepOutcome:
+    """Result and timing of one step."""
+    name: str
+    status: str = "pending"  # pending, running, success, failed, skipped
+    result: Any = None
+    error: str = ""
+    started: float = 0.0  # seconds since the run started
+    finished: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return max(self.finished - self.started, 0.0)
+
+
+def restrict_dependencies(graph: Dict[str, Iterable[str]], names: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """Reduce a dependency graph to the given steps.
+
+    A dependency on a step that is not part of the plan is replaced by that
+    step's own dependencies, so ordering is kept when optional steps are left
+    out.
+    """
+    selected = list(names)
+    present = set(selected)
+
+    def resolve(name: str) -> List[str]:
+        resolved = []
+        for dependency in graph.get(name, ()):
+            for item in ([dependency] if dependency in present else resolve(dependency)):
+                if item not in resolved:
+                    resolved.append(item)
+        return resolved
+
+    return {name: tuple(resolve(name)) for name in selected}
+
+
+def dependency_order(dependencies: Dict[str, Iterable[str]]) -> List[str]:
+    """Step names ordered so every step comes after its dependencies.
+
+    Steps keep their given order where the dependencies allow it. Raises
+    ValueError for a cycle or a dependency on a step that is not listed.
+    """
+    ordered: List[str] = []
+    done = set()
+    visiting = set()
+
+    def visit(name: str):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle at step: {name}")
+        if name not in dependencies:
+            raise ValueError(f"Unknown dependency: {name}")
+        visiting.add(name)
+        for dependency in dependencies[name]:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+        ordered.append(name)
+
+    for name in dependencies:
+        visit(name)
+    return ordered
+
+
+class StepScheduler:
+    """Run steps concurrently in dependency order."""
+
+    def __init__(self, max_workers: int = 4,
+                 is_success: Callable[[Any], bool] = bool,
+                 on_status: Optional[Callable[[str, StepOutcome], None]] = None,
+                 should_continue: Optional[Callable[[], bool]] = None):
+        self.max_workers = max_workers
+        self.is_success = is_success
+        self.on_status = on_status or (lambda name, outcome: None)
+        self.should_continue = should_continue or (lambda: True)
+        self.steps: Dict[str, Step] = {}
+        self.outcomes: Dict[str, StepOutcome] = {}
+        self.wall_time = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, name: str, func: Callable[[], Any], depends_on: Iterable[str] = (),
+            required: bool = True) -> 'StepScheduler':
+        """Add a step. Dependencies must already have been added, which also rules out cycles."""
+        depends_on = tuple(depends_on)
+        unknown = [dependency for dependency in depends_on if dependency not in self.steps]
+        if unknown:
+            raise ValueError(f"Step '{name}' depends on unknown steps: {', '.join(unknown)}")
+        self.steps[name] = Step(name, func, depends_on, required)
+        self.outcomes[name] = StepOutcome(name)
+        return self
+
+    def _set_status(self, name: str, status: str, **changes):
+        outcome = self.outcomes[name]
+        with self._lock:
+            outcome.status = status
+            for key, value in changes.items():
+                setattr(outcome, key, value)
+        self.on_status(name, outcome)
+
+    def _execute(self, step: Step, origin: float):
+        """Run one step in a worker thread, recording its timing and result."""
+        self._set_status(step.name, "running", started=time.monotonic() - origin)
+        try:
+            result = step.func()
+            status = "success" if self.is_success(result) else "failed"
+            self._set_status(step.name, status, result=result, finished=time.monotonic() - origin)
+        except Exception as e:
+            self._set_status(step.name, "failed", error=str(e), finished=time.monotonic() - origin)
+
+    def _dependency_state(self, step: Step) -> str:
+        """'ready', 'waiting' or 'blocked' (a required dependency failed or was skipped)."""
+        for dependency in step.depends_on:
+            outcome = self.outcomes[dependency]
+            if outcome.status in ("pending", "running"):
+                return "waiting"
+            if outcome.status == "skipped" or (outcome.status == "failed" and self.steps[dependency].required):
+                return "blocked"
+        return "ready"
+
+    def run(self) -> Dict[str, StepOutcome]:
+        """Run every step; returns the outcomes in the order the steps were added."""
+        origin = time.monotonic()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                for step in self.steps.values():
+                    if self.outcomes[step.name].status != "pending" or step.name in running.values():
+                        continue
+                    state = self._dependency_state(step)
+                    if state == "blocked" or (state == "ready" and not self.should_continue()):
+                        now = time.monotonic() - origin
+                        self._set_status(step.name, "skipped", started=now, finished=now)
+                    elif state == "ready" and len(running) < self.max_workers:
+                        # Submit only what can start now, so should_continue() is checked right before each step
+                        running[pool.submit(self._execute, step, origin)] = step.name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+        self.wall_time = time.monotonic() - origin
+        return self.outcomes
+
+    def critical_path(self) -> List[str]:
+        """The chain of executed steps with the longest total duration."""
+        longest: Dict[str, Tuple[float, List[str]]] = {}
+        for name, step in self.steps.items():
+            outcome = self.outcomes[name]
+            if outcome.status == "skipped":
+                continue
+            before = max((longest[dependency] for dependency in step.depends_on if dependency in longest),
+                         key=lambda entry: entry[0], default=(0.0, []))
+            longest[name] = (before[0] + outcome.duration, before[1] + [name])
+        if not longest:
+            return []
+        return max(longest.values(), key=lambda entry: entry[0])[1]
+
+    def report(self) -> List[str]:
+        """Per-step timing lines followed by the critical path."""
+        lines = []
+        for outcome in self.outcomes.values():
+            lines.append(f"{outcome.name:<16} {outcome.status:<8} {outcome.duration:7.1f}s "
+                         f"(start +{outcome.started:.1f}s)")
+        path = self.critical_path()
+        busy = sum(outcome.duration for outcome in self.outcomes.values())
+        path_time = sum(self.outcomes[name].duration for name in path)
+        lines.append(f"Critical path: {' -> '.join(path) or '-'} ({path_time:.1f}s)")
+        lines.append(f"Wall time: {self.wall_time:.1f}s for {busy:.1f}s of step time")
+        return lines
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly summary of the run."""
+        return {
+            "steps": {
+                name: {
+                    "status": outcome.status,
+                    "duration": round(outcome.duration, 3),
+                    "started": round(outcome.started, 3),
+                    "error": outcome.error,
+                }
+                for name, outcome in self.outcomes.items()
+            },
+            "critical_path": self.critical_path(),
+            "wall_time": round(self.wall_time, 3),
+        }
@@ -16,9 +16,16 @@ import time
 import socket
 from pathlib import Path
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import HTTPServer, SimpleHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
-import socketserver
+
+from background_jobs import JobRegistry
+from command_runner import CommandRunner
+from git_mirror import GitMirror
+from http_client import HTTPClient
+from log_store import LogStore
+from ssh_connection import SSHConnection
+from step_scheduler import StepScheduler, dependency_order, restrict_dependencies
 
 VERSION = "4.0.0"
 
@@ -31,13 +38,69 @@ PORT = find_free_port()
 
 # Global deployment state
 deployment_state = {
-    "logs": [],
+    # Bounded; clients follow it by sequence number (see logs_after)
+    "logs": LogStore(capacity=5000),
     "deploy_status": "idle",
     "resources_created": [],
     "test_results": {},
     "credentials": {}
 }
 
+# Deployments, builds and cloud CLI calls started with "background": true
+jobs = JobRegistry()
+
+# Deploy plans share the project checkout and the Docker Compose stack, so only
+# one runs at a time; per-task status lives in the plan's job
+deploy_lock = threading.Lock()
+
+def log_event(level, message):
+    """Append a line to the deployment log and wake the log streams."""
+    deployment_state['logs'].append(level, message)
+
+
+def parse_cursor(value):
+    """A log sequence number from a query string or Last-Event-ID header; 0 if missing or invalid."""
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def logs_after(seq, timeout=None):
+    """Log lines (as dicts) after sequence number seq; with a timeout, wait up to that long for one."""
+    logs = deployment_state['logs']
+    entries = logs.wait(seq, timeout) if timeout else logs.after(seq)
+    return [entry.to_dict() for entry in entries]
+
+
+def task_runner(source):
+    """CommandRunner for a deploy task: output lines go to the deployment log as [source] lines."""
+    def log(level, message):
+        # The log panel styles info, success, warning and error
+        log_event('info' if level in ('cmd', 'output') else level, f'[{source}] {message}')
+    return CommandRunner(log)
+
+# Dependencies between deployment tasks. Tasks whose dependencies are done run
+# concurrently, e.g. building images while the database and cache start, and
+# the health check next to the API and UI tests.
+DEPLOY_TASK_DEPENDENCIES = {
+    'validate': (),
+    'clone': ('validate',),
+    'build': ('clone',),
+    'infra': ('clone',),
+    'services': ('build', 'infra'),
+    'wait': ('services',),
+    'migrate': ('wait',),
+    'seed': ('migrate',),
+    'health': ('seed',),
+    'api-test': ('seed',),
+    'ui-test': ('seed',),
+    'decommission': ('health', 'api-test', 'ui-test'),
+}
+
+# Failures of these tasks are reported but do not stop dependent tasks
+OPTIONAL_DEPLOY_TASKS = ('api-test', 'ui-test')
+
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -2322,90 +2385,125 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                 resources: state.resources
             };
             
-            // Execute each task via API
-            for (let i = 0; i < tasks.length; i++) {
-                const task = tasks[i];
-                const taskId = task.getAttribute('data-task');
-                const taskName = task.querySelector('.test-name').textContent;
-                
-                // Update to running
+            // Run all tasks in one request; the server starts each task as soon as
+            // the tasks it depends on are done, so independent tasks overlap
+            const taskIds = Array.from(tasks).map(task => task.getAttribute('data-task'));
+            tasks.forEach(task => {
                 task.querySelector('.test-icon').innerHTML = '<i class="fas fa-spinner spinner"></i>';
                 task.querySelector('.test-icon').className = 'test-icon loading';
-                task.querySelector('.test-status').textContent = 'Running';
-                
-                status.innerHTML = `
-                    <div class="status-icon loading"><i class="fas fa-spinner spinner"></i></div>
-                    <div class="status-content">
-                        <h4>${taskName}</h4>
-                        <p>Step ${i + 1} of ${tasks.length}</p>
-                    </div>
-                `;
-                
-                addLog('info', taskName + '...');
-                
-                try {
-                    const response = await fetch('/api/deploy/task', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ taskId, config })
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        task.querySelector('.test-icon').innerHTML = '<i class="fas fa-check"></i>';
-                        task.querySelector('.test-icon').className = 'test-icon pass';
-                        task.querySelector('.test-status').textContent = 'Complete';
-                        addLog('success', taskName + ' completed');
-                        
-                        // Store any returned data (like endpoints, credentials)
-                        if (result.endpoints) state.endpoints = result.endpoints;
-                        if (result.credentials) state.credentials = result.credentials;
-                        if (result.message) addLog('info', result.message);
-                    } else {
-                        task.querySelector('.test-icon').innerHTML = '<i class="fas fa-times"></i>';
-                        task.querySelector('.test-icon').className = 'test-icon fail';
-                        task.querySelector('.test-status').textContent = 'Failed';
-                        addLog('error', taskName + ' failed: ' + (result.error || 'Unknown error'));
-                        
-                        // Show failure in status
-                        status.innerHTML = `
-                            <div class="status-icon error"><i class="fas fa-times"></i></div>
-                            <div class="status-content">
-                                <h4>Deployment Failed</h4>
-                                <p>${result.error || 'An error occurred during ' + taskName}</p>
-                            </div>
-                        `;
-                        
-                        // If a critical task fails, offer to rollback
-                        if (!['api-test', 'ui-test'].includes(taskId)) {
-                            const results = document.getElementById('deploy-results');
-                            results.style.display = 'block';
-                            results.innerHTML = `
-                                <div class="alert alert-danger">
-                                    <i class="fas fa-exclamation-circle"></i>
-                                    <div class="alert-content">
-                                        <strong>Deployment Failed</strong>
-                                        <p>${result.error || 'Check the logs for details.'}</p>
-                                    </div>
-                                </div>
-                                <div style="text-align: center; margin-top: 20px;">
-                                    <button class="btn btn-danger" onclick="decommissionResources()">
-                                        <i class="fas fa-undo"></i> Rollback / Clean Up
-                                    </button>
-                                </div>
-                            `;
-                            return;
+                task.querySelector('.test-status').textContent = 'Queued';
+            });
+            
+            status.innerHTML = `
+                <div class="status-icon loading"><i class="fas fa-spinner spinner"></i></div>
+                <div class="status-content">
+                    <h4>Deploying</h4>
+                    <p>Running ${tasks.length} tasks, independent tasks in parallel</p>
+                </div>
+            `;
+            
+            // The plan runs as a background job; poll it and mark tasks as they start and finish
+            let plan;
+            try {
+                const response = await fetch('/api/deploy/plan', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ taskIds, config, background: true })
+                });
+                const submitted = await response.json();
+                if (!submitted.jobId) {
+                    plan = submitted;
+                }
+                while (!plan) {
+                    await new Promise(resolve => setTimeout(resolve, 1000));
+                    const job = await (await fetch('/api/jobs/' + submitted.jobId)).json();
+                    const steps = (job.progress && job.progress.steps) || {};
+                    tasks.forEach(task => {
+                        const step = steps[task.getAttribute('data-task')];
+                        if (step && step.status === 'running') {
+                            task.querySelector('.test-status').textContent = 'Running';
                         }
+                    });
+                    progress.style.width = (Object.values(steps).filter(step => step.status !== 'running').length / tasks.length * 100) + '%';
+                    if (job.status === 'success' || job.status === 'failed') {
+                        plan = job.result || { error: job.error };
                     }
-                } catch (e) {
+                }
+            } catch (e) {
+                addLog('error', 'Error executing deployment: ' + e.message);
+                return;
+            }
+            
+            if (!plan.tasks) {
+                addLog('error', 'Deployment failed: ' + (plan.error || 'Unknown error'));
+                return;
+            }
+            
+            let firstFailure = null;
+            let done = 0;
+            tasks.forEach(task => {
+                const taskId = task.getAttribute('data-task');
+                const taskName = task.querySelector('.test-name').textContent;
+                const result = plan.tasks[taskId] || { status: 'skipped' };
+                const seconds = (result.duration || 0).toFixed(1) + 's';
+                
+                if (result.status === 'success') {
+                    task.querySelector('.test-icon').innerHTML = '<i class="fas fa-check"></i>';
+                    task.querySelector('.test-icon').className = 'test-icon pass';
+                    task.querySelector('.test-status').textContent = 'Complete (' + seconds + ')';
+                    addLog('success', taskName + ' completed in ' + seconds);
+                    
+                    // Store any returned data (like endpoints, credentials)
+                    if (result.endpoints) state.endpoints = result.endpoints;
+                    if (result.credentials) state.credentials = result.credentials;
+                    if (result.message) addLog('info', result.message);
+                } else if (result.status === 'skipped') {
+                    task.querySelector('.test-icon').innerHTML = '<i class="fas fa-forward"></i>';
+                    task.querySelector('.test-icon').className = 'test-icon pending';
+                    task.querySelector('.test-status').textContent = 'Skipped';
+                    addLog('warning', taskName + ' skipped (a required task failed)');
+                } else {
                     task.querySelector('.test-icon').innerHTML = '<i class="fas fa-times"></i>';
                     task.querySelector('.test-icon').className = 'test-icon fail';
-                    task.querySelector('.test-status').textContent = 'Error';
-                    addLog('error', 'Error executing ' + taskName + ': ' + e.message);
+                    task.querySelector('.test-status').textContent = 'Failed (' + seconds + ')';
+                    addLog('error', taskName + ' failed: ' + (result.error || 'Unknown error'));
+                    
+                    if (!firstFailure && !['api-test', 'ui-test'].includes(taskId)) {
+                        firstFailure = { taskName, error: result.error };
+                    }
                 }
-                
-                progress.style.width = ((i + 1) / tasks.length * 100) + '%';
+                done++;
+            });
+            progress.style.width = (done / tasks.length * 100) + '%';
+            
+            (plan.report || []).forEach(line => addLog('info', line));
+            
+            // If a critical task fails, offer to rollback
+            if (firstFailure) {
+                status.innerHTML = `
+                    <div class="status-icon error"><i class="fas fa-times"></i></div>
+                    <div class="status-content">
+                        <h4>Deployment Failed</h4>
+                        <p>${firstFailure.error || 'An error occurred during ' + firstFailure.taskName}</p>
+                    </div>
+                `;
+                const results = document.getElementById('deploy-results');
+                results.style.display = 'block';
+                results.innerHTML = `
+                    <div class="alert alert-danger">
+                        <i class="fas fa-exclamation-circle"></i>
+                        <div class="alert-content">
+                            <strong>Deployment Failed</strong>
+                            <p>${firstFailure.error || 'Check the logs for details.'}</p>
+                        </div>
+                    </div>
+                    <div style="text-align: center; margin-top: 20px;">
+                        <button class="btn btn-danger" onclick="decommissionResources()">
+                            <i class="fas fa-undo"></i> Rollback / Clean Up
+                        </button>
+                    </div>
+                `;
+                return;
             }
             
             // Show results
@@ -2549,18 +2647,31 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         }
         
         // ==================== UTILITY ====================
-        function addLog(type, message) {
+        function addLog(type, message, time) {
             const log = document.getElementById('log-content');
-            const time = new Date().toLocaleTimeString();
-            log.innerHTML += `
+            time = time || new Date().toLocaleTimeString();
+            log.insertAdjacentHTML('beforeend', `
                 <div class="log-entry">
                     <span class="log-time">[${time}]</span>
                     <span class="log-${type}">${message}</span>
                 </div>
-            `;
+            `);
             log.scrollTop = log.scrollHeight;
         }
         
+        // Server-side log lines (build output, task starts) pushed over Server-Sent Events;
+        // EventSource reconnects by itself and resumes after the last line received
+        function streamServerLogs() {
+            if (!window.EventSource) return;
+            const source = new EventSource('/api/logs/stream');
+            source.addEventListener('log', event => {
+                const entry = JSON.parse(event.data);
+                const text = document.createElement('span');
+                text.textContent = entry.message;
+                addLog(entry.level, text.innerHTML, entry.time);
+            });
+        }
+        
         function clearLogs() {
             document.getElementById('log-content').innerHTML = '';
             addLog('info', 'Log cleared');
@@ -2849,6 +2960,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         // Initialize
         renderStep();
         addLog('info', 'Ready');
+        streamServerLogs();
     </script>
 </body>
 </html>
@@ -2881,7 +2993,28 @@ class WizardHandler(SimpleHTTPRequestHandler):
             self._send_json(self._get_azure_resources())
             
         elif parsed.path == '/api/logs':
-            self._send_json({'logs': deployment_state['logs']})
+            # ?after=<seq> returns only newer lines, ?level=error only the errors
+            query = parse_qs(parsed.query)
+            after = parse_cursor(query.get('after', ['0'])[0])
+            if 'level' in query:
+                logs = [entry.to_dict() for entry in deployment_state['logs'].by_level(*query['level'])
+                        if entry.seq > after]
+            else:
+                logs = logs_after(after)
+            self._send_json({'logs': logs, 'last': logs[-1]['seq'] if logs else after})
+            
+        elif parsed.path == '/api/logs/stream':
+            self._stream_logs(parsed)
+            
+        elif parsed.path == '/api/jobs':
+            self._send_json({'jobs': jobs.list()})
+            
+        elif parsed.path.startswith('/api/jobs/'):
+            job = jobs.get(parsed.path.split('/')[-1])
+            if job:
+                self._send_json(job.to_dict())
+            else:
+                self._send_json({'success': False, 'error': 'Unknown job'}, status=404)
             
         elif parsed.path == '/api/detect-path':
             self._send_json(self._detect_path())
@@ -2902,47 +3035,84 @@ class WizardHandler(SimpleHTTPRequestHandler):
         except:
             data = {}
         
+        # Long requests can run as background jobs: {"background": true} or ?background=1
+        background = bool(data.get('background')) or 'background' in parse_qs(parsed.query)
+        
         if parsed.path.startswith('/api/auth/'):
             provider = parsed.path.split('/')[-1]
-            self._send_json(self._do_auth(provider))
+            self._respond('do_auth', lambda: self._do_auth(provider), background)
             
         elif parsed.path == '/api/create-gcp-project':
-            self._send_json(self._create_gcp_project(data))
+            self._respond('create_gcp_project', lambda: self._create_gcp_project(data), background)
             
         elif parsed.path == '/api/create-azure-rg':
-            self._send_json(self._create_azure_rg(data))
+            self._respond('create_azure_rg', lambda: self._create_azure_rg(data), background)
             
         elif parsed.path == '/api/deploy':
-            self._send_json(self._start_deploy(data))
+            self._respond('start_deploy', lambda: self._start_deploy(data), background)
             
         elif parsed.path == '/api/decommission':
-            self._send_json(self._decommission(data))
+            self._respond('decommission', lambda: self._decommission(data), background)
             
         elif parsed.path == '/api/test-ssh':
-            self._send_json(self._test_ssh(data))
+            self._respond('test_ssh', lambda: self._test_ssh(data), background)
             
         elif parsed.path == '/api/deploy/task':
-            self._send_json(self._execute_deploy_task(data))
+            self._respond('execute_deploy_task', lambda: self._execute_deploy_task(data), background)
+            
+        elif parsed.path == '/api/deploy/plan':
+            self._respond('execute_deploy_plan', lambda: self._execute_deploy_plan(data), background)
             
         elif parsed.path == '/api/test-git':
-            self._send_json(self._test_git(data))
+            self._respond('test_git', lambda: self._test_git(data), background)
             
         elif parsed.path == '/api/check-prerequisites':
-            self._send_json(self._check_prerequisites())
+            self._respond('check_prerequisites', lambda: self._check_prerequisites(), background)
             
         elif parsed.path == '/api/detect-path':
-            self._send_json(self._detect_path())
+            self._respond('detect_path', lambda: self._detect_path(), background)
             
         else:
             self.send_error(404)
     
-    def _send_json(self, data):
-        self.send_response(200)
+    def _send_json(self, data, status=200):
+        self.send_response(status)
         self.send_header('Content-type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         self.wfile.write(json.dumps(data).encode())
     
+    def _stream_logs(self, parsed):
+        """Server-Sent Events: push log lines as they are written, resuming after Last-Event-ID."""
+        cursor = parse_cursor(self.headers.get('Last-Event-ID') or parse_qs(parsed.query).get('after', ['0'])[0])
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        try:
+            self.wfile.write(b'retry: 2000\n\n')
+            while True:
+                logs = logs_after(cursor, timeout=15)
+                if not logs:
+                    # Comment line; keeps proxies from closing an idle stream
+                    self.wfile.write(b': keep-alive\n\n')
+                for entry in logs:
+                    self.wfile.write(f"id: {entry['seq']}\nevent: log\ndata: {json.dumps(entry)}\n\n".encode())
+                    cursor = entry['seq']
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
+    def _respond(self, kind, handler, background=False):
+        """Send the handler's result, or start it as a background job and send the job ID."""
+        if not background:
+            self._send_json(handler())
+            return
+        job = jobs.submit(kind, handler)
+        self._send_json({'success': True, 'jobId': job.id, 'status': job.status}, status=202)
+    
     def _check_cli(self, provider):
         cmds = {
             'aws': ('aws --version', 'brew install awscli'),
@@ -2979,16 +3149,12 @@ class WizardHandler(SimpleHTTPRequestHandler):
             ssh_opts += f' -i "{key_path_expanded}"'
         
         ssh_cmd = f'ssh {ssh_opts} -p {port} {user}@{host}'
+        # Later commands to this host reuse the connection opened here
+        connection = SSHConnection.shared(ssh_cmd)
         
         try:
             # Test basic connection with uname
-            result = subprocess.run(
-                f'{ssh_cmd} "uname -a"',
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
+            result = connection.run("uname -a", timeout=15, idempotent=True)
             
             if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else 'Connection failed'
@@ -2997,13 +3163,7 @@ class WizardHandler(SimpleHTTPRequestHandler):
             system_info = result.stdout.strip()
             
             # Check if Docker is available
-            docker_result = subprocess.run(
-                f'{ssh_cmd} "docker --version 2>/dev/null"',
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            docker_result = connection.run("docker --version 2>/dev/null", timeout=10, idempotent=True)
             
             docker_version = None
             if docker_result.returncode == 0 and docker_result.stdout.strip():
@@ -3171,10 +3331,10 @@ class WizardHandler(SimpleHTTPRequestHandler):
                 if not host or not user:
                     return {'success': False, 'error': 'Remote host configuration missing'}
                 
-                ssh_cmd = f'ssh -o StrictHostKeyChecking=no {user}@{host}'
-                result = subprocess.run(
-                    f'{ssh_cmd} "cd /tmp/crm-solution && docker compose -f docker/docker-compose.unified.yml down -v --remove-orphans"',
-                    shell=True, capture_output=True, text=True, timeout=120
+                connection = SSHConnection.shared(f'ssh -o StrictHostKeyChecking=no {user}@{host}')
+                result = connection.run(
+                    "cd /tmp/crm-solution && docker compose -f docker/docker-compose.unified.yml down -v --remove-orphans",
+                    timeout=120
                 )
                 
                 return {'success': result.returncode == 0, 'message': 'Remote resources decommissioned'}
@@ -3274,12 +3434,9 @@ class WizardHandler(SimpleHTTPRequestHandler):
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
-    def _execute_deploy_task(self, data):
-        """Execute a specific deployment task."""
-        task_id = data.get('taskId', '')
-        config = data.get('config', {})
-        
-        task_handlers = {
+    def _deploy_task_handlers(self):
+        """Map deployment task IDs to their handlers."""
+        return {
             'validate': self._task_validate,
             'clone': self._task_clone,
             'build': self._task_build,
@@ -3293,13 +3450,78 @@ class WizardHandler(SimpleHTTPRequestHandler):
             'ui-test': self._task_ui_test,
             'decommission': lambda c: self._decommission({'config': c})
         }
+    
+    def _execute_deploy_task(self, data):
+        """Execute a specific deployment task."""
+        task_id = data.get('taskId', '')
+        config = data.get('config', {})
         
-        handler = task_handlers.get(task_id)
+        handler = self._deploy_task_handlers().get(task_id)
         if handler:
             return handler(config)
         else:
             return {'success': False, 'error': f'Unknown task: {task_id}'}
     
+    def _execute_deploy_plan(self, data):
+        """Execute a list of deployment tasks, running independent tasks concurrently."""
+        task_ids = data.get('taskIds', [])
+        config = data.get('config', {})
+        handlers = self._deploy_task_handlers()
+        
+        unknown = [task_id for task_id in task_ids if task_id not in handlers]
+        if unknown:
+            return {'success': False, 'error': f'Unknown task: {", ".join(unknown)}'}
+        
+        if not deploy_lock.acquire(blocking=False):
+            return {'success': False, 'error': 'Another deployment is already running'}
+        try:
+            deployment_state['deploy_status'] = 'running'
+            result = self._run_deploy_plan(task_ids, config, handlers)
+            deployment_state['deploy_status'] = 'complete' if result['success'] else 'failed'
+            return result
+        except Exception:
+            deployment_state['deploy_status'] = 'failed'
+            raise
+        finally:
+            deploy_lock.release()
+    
+    def _run_deploy_plan(self, task_ids, config, handlers):
+        job = jobs.current()
+        
+        def on_status(task_id, outcome):
+            if outcome.status == 'running':
+                log_event('info', f'Task {task_id} started')
+            if job:
+                job.report('steps', task_id, {'status': outcome.status, 'duration': round(outcome.duration, 3)})
+        
+        scheduler = StepScheduler(max_workers=4, is_success=lambda result: bool(result and result.get('success')),
+                                  on_status=on_status)
+        dependencies = restrict_dependencies(DEPLOY_TASK_DEPENDENCIES, task_ids)
+        # The client may list a task before the tasks it waits for
+        for task_id in dependency_order(dependencies):
+            scheduler.add(task_id, lambda handler=handlers[task_id]: handler(config), dependencies[task_id],
+                          required=task_id not in OPTIONAL_DEPLOY_TASKS)
+        outcomes = scheduler.run()
+        
+        tasks = {}
+        for task_id, outcome in outcomes.items():
+            task = dict(outcome.result or {})
+            task.update(status=outcome.status, duration=round(outcome.duration, 3),
+                        started=round(outcome.started, 3))
+            if outcome.error:
+                task['error'] = outcome.error
+            tasks[task_id] = task
+        
+        success = all(outcome.status == 'success' or task_id in OPTIONAL_DEPLOY_TASKS
+                      for task_id, outcome in outcomes.items())
+        return {
+            'success': success,
+            'tasks': tasks,
+            'criticalPath': scheduler.critical_path(),
+            'wallTime': round(scheduler.wall_time, 3),
+            'report': scheduler.report()
+        }
+    
     def _task_validate(self, config):
         """Validate configuration."""
         errors = []
@@ -3341,24 +3563,24 @@ class WizardHandler(SimpleHTTPRequestHandler):
             else:
                 return {'success': False, 'error': f'Path not found: {local_path}'}
         else:
-            # Clone from Git
+            # Check out from the cached mirror; repeat deployments only fetch new commits
             git_repo = config.get('gitRepo', '')
             git_branch = config.get('gitBranch', 'main')
             clone_dir = '/tmp/crm-solution'
             
             try:
-                # Remove existing clone
-                if os.path.exists(clone_dir):
-                    subprocess.run(f'rm -rf "{clone_dir}"', shell=True, timeout=30)
-                
-                cmd = f'git clone --depth 1 --branch {git_branch} "{git_repo}" "{clone_dir}"'
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=300)
-                
-                if result.returncode == 0:
+                mirror = GitMirror(git_repo)
+                success, output = mirror.update(git_branch)
+                if not success:
+                    return {'success': False, 'error': output or 'Git fetch failed'}
+                
+                commit = mirror.revision(f'refs/heads/{git_branch}')
+                success, output = mirror.add_worktree(clone_dir, commit)
+                if success:
                     deployment_state['project_path'] = clone_dir
-                    return {'success': True, 'message': f'Cloned {git_branch} branch'}
+                    return {'success': True, 'message': f'Checked out {git_branch} branch at {commit[:12]}'}
                 else:
-                    return {'success': False, 'error': result.stderr or 'Git clone failed'}
+                    return {'success': False, 'error': output or 'Git checkout failed'}
             except Exception as e:
                 return {'success': False, 'error': str(e)}
     
@@ -3375,17 +3597,17 @@ class WizardHandler(SimpleHTTPRequestHandler):
             
             # Build images
             cmd = f'docker compose -f "{compose_file}" build --parallel'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=900)
+            result = task_runner('build').run(cmd, timeout=900)
             
-            if result.returncode == 0:
+            if result.success:
                 return {'success': True, 'message': 'Docker images built successfully'}
+            elif result.timed_out:
+                return {'success': False, 'error': 'Build timed out (15 min limit)'}
             else:
                 # Try to extract useful error
                 error = result.stderr[-500:] if result.stderr else 'Build failed'
                 return {'success': False, 'error': error}
                 
-        except subprocess.TimeoutExpired:
-            return {'success': False, 'error': 'Build timed out (15 min limit)'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
@@ -3398,13 +3620,14 @@ class WizardHandler(SimpleHTTPRequestHandler):
             
             # Start only database and cache
             cmd = f'docker compose -f "{compose_file}" up -d crm-mariadb crm-redis'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=120)
+            result = task_runner('infra').run(cmd, timeout=120)
             
-            if result.returncode == 0:
+            if result.success:
                 deployment_state['resources_created'].extend(['crm-mariadb', 'crm-redis'])
                 return {'success': True, 'message': 'Database and cache started'}
             else:
-                return {'success': False, 'error': result.stderr or 'Failed to start infrastructure'}
+                error = 'Infrastructure start timed out (2 min limit)' if result.timed_out else result.stderr
+                return {'success': False, 'error': error or 'Failed to start infrastructure'}
                 
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -3418,13 +3641,14 @@ class WizardHandler(SimpleHTTPRequestHandler):
             
             # Start all services
             cmd = f'docker compose -f "{compose_file}" up -d'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=180)
+            result = task_runner('services').run(cmd, timeout=180)
             
-            if result.returncode == 0:
+            if result.success:
                 deployment_state['resources_created'].extend(['crm-api', 'crm-frontend'])
                 return {'success': True, 'message': 'Application services deployed'}
             else:
-                return {'success': False, 'error': result.stderr or 'Failed to start services'}
+                error = 'Service start timed out (3 min limit)' if result.timed_out else result.stderr
+                return {'success': False, 'error': error or 'Failed to start services'}
                 
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -3438,14 +3662,10 @@ class WizardHandler(SimpleHTTPRequestHandler):
         
         for attempt in range(max_attempts):
             try:
-                import urllib.request
                 url = f'http://localhost:{api_port}/api/monitoring/health'
-                req = urllib.request.Request(url, method='GET')
-                req.add_header('Accept', 'application/json')
-                
-                with urllib.request.urlopen(req, timeout=5) as response:
-                    if response.status == 200:
-                        return {'success': True, 'message': f'Services ready after {attempt + 1} attempts'}
+                response = HTTPClient.shared().request(url, headers={'Accept': 'application/json'}, timeout=5)
+                if response.status == 200:
+                    return {'success': True, 'message': f'Services ready after {attempt + 1} attempts'}
             except:
                 pass
             
@@ -3502,14 +3722,12 @@ class WizardHandler(SimpleHTTPRequestHandler):
         
         for name, url in endpoints.items():
             try:
-                import urllib.request
-                req = urllib.request.Request(url, method='GET')
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status == 200:
-                        results.append(f'{name}: OK')
-                    else:
-                        results.append(f'{name}: Status {response.status}')
-                        all_healthy = False
+                response = HTTPClient.shared().request(url, timeout=10)
+                if response.status == 200:
+                    results.append(f'{name}: OK')
+                else:
+                    results.append(f'{name}: Status {response.status}')
+                    all_healthy = False
             except Exception as e:
                 results.append(f'{name}: Failed')
                 all_healthy = False
@@ -3541,13 +3759,11 @@ class WizardHandler(SimpleHTTPRequestHandler):
         
         for name, url, expected in tests:
             try:
-                import urllib.request
-                req = urllib.request.Request(url, method='GET')
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status == expected:
-                        passed += 1
-                    else:
-                        failed += 1
+                response = HTTPClient.shared().request(url, timeout=10)
+                if response.status == expected:
+                    passed += 1
+                else:
+                    failed += 1
             except:
                 failed += 1
         
@@ -3561,17 +3777,13 @@ class WizardHandler(SimpleHTTPRequestHandler):
         frontend_port = config.get('local', {}).get('frontendPort', '3000')
         
         try:
-            import urllib.request
             url = f'http://localhost:{frontend_port}'
-            req = urllib.request.Request(url, method='GET')
+            response = HTTPClient.shared().request(url, timeout=10)
             
-            with urllib.request.urlopen(req, timeout=10) as response:
-                content = response.read().decode('utf-8')
-                
-                if response.status == 200 and 'CRM' in content:
-                    return {'success': True, 'message': 'Frontend loads successfully'}
-                else:
-                    return {'success': False, 'error': 'Frontend did not load correctly'}
+            if response.status == 200 and 'CRM' in response.text:
+                return {'success': True, 'message': 'Frontend loads successfully'}
+            else:
+                return {'success': False, 'error': 'Frontend did not load correctly'}
         except Exception as e:
             return {'success': False, 'error': f'Frontend not accessible: {str(e)}'}
     
@@ -3581,7 +3793,8 @@ class WizardHandler(SimpleHTTPRequestHandler):
 
 def run_server():
     """Run the web server."""
-    with socketserver.TCPServer(("", PORT), WizardHandler) as httpd:
+    # One thread per request, so polling and log requests are answered while jobs run
+    with ThreadingHTTPServer(("", PORT), WizardHandler) as httpd:
         print(f"\n{'='*60}")
         print(f"  CRM Deployment Wizard - Web UI")
         print(f"  Version: {VERSION}")
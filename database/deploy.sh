@@ -54,9 +54,27 @@ execute_sql_file() {
     local sql_file=$2
     local description=$3
     
+    local mysql_opts=()
+    local reader=(cat)
+    local sql_dir
+    sql_dir="$(dirname "$sql_file")"
+    
+    # Compressed SQL (e.g. convert_geonames.py --compress) is piped straight
+    # into the client without unpacking to disk
+    case "$sql_file" in
+        *.sql.gz)  reader=(gzip -dc) ;;
+        *.sql.zst) reader=(zstd -dc) ;;
+    esac
+    
+    # Bulk load drivers (*.load.sql) use LOAD DATA LOCAL INFILE with paths
+    # relative to their own directory
+    if [[ "$sql_file" == *.load.sql ]]; then
+        mysql_opts+=(--local-infile=1)
+    fi
+    
     if [[ -f "$sql_file" ]]; then
         echo -n "  Executing $description... "
-        if mysql -h "$DB_HOST" -P "$DB_PORT" -u "$DB_ROOT_USER" -p"$DB_ROOT_PASS" "$database" < "$sql_file" 2>/dev/null; then
+        if (set -o pipefail; cd "$sql_dir" && "${reader[@]}" "$sql_file" | mysql "${mysql_opts[@]}" -h "$DB_HOST" -P "$DB_PORT" -u "$DB_ROOT_USER" -p"$DB_ROOT_PASS" "$database" 2>/dev/null); then
             print_success "Done"
             return 0
         else
@@ -136,7 +154,7 @@ deploy_master_data() {
     echo "  Deploying master data to $database..."
     
     if [[ -d "$MASTER_DATA_DIR" ]]; then
-        for data_file in "$MASTER_DATA_DIR"/*.sql; do
+        for data_file in "$MASTER_DATA_DIR"/*.sql "$MASTER_DATA_DIR"/*.sql.gz "$MASTER_DATA_DIR"/*.sql.zst; do
             if [[ -f "$data_file" ]]; then
                 local filename=$(basename "$data_file")
                 execute_sql_file "$database" "$data_file" "$filename"
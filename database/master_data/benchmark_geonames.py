@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the GeoNames conversion pipeline in convert_geonames.py.
+
+formatter: compares the rows/s of the current format_row against the
+           original per-row implementation, which is kept below as a
+           reference. Both must produce identical output.
+pipeline:  generates synthetic GeoNames files (10k to 5M rows), runs the
+           converter in every supported mode in a fresh process and reports
+           rows/s, MB/s, peak RSS and output size as JSON.
+
+Usage:
+  python3 benchmark_geonames.py formatter [--rows 200000] [--min-speedup 3.0]
+  python3 benchmark_geonames.py pipeline [--sizes 10k,100k,1m,5m] [--modes sql,tsv] [--json results.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import convert_geonames
+
+
+def reference_escape_sql(value):
+    """Original escape_sql: chained replaces for every value"""
+    if not value:
+        return "NULL"
+    return "'" + value.replace("'", "''").replace("\\", "\\\\") + "'"
+
+
+def reference_format_row(line):
+    """Original row path: per-row country table, len(parts) guards, 10 escape calls"""
+    parts = line.strip().split('\t')
+    if len(parts) < 10:
+        return None
+    
+    country_code = parts[0] if len(parts) > 0 else ""
+    postal_code = parts[1] if len(parts) > 1 else ""
+    city = parts[2] if len(parts) > 2 else ""
+    
+    if not country_code or not postal_code or not city:
+        return None
+    
+    state = parts[3] if len(parts) > 3 else ""
+    state_code = parts[4] if len(parts) > 4 else ""
+    county = parts[5] if len(parts) > 5 else ""
+    county_code = parts[6] if len(parts) > 6 else ""
+    community = parts[7] if len(parts) > 7 else ""
+    community_code = parts[8] if len(parts) > 8 else ""
+    
+    try:
+        latitude = float(parts[9]) if len(parts) > 9 and parts[9] else 0
+        longitude = float(parts[10]) if len(parts) > 10 and parts[10] else 0
+        accuracy = int(parts[11]) if len(parts) > 11 and parts[11] else 1
+    except (ValueError, IndexError):
+        latitude = 0
+        longitude = 0
+        accuracy = 1
+    
+    # The original rebuilt the country table for every row
+    country_names = {
+        'US': 'United States', 'CA': 'Canada', 'GB': 'United Kingdom',
+        'AU': 'Australia', 'DE': 'Germany', 'FR': 'France', 'IT': 'Italy',
+        'ES': 'Spain', 'NL': 'Netherlands', 'BE': 'Belgium', 'CH': 'Switzerland',
+        'AT': 'Austria', 'IE': 'Ireland', 'NZ': 'New Zealand', 'MX': 'Mexico',
+        'BR': 'Brazil', 'AR': 'Argentina', 'IN': 'India', 'JP': 'Japan',
+        'CN': 'China', 'KR': 'South Korea', 'SG': 'Singapore', 'MY': 'Malaysia',
+        'PH': 'Philippines', 'TH': 'Thailand', 'VN': 'Vietnam', 'ID': 'Indonesia',
+        'ZA': 'South Africa', 'NG': 'Nigeria', 'EG': 'Egypt', 'AE': 'United Arab Emirates',
+        'SA': 'Saudi Arabia', 'IL': 'Israel', 'TR': 'Turkey', 'RU': 'Russia',
+        'PL': 'Poland', 'CZ': 'Czech Republic', 'HU': 'Hungary', 'RO': 'Romania',
+        'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark', 'FI': 'Finland',
+        'PT': 'Portugal', 'GR': 'Greece', 'HR': 'Croatia', 'SI': 'Slovenia',
+        'SK': 'Slovakia', 'BG': 'Bulgaria', 'LT': 'Lithuania', 'LV': 'Latvia',
+        'EE': 'Estonia', 'CY': 'Cyprus', 'MT': 'Malta', 'LU': 'Luxembourg',
+        'AD': 'Andorra', 'MC': 'Monaco', 'SM': 'San Marino', 'VA': 'Vatican City',
+        'CL': 'Chile', 'CO': 'Colombia', 'PE': 'Peru', 'VE': 'Venezuela',
+        'EC': 'Ecuador', 'UY': 'Uruguay', 'PY': 'Paraguay', 'BO': 'Bolivia',
+        'PA': 'Panama', 'CR': 'Costa Rica', 'GT': 'Guatemala', 'HN': 'Honduras',
+        'SV': 'El Salvador', 'NI': 'Nicaragua', 'DO': 'Dominican Republic',
+        'PR': 'Puerto Rico', 'JM': 'Jamaica', 'TT': 'Trinidad and Tobago',
+        'PK': 'Pakistan', 'BD': 'Bangladesh', 'LK': 'Sri Lanka', 'NP': 'Nepal',
+        'HK': 'Hong Kong', 'TW': 'Taiwan', 'MO': 'Macau'
+    }
+    country = country_names.get(country_code, country_code)
+    
+    escape_sql = reference_escape_sql
+    return f"({escape_sql(country)}, {escape_sql(country_code)}, {escape_sql(postal_code)}, " \
+           f"{escape_sql(city)}, {escape_sql(state)}, {escape_sql(state_code)}, " \
+           f"{escape_sql(county)}, {escape_sql(county_code)}, {escape_sql(community)}, " \
+           f"{escape_sql(community_code)}, {latitude}, {longitude}, {accuracy}, 1)"
+
+
+def iter_synthetic_lines(rows, seed=42, previous=False):
+    """Generate synthetic GeoNames lines with a realistic mix of empty and quoted fields.
+    
+    previous=True yields an older snapshot of the same data for delta runs:
+    every 500th row is missing, every 100th has a different state and a few
+    extra rows exist that were removed later.
+    """
+    rng = random.Random(seed)
+    country_codes = list(convert_geonames.COUNTRY_NAMES) + ["XK", "GL"]
+    cities = ["Springfield", "O'Fallon", "Saint-Denis", "Zürich", "Köln", "L'Aquila", "Kraków"]
+    for i in range(rows):
+        country_code = rng.choice(country_codes)
+        fields = [
+            country_code,
+            f"{10000 + i % 90000}",
+            rng.choice(cities) if i % 7 == 0 else f"City {i % 5000}",
+            f"State {i % 60}",
+            f"S{i % 60}",
+            f"County {i % 300}" if i % 3 else "",
+            f"{i % 300:03d}" if i % 3 else "",
+            f"Community {i % 40}" if i % 11 == 0 else "",
+            f"{i % 40}" if i % 11 == 0 else "",
+            f"{rng.uniform(-90, 90):.4f}",
+            f"{rng.uniform(-180, 180):.4f}",
+            str(rng.randint(1, 6)) if i % 5 else "",
+        ]
+        if previous:
+            if i % 500 == 0:
+                continue
+            if i % 100 == 0:
+                fields[3] = f"Old State {i % 60}"
+            if i % 1000 == 1:
+                yield "\t".join([country_code, f"R{i}", "Removed Town"] + fields[3:]) + "\n"
+        yield "\t".join(fields) + "\n"
+
+
+def generate_lines(rows, seed=42):
+    """Synthetic GeoNames lines as a list, for in-memory formatter runs"""
+    return list(iter_synthetic_lines(rows, seed))
+
+
+def write_synthetic_file(path, rows, previous=False):
+    """Write a synthetic GeoNames file unless an identical one is already cached"""
+    if os.path.exists(path):
+        return path
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as outfile:
+        outfile.writelines(iter_synthetic_lines(rows, previous=previous))
+    os.replace(tmp_path, path)
+    return path
+
+
+def time_formatter(formatter, lines, repeat):
+    """Best-of-repeat wall time for formatting every line"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            formatter(line)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_formatter(args):
+    """Compare format_row against the reference implementation"""
+    lines = generate_lines(args.rows)
+    
+    mismatches = sum(1 for line in lines if convert_geonames.format_row(line) != reference_format_row(line))
+    if mismatches:
+        print(f"Error: {mismatches:,} rows differ from the reference formatter")
+        return 1
+    
+    reference_time = time_formatter(reference_format_row, lines, args.repeat)
+    current_time = time_formatter(convert_geonames.format_row, lines, args.repeat)
+    speedup = reference_time / current_time
+    
+    print(f"Rows:      {args.rows:,}")
+    print(f"Reference: {args.rows / reference_time:,.0f} rows/s")
+    print(f"Current:   {args.rows / current_time:,.0f} rows/s")
+    print(f"Speedup:   {speedup:.2f}x")
+    
+    if speedup < args.min_speedup:
+        print(f"Error: speedup below {args.min_speedup:.1f}x")
+        return 1
+    return 0
+
+
+# Converter modes exercised by the pipeline benchmark. Each entry maps a
+# mode name to a function(input_file, output_dir, previous_file, workers).
+PIPELINE_MODES = {
+    "sql": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_to_sql(
+        input_file, os.path.join(output_dir, "zipcodes.sql")),
+    "sql-workers": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_to_sql(
+        input_file, os.path.join(output_dir, "zipcodes.sql"), workers=workers),
+    "sql-gzip": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_to_sql(
+        input_file, os.path.join(output_dir, "zipcodes.sql.gz")),
+    "tsv": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_to_tsv(
+        input_file, os.path.join(output_dir, "zipcodes.tsv")),
+    "tsv-workers": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_to_tsv(
+        input_file, os.path.join(output_dir, "zipcodes.tsv"), workers=workers),
+    "sql-checkpoint": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_checkpointed(
+        input_file, os.path.join(output_dir, "segments")),
+    "partition": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_partitioned(
+        input_file, os.path.join(output_dir, "partitions")),
+    "delta": lambda input_file, output_dir, previous_file, workers: convert_geonames.convert_delta(
+        previous_file, input_file, os.path.join(output_dir, "delta.sql")),
+}
+
+PIPELINE_SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000, "5m": 5_000_000}
+
+
+def peak_rss_bytes():
+    """Peak RSS of this process and its (pool worker) children, in bytes"""
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def directory_size(path):
+    """Total size of every file below path"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def run_one(args):
+    """Child process entry point: run a single mode and print its measurements as JSON"""
+    os.makedirs(args.output_dir, exist_ok=True)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        PIPELINE_MODES[args.mode](args.input, args.output_dir, args.previous, args.workers)
+    elapsed = time.perf_counter() - start
+    
+    print(json.dumps({
+        "seconds": elapsed,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "output_bytes": directory_size(args.output_dir),
+    }))
+    return 0
+
+
+def run_pipeline(args):
+    """Run every requested size and mode, each in a fresh process"""
+    sizes = [size.strip().lower() for size in args.sizes.split(",") if size.strip()]
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()] if args.modes else list(PIPELINE_MODES)
+    for name in sizes:
+        if name not in PIPELINE_SIZES:
+            print(f"Error: unknown size {name} (choose from {', '.join(PIPELINE_SIZES)})")
+            return 1
+    for mode in modes:
+        if mode not in PIPELINE_MODES:
+            print(f"Error: unknown mode {mode} (choose from {', '.join(PIPELINE_MODES)})")
+            return 1
+    
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="geonames-bench-")
+    os.makedirs(work_dir, exist_ok=True)
+    
+    results = []
+    for name in sizes:
+        rows = PIPELINE_SIZES[name]
+        print(f"Generating {rows:,} synthetic rows...", file=sys.stderr)
+        input_file = write_synthetic_file(os.path.join(work_dir, f"allCountries-{name}.txt"), rows)
+        previous_file = write_synthetic_file(os.path.join(work_dir, f"allCountries-{name}.prev.txt"), rows,
+                                             previous=True)
+        input_bytes = os.path.getsize(input_file)
+        
+        for mode in modes:
+            output_dir = os.path.join(work_dir, f"out-{name}-{mode}")
+            shutil.rmtree(output_dir, ignore_errors=True)
+            
+            print(f"  {name} {mode}...", file=sys.stderr)
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "run-one", mode, input_file, output_dir,
+                 "--previous", previous_file, "--workers", str(args.workers)],
+                capture_output=True, text=True
+            )
+            if completed.returncode != 0:
+                print(completed.stderr, file=sys.stderr)
+                results.append({"size": name, "rows": rows, "mode": mode, "error": completed.stderr.strip()[-500:]})
+                continue
+            
+            measured = json.loads(completed.stdout.strip().splitlines()[-1])
+            seconds = measured["seconds"]
+            results.append({
+                "size": name,
+                "rows": rows,
+                "mode": mode,
+                "seconds": round(seconds, 3),
+                "rows_per_s": round(rows / seconds),
+                "mb_per_s": round(input_bytes / seconds / 1e6, 2),
+                "peak_rss_mb": round(measured["peak_rss_bytes"] / 1e6, 1),
+                "input_bytes": input_bytes,
+                "output_bytes": measured["output_bytes"],
+            })
+            
+            if not args.keep_output:
+                shutil.rmtree(output_dir, ignore_errors=True)
+    
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "workers": args.workers,
+        "results": results,
+    }
+    
+    text = json.dumps(report, indent=2)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as outfile:
+            outfile.write(text + "\n")
+        print(f"Results written to {args.json}", file=sys.stderr)
+    else:
+        print(text)
+    
+    if not args.work_dir:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 1 if any("error" in result for result in results) else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the GeoNames conversion pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    formatter = subparsers.add_parser("formatter", help="Compare format_row against the original implementation")
+    formatter.add_argument("--rows", type=int, default=200000, help="Synthetic rows to format")
+    formatter.add_argument("--repeat", type=int, default=3, help="Runs per formatter (best is reported)")
+    formatter.add_argument("--min-speedup", type=float, default=3.0,
+                           help="Exit non-zero if the speedup over the reference is lower")
+    formatter.set_defaults(func=run_formatter)
+    
+    pipeline = subparsers.add_parser("pipeline", help="Run the converter in every mode on synthetic files")
+    pipeline.add_argument("--sizes", default="10k,100k,1m,5m",
+                          help=f"Comma-separated sizes ({', '.join(PIPELINE_SIZES)})")
+    pipeline.add_argument("--modes", default=None,
+                          help=f"Comma-separated modes (default: all of {', '.join(PIPELINE_MODES)})")
+    pipeline.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                          help="Workers for the *-workers modes (default: CPU count)")
+    pipeline.add_argument("--work-dir", default=None,
+                          help="Directory for synthetic inputs; reused across runs (default: temporary)")
+    pipeline.add_argument("--keep-output", action="store_true", help="Keep converter output files")
+    pipeline.add_argument("--json", default=None, help="Write the JSON report here instead of stdout")
+    pipeline.set_defaults(func=run_pipeline)
+    
+    run_one_parser = subparsers.add_parser("run-one", help=argparse.SUPPRESS)
+    run_one_parser.add_argument("mode", choices=list(PIPELINE_MODES))
+    run_one_parser.add_argument("input")
+    run_one_parser.add_argument("output_dir")
+    run_one_parser.add_argument("--previous", default=None)
+    run_one_parser.add_argument("--workers", type=int, default=1)
+    run_one_parser.set_defaults(func=run_one)
+    
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,27 +16,394 @@ GeoNames format (tab-separated):
   11: accuracy
 """
 
-import sys
+import argparse
+import collections
+import contextlib
+import functools
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import multiprocessing
 import os
+import sys
+import zipfile
+
+from geohash_lookup import GEOHASH_PRECISION, encode as geohash_encode
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Country code to country name, built once at import time
+COUNTRY_NAMES = {
+    'US': 'United States', 'CA': 'Canada', 'GB': 'United Kingdom',
+    'AU': 'Australia', 'DE': 'Germany', 'FR': 'France', 'IT': 'Italy',
+    'ES': 'Spain', 'NL': 'Netherlands', 'BE': 'Belgium', 'CH': 'Switzerland',
+    'AT': 'Austria', 'IE': 'Ireland', 'NZ': 'New Zealand', 'MX': 'Mexico',
+    'BR': 'Brazil', 'AR': 'Argentina', 'IN': 'India', 'JP': 'Japan',
+    'CN': 'China', 'KR': 'South Korea', 'SG': 'Singapore', 'MY': 'Malaysia',
+    'PH': 'Philippines', 'TH': 'Thailand', 'VN': 'Vietnam', 'ID': 'Indonesia',
+    'ZA': 'South Africa', 'NG': 'Nigeria', 'EG': 'Egypt', 'AE': 'United Arab Emirates',
+    'SA': 'Saudi Arabia', 'IL': 'Israel', 'TR': 'Turkey', 'RU': 'Russia',
+    'PL': 'Poland', 'CZ': 'Czech Republic', 'HU': 'Hungary', 'RO': 'Romania',
+    'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark', 'FI': 'Finland',
+    'PT': 'Portugal', 'GR': 'Greece', 'HR': 'Croatia', 'SI': 'Slovenia',
+    'SK': 'Slovakia', 'BG': 'Bulgaria', 'LT': 'Lithuania', 'LV': 'Latvia',
+    'EE': 'Estonia', 'CY': 'Cyprus', 'MT': 'Malta', 'LU': 'Luxembourg',
+    'AD': 'Andorra', 'MC': 'Monaco', 'SM': 'San Marino', 'VA': 'Vatican City',
+    'CL': 'Chile', 'CO': 'Colombia', 'PE': 'Peru', 'VE': 'Venezuela',
+    'EC': 'Ecuador', 'UY': 'Uruguay', 'PY': 'Paraguay', 'BO': 'Bolivia',
+    'PA': 'Panama', 'CR': 'Costa Rica', 'GT': 'Guatemala', 'HN': 'Honduras',
+    'SV': 'El Salvador', 'NI': 'Nicaragua', 'DO': 'Dominican Republic',
+    'PR': 'Puerto Rico', 'JM': 'Jamaica', 'TT': 'Trinidad and Tobago',
+    'PK': 'Pakistan', 'BD': 'Bangladesh', 'LK': 'Sri Lanka', 'NP': 'Nepal',
+    'HK': 'Hong Kong', 'TW': 'Taiwan', 'MO': 'Macau'
+}
+
+# Number of columns in a GeoNames line (see the module docstring)
+GEONAMES_FIELDS = 12
 
 def escape_sql(value):
-    """Escape single quotes for SQL"""
+    """Escape single quotes and backslashes for SQL"""
     if not value:
         return "NULL"
-    return "'" + value.replace("'", "''").replace("\\", "\\\\") + "'"
+    # Most values contain neither character; skip the copies for them
+    if "'" in value or "\\" in value:
+        value = value.replace("'", "''").replace("\\", "\\\\")
+    return "'" + value + "'"
+
+ZIPCODE_COLUMNS = ("Country", "CountryCode", "PostalCode", "City", "State", "StateCode",
+                   "County", "CountyCode", "Community", "CommunityCode",
+                   "Latitude", "Longitude", "Accuracy", "IsActive")
+
+INSERT_HEADER = f"INSERT INTO ZipCodes ({', '.join(ZIPCODE_COLUMNS)}) VALUES\n"
+
+# With --geohash every row also carries a precomputed Geohash cell
+GEOHASH_COLUMNS = ZIPCODE_COLUMNS + ("Geohash",)
+
+GEOHASH_INSERT_HEADER = f"INSERT INTO ZipCodes ({', '.join(GEOHASH_COLUMNS)}) VALUES\n"
+
+# Secondary indexes on ZipCodes (see database/schema/002_master_data_tables.sql).
+# The bulk loader drops these before LOAD DATA and rebuilds them afterwards.
+ZIPCODE_SECONDARY_INDEXES = (
+    ("IX_ZipCodes_PostalCode", "INDEX", "`PostalCode`"),
+    ("IX_ZipCodes_Country", "INDEX", "`Country`"),
+    ("IX_ZipCodes_Country_PostalCode", "INDEX", "`Country`, `PostalCode`"),
+    ("IX_ZipCodes_City", "INDEX", "`City`"),
+    ("IX_ZipCodes_State", "INDEX", "`State`"),
+    ("FT_ZipCodes_City", "FULLTEXT INDEX", "`City`"),
+)
+
+GEOHASH_INDEX = ("IX_ZipCodes_Geohash", "INDEX", "`Geohash`")
+
+TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+COMPRESSED_INPUT_SUFFIXES = (".zip", ".gz", ".xz")
+
+# Output suffix for each --compress choice
+OUTPUT_COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+def is_compressed_input(input_file):
+    """True for inputs that are decompressed on the fly and cannot be seeked by byte offset"""
+    return input_file.lower().endswith(COMPRESSED_INPUT_SUFFIXES)
+
+def zip_member(archive, input_file):
+    """Pick the GeoNames data file inside a .zip (allCountries.zip ships a readme.txt too)"""
+    expected = os.path.splitext(os.path.basename(input_file))[0] + ".txt"
+    names = [name for name in archive.namelist()
+             if name.lower().endswith(".txt") and os.path.basename(name).lower() != "readme.txt"]
+    for name in names:
+        if os.path.basename(name) == expected:
+            return name
+    if len(names) != 1:
+        raise ValueError(f"Cannot choose a data file in {input_file}: {', '.join(names) or 'no .txt members'}")
+    return names[0]
+
+@contextlib.contextmanager
+def open_input(input_file, binary=False):
+    """Open a GeoNames file for streaming, decompressing .zip, .gz and .xz inputs on the fly"""
+    lower = input_file.lower()
+    if lower.endswith(".zip"):
+        with zipfile.ZipFile(input_file) as archive:
+            with archive.open(zip_member(archive, input_file)) as raw:
+                yield raw if binary else io.TextIOWrapper(raw, encoding='utf-8')
+    elif lower.endswith((".gz", ".xz")):
+        opener = gzip.open if lower.endswith(".gz") else lzma.open
+        if binary:
+            with opener(input_file, 'rb') as infile:
+                yield infile
+        else:
+            with opener(input_file, 'rt', encoding='utf-8') as infile:
+                yield infile
+    elif binary:
+        with open(input_file, 'rb') as infile:
+            yield infile
+    else:
+        with open(input_file, 'r', encoding='utf-8') as infile:
+            yield infile
+
+@contextlib.contextmanager
+def open_output(output_file, newline=None):
+    """Open a text output file, compressing to gzip (.gz) or zstd (.zst) based on its suffix"""
+    lower = output_file.lower()
+    if lower.endswith(".gz"):
+        with gzip.open(output_file, 'wt', encoding='utf-8', newline=newline, compresslevel=6) as outfile:
+            yield outfile
+    elif lower.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("zstd output requires the zstandard package (pip install zstandard)")
+        with open(output_file, 'wb') as raw:
+            writer = zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+            outfile = io.TextIOWrapper(writer, encoding='utf-8', newline=newline)
+            try:
+                yield outfile
+            finally:
+                # Closing the wrapper flushes it and ends the zstd frame
+                outfile.close()
+    else:
+        with open(output_file, 'w', encoding='utf-8', newline=newline) as outfile:
+            yield outfile
+
+def resolve_workers(input_file, workers):
+    """Parallel conversion seeks by byte offset, so compressed inputs are converted serially"""
+    if workers > 1 and is_compressed_input(input_file):
+        print(f"Note: --workers needs an uncompressed input; converting {os.path.basename(input_file)} serially")
+        return 1
+    return workers
+
+def count_lines(input_file, chunk_size=1024 * 1024):
+    """Count lines in a file without loading it into memory"""
+    count = 0
+    last_chunk = b""
+    with open_input(input_file, binary=True) as infile:
+        for chunk in iter(lambda: infile.read(chunk_size), b""):
+            count += chunk.count(b"\n")
+            last_chunk = chunk
+    # A final line without a trailing newline still counts as a record
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        count += 1
+    return count
 
-def convert_to_sql(input_file, output_file, batch_size=1000):
-    """Convert GeoNames data to SQL insert statements"""
+def parse_record(line):
+    """Parse one GeoNames line into a ZipCodes record tuple, or None if it should be skipped.
     
-    print(f"Reading {input_file}...")
+    The tuple follows ZIPCODE_COLUMNS minus IsActive.
+    """
+    parts = line.strip().split('\t')
+    if len(parts) != GEONAMES_FIELDS:
+        if len(parts) < 10:
+            return None
+        parts = (parts + ["", ""])[:GEONAMES_FIELDS]
+    
+    (country_code, postal_code, city, state, state_code, county, county_code,
+     community, community_code, latitude, longitude, accuracy) = parts
+    
+    # Skip records with empty required fields
+    if not country_code or not postal_code or not city:
+        return None
+    
+    try:
+        latitude = float(latitude) if latitude else 0
+        longitude = float(longitude) if longitude else 0
+        accuracy = int(accuracy) if accuracy else 1
+    except ValueError:
+        latitude = 0
+        longitude = 0
+        accuracy = 1
+    
+    return (COUNTRY_NAMES.get(country_code, country_code), country_code, postal_code, city,
+            state, state_code, county, county_code, community, community_code,
+            latitude, longitude, accuracy)
+
+def add_geohash(record):
+    """Append the geohash cell of a record; rows without coordinates get an empty (NULL) cell"""
+    latitude, longitude = record[10], record[11]
+    if not latitude and not longitude:
+        return record + ("",)
+    return record + (geohash_encode(latitude, longitude, GEOHASH_PRECISION),)
+
+def format_values(record):
+    """Format a parsed record (optionally with a geohash) as a SQL values tuple"""
+    (country, country_code, postal_code, city, state, state_code,
+     county, county_code, community, community_code, latitude, longitude, accuracy) = record[:13]
+    geohash = f", {escape_sql(record[13])}" if len(record) > 13 else ""
+    
+    return f"({escape_sql(country)}, {escape_sql(country_code)}, {escape_sql(postal_code)}, " \
+           f"{escape_sql(city)}, {escape_sql(state)}, {escape_sql(state_code)}, " \
+           f"{escape_sql(county)}, {escape_sql(county_code)}, {escape_sql(community)}, " \
+           f"{escape_sql(community_code)}, {latitude}, {longitude}, {accuracy}, 1{geohash})"
+
+def format_row(line, geohash=False):
+    """Convert one GeoNames line to a SQL values tuple, or None if it should be skipped"""
+    record = parse_record(line)
+    if record is None:
+        return None
+    
+    if geohash:
+        return format_values(add_geohash(record))
+    
+    # Rows with quotes or backslashes go through escape_sql; every other row
+    # only needs quoting, which is done inline without per-field calls
+    if "'" in line or "\\" in line:
+        return format_values(record)
+    
+    (country, country_code, postal_code, city, state, state_code,
+     county, county_code, community, community_code, latitude, longitude, accuracy) = record
+    
+    # Country, CountryCode, PostalCode and City are never empty here
+    state = f"'{state}'" if state else "NULL"
+    state_code = f"'{state_code}'" if state_code else "NULL"
+    county = f"'{county}'" if county else "NULL"
+    county_code = f"'{county_code}'" if county_code else "NULL"
+    community = f"'{community}'" if community else "NULL"
+    community_code = f"'{community_code}'" if community_code else "NULL"
+    
+    return f"('{country}', '{country_code}', '{postal_code}', '{city}', {state}, {state_code}, " \
+           f"{county}, {county_code}, {community}, {community_code}, {latitude}, {longitude}, {accuracy}, 1)"
+
+def escape_tsv(value):
+    """Escape a value for LOAD DATA INFILE with the default FIELDS ESCAPED BY '\\'"""
+    if not value:
+        return "\\N"
+    # Fields come from a stripped, tab-split line, so they cannot contain tabs
+    # or newlines; only backslashes and stray carriage returns need escaping
+    if "\\" in value or "\r" in value:
+        return value.translate(TSV_ESCAPES)
+    return value
+
+def format_tsv_values(record):
+    """Format a parsed record (optionally with a geohash) as a LOAD DATA INFILE row"""
+    text_fields = "\t".join(escape_tsv(value) for value in record[:10])
+    latitude, longitude, accuracy = record[10:13]
+    geohash = f"\t{escape_tsv(record[13])}" if len(record) > 13 else ""
+    return f"{text_fields}\t{latitude}\t{longitude}\t{accuracy}\t1{geohash}\n"
+
+def format_tsv_row(line, geohash=False):
+    """Convert one GeoNames line to a LOAD DATA INFILE row, or None if it should be skipped"""
+    record = parse_record(line)
+    if record is None:
+        return None
+    return format_tsv_values(add_geohash(record) if geohash else record)
+
+def format_partition_row(line, geohash=False):
+    """Convert one GeoNames line to a (country code, SQL values tuple) pair"""
+    record = parse_record(line)
+    if record is None:
+        return None
+    return record[1], format_values(add_geohash(record) if geohash else record)
+
+def format_partition_tsv_row(line, geohash=False):
+    """Convert one GeoNames line to a (country code, TSV row) pair"""
+    record = parse_record(line)
+    if record is None:
+        return None
+    return record[1], format_tsv_values(add_geohash(record) if geohash else record)
+
+def parse_countries(value):
+    """Parse a comma-separated list of country codes, or None for all countries"""
+    if not value:
+        return None
+    countries = {code.strip().upper() for code in value.split(",") if code.strip()}
+    return countries or None
+
+def line_in_countries(line, countries):
+    """Cheap country filter on the raw line, before any parsing"""
+    return countries is None or line.lstrip().partition('\t')[0] in countries
+
+def iter_rows(lines, formatter=format_row, countries=None):
+    """Lazily convert GeoNames lines with formatter, skipping invalid records.
+    
+    countries optionally restricts the output to a set of country codes.
+    """
+    for line in lines:
+        if not line_in_countries(line, countries):
+            continue
+        values = formatter(line)
+        if values is not None:
+            yield values
+
+def iter_batches(rows, batch_size):
+    """Group SQL values tuples into lists of at most batch_size"""
+    batch = []
+    for values in rows:
+        batch.append(values)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def split_chunks(input_file, chunk_bytes):
+    """Split a file into (start, end) byte ranges that begin and end on line boundaries"""
+    file_size = os.path.getsize(input_file)
+    chunks = []
+    start = 0
+    with open(input_file, 'rb') as infile:
+        while start < file_size:
+            infile.seek(min(start + chunk_bytes, file_size))
+            infile.readline()
+            end = min(infile.tell(), file_size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+def iter_chunk_rows(task):
+    """Convert one byte range of the input file, yielding formatted rows"""
+    input_file, start, end, formatter, countries = task
+    with open(input_file, 'rb') as infile:
+        infile.seek(start)
+        data = infile.read(end - start)
+    # Decode through TextIOWrapper so newline handling matches the serial path
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8')
+    yield from iter_rows(lines, formatter, countries)
+
+def convert_chunk(task):
+    """Worker entry point: convert one byte range of the input file to formatted rows"""
+    return list(iter_chunk_rows(task))
+
+def iter_rows_parallel(input_file, workers, chunk_bytes, formatter=format_row, countries=None):
+    """Convert the input in a process pool, yielding formatted rows in input order"""
+    tasks = [(input_file, start, end, formatter, countries)
+             for start, end in split_chunks(input_file, chunk_bytes)]
+    with multiprocessing.Pool(workers) as pool:
+        for rows in pool.imap(convert_chunk, tasks):
+            yield from rows
+
+def write_batch(outfile, batch, header=INSERT_HEADER):
+    """Write one multi-row INSERT statement"""
+    outfile.write(header)
+    outfile.write(",\n".join(batch))
+    outfile.write(";\n\n")
+
+def convert_to_sql(input_file, output_file, batch_size=1000, workers=1, chunk_bytes=8 * 1024 * 1024,
+                   countries=None, geohash=False):
+    """Convert GeoNames data to SQL insert statements.
+    
+    The input is streamed line by line and each batch is written as soon as it
+    is full, so memory use stays flat regardless of the input size.
     
-    with open(input_file, 'r', encoding='utf-8') as infile:
-        lines = infile.readlines()
+    With workers > 1 the input is split into byte-range chunks on line
+    boundaries and converted in a process pool. Chunks are merged back in
+    input order, so the output is byte-identical to the serial path.
     
-    total_records = len(lines)
+    countries optionally restricts the output to a set of country codes, and
+    geohash adds a precomputed Geohash column for indexed radius lookups.
+    """
+    
+    print(f"Reading {input_file}...")
+    
+    workers = resolve_workers(input_file, workers)
+    formatter = functools.partial(format_row, geohash=True) if geohash else format_row
+    header = GEOHASH_INSERT_HEADER if geohash else INSERT_HEADER
+    total_records = count_lines(input_file)
     print(f"Found {total_records:,} records")
     
-    with open(output_file, 'w', encoding='utf-8') as outfile:
+    record_count = 0
+    
+    with open_input(input_file) as infile, open_output(output_file) as outfile:
         # Write header
         outfile.write("-- GeoNames ZIP Code Data\n")
         outfile.write(f"-- Total Records: {total_records:,}\n")
@@ -49,101 +416,675 @@ def convert_to_sql(input_file, output_file, batch_size=1000):
         
         outfile.write("-- Insert ZIP code data\n")
         
-        batch = []
-        record_count = 0
+        if workers > 1:
+            rows = iter_rows_parallel(input_file, workers, chunk_bytes, formatter, countries)
+        else:
+            rows = iter_rows(infile, formatter, countries)
         
-        for line in lines:
-            parts = line.strip().split('\t')
-            if len(parts) < 10:
-                continue
-            
-            country_code = parts[0] if len(parts) > 0 else ""
-            postal_code = parts[1] if len(parts) > 1 else ""
-            city = parts[2] if len(parts) > 2 else ""
+        for batch in iter_batches(rows, batch_size):
+            write_batch(outfile, batch, header)
+            record_count += len(batch)
             
-            # Skip records with empty required fields
-            if not country_code or not postal_code or not city:
-                continue
-                
-            state = parts[3] if len(parts) > 3 else ""
-            state_code = parts[4] if len(parts) > 4 else ""
-            county = parts[5] if len(parts) > 5 else ""
-            county_code = parts[6] if len(parts) > 6 else ""
-            community = parts[7] if len(parts) > 7 else ""
-            community_code = parts[8] if len(parts) > 8 else ""
-            
-            try:
-                latitude = float(parts[9]) if len(parts) > 9 and parts[9] else 0
-                longitude = float(parts[10]) if len(parts) > 10 and parts[10] else 0
-                accuracy = int(parts[11]) if len(parts) > 11 and parts[11] else 1
-            except (ValueError, IndexError):
-                latitude = 0
-                longitude = 0
-                accuracy = 1
+            if record_count % 100000 == 0:
+                print(f"Processed {record_count:,} records...")
+        
+        outfile.write(f"\n-- Total records inserted: {record_count:,}\n")
+    
+    print(f"Conversion complete! {record_count:,} records written to {output_file}")
+    return record_count
+
+def write_load_driver(driver_file, tsv_file, geohash=False):
+    """Write the SQL driver that bulk loads a TSV file with LOAD DATA LOCAL INFILE.
+    
+    Secondary indexes are dropped before the load and rebuilt once afterwards,
+    so InnoDB builds each index with a single sort instead of per-row inserts.
+    The TSV path is relative to the directory the mysql client runs in.
+    """
+    tsv_name = os.path.basename(tsv_file)
+    columns = GEOHASH_COLUMNS if geohash else ZIPCODE_COLUMNS
+    indexes = ZIPCODE_SECONDARY_INDEXES + ((GEOHASH_INDEX,) if geohash else ())
+    btree_indexes = [index for index in indexes if index[1] == "INDEX"]
+    fulltext_indexes = [index for index in indexes if index[1] != "INDEX"]
+    
+    with open(driver_file, 'w', encoding='utf-8') as outfile:
+        outfile.write("-- GeoNames ZIP Code Data (bulk load)\n")
+        outfile.write(f"-- Loads {tsv_name} with LOAD DATA LOCAL INFILE.\n")
+        outfile.write("-- Run from this directory with: mysql --local-infile=1 <database> < "
+                      f"{os.path.basename(driver_file)}\n\n")
+        
+        outfile.write("SET SESSION unique_checks = 0;\n")
+        outfile.write("SET SESSION foreign_key_checks = 0;\n\n")
+        
+        outfile.write("-- Defer index maintenance until the load finishes\n")
+        outfile.write("ALTER TABLE ZipCodes\n")
+        outfile.write(",\n".join(f"  DROP INDEX IF EXISTS `{name}`" for name, _, _ in indexes))
+        outfile.write(";\n\n")
+        
+        outfile.write(f"LOAD DATA LOCAL INFILE '{tsv_name}'\n")
+        outfile.write("INTO TABLE ZipCodes\n")
+        outfile.write("CHARACTER SET utf8mb4\n")
+        outfile.write("FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'\n")
+        outfile.write("LINES TERMINATED BY '\\n'\n")
+        outfile.write(f"({', '.join(columns)});\n\n")
+        
+        outfile.write("-- Rebuild indexes\n")
+        outfile.write("ALTER TABLE ZipCodes\n")
+        outfile.write(",\n".join(f"  ADD {kind} IF NOT EXISTS `{name}` ({columns})"
+                                  for name, kind, columns in btree_indexes))
+        outfile.write(";\n")
+        # InnoDB can only build one FULLTEXT index per ALTER TABLE
+        for name, kind, columns in fulltext_indexes:
+            outfile.write(f"ALTER TABLE ZipCodes ADD {kind} IF NOT EXISTS `{name}` ({columns});\n")
+        
+        outfile.write("\nSET SESSION foreign_key_checks = 1;\n")
+        outfile.write("SET SESSION unique_checks = 1;\n")
+
+def convert_to_tsv(input_file, output_file, driver_file=None, workers=1, chunk_bytes=8 * 1024 * 1024,
+                   countries=None, geohash=False):
+    """Convert GeoNames data to a LOAD DATA INFILE compatible TSV plus a driver SQL file.
+    
+    Loading the TSV is a single server-side bulk operation instead of parsing
+    thousands of multi-row INSERT statements.
+    """
+    if driver_file is None:
+        driver_file = os.path.splitext(output_file)[0] + ".load.sql"
+    
+    print(f"Reading {input_file}...")
+    
+    workers = resolve_workers(input_file, workers)
+    formatter = functools.partial(format_tsv_row, geohash=True) if geohash else format_tsv_row
+    record_count = 0
+    
+    with open_input(input_file) as infile, \
+         open(output_file, 'w', encoding='utf-8', newline='\n') as outfile:
+        if workers > 1:
+            rows = iter_rows_parallel(input_file, workers, chunk_bytes, formatter, countries)
+        else:
+            rows = iter_rows(infile, formatter, countries)
+        
+        for row in rows:
+            outfile.write(row)
+            record_count += 1
             
-            # Map country code to country name
-            country_names = {
-                'US': 'United States', 'CA': 'Canada', 'GB': 'United Kingdom',
-                'AU': 'Australia', 'DE': 'Germany', 'FR': 'France', 'IT': 'Italy',
-                'ES': 'Spain', 'NL': 'Netherlands', 'BE': 'Belgium', 'CH': 'Switzerland',
-                'AT': 'Austria', 'IE': 'Ireland', 'NZ': 'New Zealand', 'MX': 'Mexico',
-                'BR': 'Brazil', 'AR': 'Argentina', 'IN': 'India', 'JP': 'Japan',
-                'CN': 'China', 'KR': 'South Korea', 'SG': 'Singapore', 'MY': 'Malaysia',
-                'PH': 'Philippines', 'TH': 'Thailand', 'VN': 'Vietnam', 'ID': 'Indonesia',
-                'ZA': 'South Africa', 'NG': 'Nigeria', 'EG': 'Egypt', 'AE': 'United Arab Emirates',
-                'SA': 'Saudi Arabia', 'IL': 'Israel', 'TR': 'Turkey', 'RU': 'Russia',
-                'PL': 'Poland', 'CZ': 'Czech Republic', 'HU': 'Hungary', 'RO': 'Romania',
-                'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark', 'FI': 'Finland',
-                'PT': 'Portugal', 'GR': 'Greece', 'HR': 'Croatia', 'SI': 'Slovenia',
-                'SK': 'Slovakia', 'BG': 'Bulgaria', 'LT': 'Lithuania', 'LV': 'Latvia',
-                'EE': 'Estonia', 'CY': 'Cyprus', 'MT': 'Malta', 'LU': 'Luxembourg',
-                'AD': 'Andorra', 'MC': 'Monaco', 'SM': 'San Marino', 'VA': 'Vatican City',
-                'CL': 'Chile', 'CO': 'Colombia', 'PE': 'Peru', 'VE': 'Venezuela',
-                'EC': 'Ecuador', 'UY': 'Uruguay', 'PY': 'Paraguay', 'BO': 'Bolivia',
-                'PA': 'Panama', 'CR': 'Costa Rica', 'GT': 'Guatemala', 'HN': 'Honduras',
-                'SV': 'El Salvador', 'NI': 'Nicaragua', 'DO': 'Dominican Republic',
-                'PR': 'Puerto Rico', 'JM': 'Jamaica', 'TT': 'Trinidad and Tobago',
-                'PK': 'Pakistan', 'BD': 'Bangladesh', 'LK': 'Sri Lanka', 'NP': 'Nepal',
-                'HK': 'Hong Kong', 'TW': 'Taiwan', 'MO': 'Macau'
+            if record_count % 100000 == 0:
+                print(f"Processed {record_count:,} records...")
+    
+    write_load_driver(driver_file, output_file, geohash)
+    
+    print(f"Conversion complete! {record_count:,} records written to {output_file}")
+    print(f"Bulk load driver written to {driver_file}")
+    return record_count
+
+class PartitionWriter:
+    """Writes one output file per country code, batching rows per country"""
+    
+    def __init__(self, output_dir, output_format, batch_size, compression_suffix="", geohash=False):
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.batch_size = batch_size
+        self.compression_suffix = compression_suffix
+        self.geohash = geohash
+        self.header = GEOHASH_INSERT_HEADER if geohash else INSERT_HEADER
+        self.exit_stack = contextlib.ExitStack()
+        self.files = {}
+        self.batches = {}
+        self.counts = {}
+    
+    def partition_path(self, country_code):
+        return os.path.join(self.output_dir,
+                            f"ZipCodes_{country_code}.{self.output_format}{self.compression_suffix}")
+    
+    def _open(self, country_code):
+        outfile = self.exit_stack.enter_context(open_output(self.partition_path(country_code), newline='\n'))
+        if self.output_format == "sql":
+            outfile.write(f"-- GeoNames ZIP Code Data ({country_code})\n")
+            outfile.write("-- Source: https://download.geonames.org/export/zip/allCountries.zip\n")
+            outfile.write("-- License: Creative Commons Attribution 4.0\n\n")
+            outfile.write("-- Insert ZIP code data\n")
+        self.files[country_code] = outfile
+        self.batches[country_code] = []
+        self.counts[country_code] = 0
+        return outfile
+    
+    def write(self, country_code, row):
+        outfile = self.files.get(country_code) or self._open(country_code)
+        self.counts[country_code] += 1
+        
+        if self.output_format == "tsv":
+            outfile.write(row)
+            return
+        
+        batch = self.batches[country_code]
+        batch.append(row)
+        if len(batch) >= self.batch_size:
+            write_batch(outfile, batch, self.header)
+            self.batches[country_code] = []
+    
+    def close(self):
+        """Flush pending batches, close every partition and return the manifest entries"""
+        if self.output_format == "sql":
+            for country_code, outfile in self.files.items():
+                if self.batches[country_code]:
+                    write_batch(outfile, self.batches[country_code], self.header)
+                outfile.write(f"\n-- Total records inserted: {self.counts[country_code]:,}\n")
+        self.exit_stack.close()
+        
+        partitions = []
+        for country_code in sorted(self.files):
+            path = self.partition_path(country_code)
+            entry = {
+                "country_code": country_code,
+                "file": os.path.basename(path),
+                "records": self.counts[country_code],
+                "bytes": os.path.getsize(path),
             }
+            if self.output_format == "tsv":
+                driver_file = os.path.splitext(path)[0] + ".load.sql"
+                write_load_driver(driver_file, path, self.geohash)
+                entry["driver"] = os.path.basename(driver_file)
+            partitions.append(entry)
+        return partitions
+
+def convert_partitioned(input_file, output_dir, output_format="sql", batch_size=1000, workers=1,
+                        chunk_bytes=8 * 1024 * 1024, countries=None, compression="none", geohash=False):
+    """Convert GeoNames data into one file per country code plus a manifest.json.
+    
+    Deployments can then load only the partitions they need. Rows are still
+    streamed; only one pending batch per country is held in memory.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    formatter = format_partition_tsv_row if output_format == "tsv" else format_partition_row
+    if geohash:
+        formatter = functools.partial(formatter, geohash=True)
+    
+    print(f"Reading {input_file}...")
+    
+    workers = resolve_workers(input_file, workers)
+    writer = PartitionWriter(output_dir, output_format, batch_size, OUTPUT_COMPRESSION_SUFFIXES[compression],
+                             geohash)
+    record_count = 0
+    
+    try:
+        with open_input(input_file) as infile:
+            if workers > 1:
+                rows = iter_rows_parallel(input_file, workers, chunk_bytes, formatter, countries)
+            else:
+                rows = iter_rows(infile, formatter, countries)
             
-            country = country_names.get(country_code, country_code)
-            
-            values = f"({escape_sql(country)}, {escape_sql(country_code)}, {escape_sql(postal_code)}, " \
-                    f"{escape_sql(city)}, {escape_sql(state)}, {escape_sql(state_code)}, " \
-                    f"{escape_sql(county)}, {escape_sql(county_code)}, {escape_sql(community)}, " \
-                    f"{escape_sql(community_code)}, {latitude}, {longitude}, {accuracy}, 1)"
-            
-            batch.append(values)
-            record_count += 1
-            
-            if len(batch) >= batch_size:
-                outfile.write("INSERT INTO ZipCodes (Country, CountryCode, PostalCode, City, State, StateCode, County, CountyCode, Community, CommunityCode, Latitude, Longitude, Accuracy, IsActive) VALUES\n")
-                outfile.write(",\n".join(batch))
-                outfile.write(";\n\n")
-                batch = []
+            for country_code, row in rows:
+                writer.write(country_code, row)
+                record_count += 1
                 
                 if record_count % 100000 == 0:
                     print(f"Processed {record_count:,} records...")
+    finally:
+        partitions = writer.close()
+    
+    manifest = {
+        "format": output_format,
+        "compression": compression,
+        "geohash": geohash,
+        "source": os.path.basename(input_file),
+        "total_records": record_count,
+        "partitions": partitions,
+    }
+    manifest_file = os.path.join(output_dir, "manifest.json")
+    with open(manifest_file, 'w', encoding='utf-8') as outfile:
+        json.dump(manifest, outfile, indent=2)
+        outfile.write("\n")
+    
+    print(f"Conversion complete! {record_count:,} records written to {len(partitions)} partitions in {output_dir}")
+    return manifest
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+def write_json_atomic(path, data):
+    """Write a JSON file through a temporary file and an atomic rename"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as outfile:
+        json.dump(data, outfile, indent=2)
+        outfile.write("\n")
+        outfile.flush()
+        os.fsync(outfile.fileno())
+    os.replace(temp_path, path)
+
+def load_checkpoint(checkpoint_file, settings):
+    """Return the saved checkpoint if it was written for the same input and settings, else None"""
+    try:
+        with open(checkpoint_file, encoding='utf-8') as infile:
+            checkpoint = json.load(infile)
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get("settings") != settings:
+        print("Note: checkpoint was written for a different input or settings, starting over")
+        return None
+    return checkpoint
+
+def remove_segments(output_dir):
+    """Delete the segment files of an earlier run, whatever their compression suffix,
+    and any half-written temporaries, so a fresh run leaves only its own segments"""
+    removed = 0
+    for name in os.listdir(output_dir):
+        if name.startswith(("segment_", ".segment_")) and ".sql" in name:
+            os.remove(os.path.join(output_dir, name))
+            removed += 1
+    return removed
+
+def write_segment(path, task, header, batch_size):
+    """Write one segment through a hidden temporary file, then rename it into place.
+    
+    The temporary name starts with a dot so '*.sql' globs never pick up a
+    half-written segment. Returns the number of records written.
+    """
+    temp_path = os.path.join(os.path.dirname(path), "." + os.path.basename(path))
+    input_file, start, end = task[:3]
+    record_count = 0
+    
+    with open_output(temp_path) as outfile:
+        outfile.write("-- GeoNames ZIP Code Data (segment)\n")
+        outfile.write(f"-- Input bytes: {start:,}-{end:,}\n")
+        outfile.write("-- Source: https://download.geonames.org/export/zip/allCountries.zip\n")
+        outfile.write("-- License: Creative Commons Attribution 4.0\n\n")
         
-        # Write remaining batch
-        if batch:
-            outfile.write("INSERT INTO ZipCodes (Country, CountryCode, PostalCode, City, State, StateCode, County, CountyCode, Community, CommunityCode, Latitude, Longitude, Accuracy, IsActive) VALUES\n")
-            outfile.write(",\n".join(batch))
-            outfile.write(";\n\n")
+        for batch in iter_batches(iter_chunk_rows(task), batch_size):
+            write_batch(outfile, batch, header)
+            record_count += len(batch)
         
-        outfile.write(f"\n-- Total records inserted: {record_count:,}\n")
+        outfile.write(f"\n-- Segment records inserted: {record_count:,}\n")
     
-    print(f"Conversion complete! {record_count:,} records written to {output_file}")
+    with open(temp_path, 'rb') as segment:
+        os.fsync(segment.fileno())
+    os.replace(temp_path, path)
     return record_count
 
-if __name__ == "__main__":
+def convert_segment(job):
+    """Worker entry point: write one segment file"""
+    return write_segment(*job)
+
+def convert_checkpointed(input_file, output_dir, batch_size=1000, workers=1, segment_bytes=16 * 1024 * 1024,
+                         countries=None, compression="none", geohash=False):
+    """Convert GeoNames data to numbered SQL segment files that can be resumed.
+    
+    Each segment covers one byte range of the input and is renamed into place
+    only once it is complete. After every segment checkpoint.json records the
+    input byte offset reached, so a rerun after a crash or preemption resumes
+    there instead of starting over. Load the segments in file name order.
+    
+    With workers > 1 segments are written in a process pool; the checkpoint
+    still only advances past segments whose predecessors are all finished.
+    """
+    if is_compressed_input(input_file):
+        raise ValueError("checkpointed conversion needs an uncompressed input (byte offsets)")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    formatter = functools.partial(format_row, geohash=True) if geohash else format_row
+    header = GEOHASH_INSERT_HEADER if geohash else INSERT_HEADER
+    suffix = OUTPUT_COMPRESSION_SUFFIXES[compression]
+    checkpoint_file = os.path.join(output_dir, CHECKPOINT_FILE)
+    
+    stat = os.stat(input_file)
+    settings = {
+        "source": os.path.abspath(input_file),
+        "source_bytes": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "segment_bytes": segment_bytes,
+        "batch_size": batch_size,
+        "countries": sorted(countries) if countries else None,
+        "compression": compression,
+        "geohash": geohash,
+    }
+    checkpoint = load_checkpoint(checkpoint_file, settings)
+    if checkpoint is None:
+        removed = remove_segments(output_dir)
+        if removed:
+            print(f"Removed {removed} segment files of an earlier run")
+        checkpoint = {
+            "settings": settings,
+            "offset": 0,
+            "total_records": 0,
+            "segments": [],
+            "complete": False,
+        }
+    if checkpoint["complete"]:
+        print(f"Already complete: {checkpoint['total_records']:,} records in {output_dir}")
+        return checkpoint
+    if checkpoint["offset"]:
+        print(f"Resuming {input_file} at byte {checkpoint['offset']:,} "
+              f"({len(checkpoint['segments'])} segments done)")
+    else:
+        print(f"Reading {input_file}...")
+    
+    # split_chunks is deterministic for a given file and segment size, so the
+    # chunks before the checkpointed offset are exactly the finished segments
+    chunks = [(start, end) for start, end in split_chunks(input_file, segment_bytes)
+              if start >= checkpoint["offset"]]
+    first = len(checkpoint["segments"]) + 1
+    names = [f"segment_{index:05d}.sql{suffix}" for index in range(first, first + len(chunks))]
+    jobs = [(os.path.join(output_dir, name), (input_file, start, end, formatter, countries), header, batch_size)
+            for name, (start, end) in zip(names, chunks)]
+    
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            pool = stack.enter_context(multiprocessing.Pool(workers))
+            results = pool.imap(convert_segment, jobs)
+        else:
+            results = map(convert_segment, jobs)
+        
+        for name, (start, end), records in zip(names, chunks, results):
+            checkpoint["segments"].append({"file": name, "start": start, "end": end, "records": records})
+            checkpoint["offset"] = end
+            checkpoint["total_records"] += records
+            write_json_atomic(checkpoint_file, checkpoint)
+            print(f"Segment {len(checkpoint['segments'])}: {end:,}/{stat.st_size:,} bytes, "
+                  f"{checkpoint['total_records']:,} records")
+    
+    checkpoint["complete"] = True
+    write_json_atomic(checkpoint_file, checkpoint)
+    
+    print(f"Conversion complete! {checkpoint['total_records']:,} records written to "
+          f"{len(checkpoint['segments'])} segments in {output_dir}")
+    return checkpoint
+
+def _hash64(text):
+    """64-bit content hash used to compare snapshots"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+DELTA_KEY_COLUMNS = ("CountryCode", "PostalCode", "City")
+
+def record_key(record):
+    """Delta match key: (CountryCode, PostalCode, City)"""
+    return f"{record[1]}\t{record[2]}\t{record[3]}"
+
+def record_hash(record):
+    """Hash of every GeoNames column of a parsed record (the derived geohash is ignored)"""
+    return _hash64("\x1f".join(str(value) for value in record[:13]))
+
+def iter_records(input_file, countries=None, geohash=False):
+    """Stream parsed records (optionally with their geohash) from a GeoNames file"""
+    with open_input(input_file) as infile:
+        for line in infile:
+            if not line_in_countries(line, countries):
+                continue
+            record = parse_record(line)
+            if record is not None:
+                yield add_geohash(record) if geohash else record
+
+def load_snapshot_hashes(input_file, countries=None):
+    """Map hashed match keys to (row count, multiset hash) for a GeoNames snapshot.
+    
+    Several rows can share a key (one postal code and city in two counties),
+    so all rows of a key are hashed together: their row hashes are summed,
+    which does not depend on the row order. Only three integers are kept per
+    key, so a snapshot never has to be held in memory.
+    """
+    hashes = {}
+    for record in iter_records(input_file, countries):
+        key = _hash64(record_key(record))
+        count, total = hashes.get(key, (0, 0))
+        hashes[key] = (count + 1, (total + record_hash(record)) & 0xFFFFFFFFFFFFFFFF)
+    return hashes
+
+def key_condition(record):
+    """WHERE clause matching a record on its delta key"""
+    return f"CountryCode = {escape_sql(record[1])} AND PostalCode = {escape_sql(record[2])} " \
+           f"AND City = {escape_sql(record[3])}"
+
+def content_condition(record):
+    """WHERE clause matching a record on its key and every other GeoNames column"""
+    values = [escape_sql(value) for value in record[:10]] + [str(value) for value in record[10:13]]
+    others = " AND ".join(f"{column} <=> {value}" for column, value in zip(ZIPCODE_COLUMNS, values)
+                          if column not in DELTA_KEY_COLUMNS)
+    return f"{key_condition(record)} AND {others}"
+
+def format_update(record):
+    """UPDATE statement that brings the existing (only) row of a key in line with record"""
+    values = [escape_sql(value) for value in record[:10]] + [str(value) for value in record[10:13]]
+    columns = ZIPCODE_COLUMNS[:13]
+    if len(record) > 13:
+        values.append(escape_sql(record[13]))
+        columns += ("Geohash",)
+    # Key columns are matched in the WHERE clause and never change
+    assignments = ", ".join(f"{column} = {value}" for column, value in zip(columns, values)
+                            if column not in DELTA_KEY_COLUMNS)
+    return f"UPDATE ZipCodes SET {assignments} WHERE {key_condition(record)} AND IsActive = 1;\n"
+
+def format_deactivate(record):
+    """Soft-delete statement for all rows of a key that is no longer in the dataset"""
+    return f"UPDATE ZipCodes SET IsActive = 0 WHERE {key_condition(record)};\n"
+
+def format_deactivate_row(record):
+    """Soft-delete statement for one row of a key that has other rows left"""
+    return f"UPDATE ZipCodes SET IsActive = 0 WHERE {content_condition(record)} AND IsActive = 1 LIMIT 1;\n"
+
+# New keys are staged here and merged at the end of a delta, so keys that an
+# earlier refresh soft-deleted are reactivated instead of inserted twice
+DELTA_STAGING_TABLE = "ZipCodesDelta"
+# Staged row -> the soft-deleted ZipCodes row it reactivates
+DELTA_REACTIVATE_TABLE = "ZipCodesReactivate"
+
+def format_staging_table(geohash=False):
+    """CREATE statement for the staging table.
+    
+    Not LIKE ZipCodes: that would copy its FULLTEXT index, which InnoDB
+    temporary tables reject. CREATE ... SELECT copies the column types only;
+    StageId numbers the staged rows so each one can be paired with at most one
+    soft-deleted row.
+    """
+    column_list = ", ".join(GEOHASH_COLUMNS if geohash else ZIPCODE_COLUMNS)
+    return (f"CREATE TEMPORARY TABLE {DELTA_STAGING_TABLE} (StageId int NOT NULL AUTO_INCREMENT PRIMARY KEY)\n"
+            f"SELECT {column_list} FROM ZipCodes WHERE 1 = 0;\n")
+
+def format_staging_merge(geohash=False):
+    """SQL that moves staged rows into ZipCodes, reactivating soft-deleted rows of the same key.
+    
+    The n-th staged row of a key reactivates the n-th soft-deleted row of that
+    key (by Id), so one staged row never revives two old ones; staged rows
+    left without a partner are inserted.
+    """
+    columns = GEOHASH_COLUMNS if geohash else ZIPCODE_COLUMNS
+    key_list = ", ".join(DELTA_KEY_COLUMNS)
+    key_join = " AND ".join(f"z.{column} = d.{column}" for column in DELTA_KEY_COLUMNS)
+    assignments = ", ".join(f"z.{column} = d.{column}" for column in columns
+                            if column not in DELTA_KEY_COLUMNS and column != "IsActive")
+    column_list = ", ".join(columns)
+    return (f"-- Keys soft-deleted by an earlier refresh come back: pair each staged row\n"
+            f"-- with at most one of their rows and reactivate it\n"
+            f"CREATE TEMPORARY TABLE {DELTA_REACTIVATE_TABLE} (StageId int NOT NULL PRIMARY KEY, Id int NOT NULL)\n"
+            f"SELECT d.StageId, z.Id FROM\n"
+            f"  (SELECT StageId, {key_list}, ROW_NUMBER() OVER (PARTITION BY {key_list} ORDER BY StageId) AS Pos\n"
+            f"   FROM {DELTA_STAGING_TABLE}) d\n"
+            f"JOIN\n"
+            f"  (SELECT Id, {key_list}, ROW_NUMBER() OVER (PARTITION BY {key_list} ORDER BY Id) AS Pos\n"
+            f"   FROM ZipCodes WHERE IsActive = 0) z\n"
+            f"ON {key_join} AND z.Pos = d.Pos;\n\n"
+            f"UPDATE ZipCodes z JOIN {DELTA_REACTIVATE_TABLE} r ON r.Id = z.Id\n"
+            f"JOIN {DELTA_STAGING_TABLE} d ON d.StageId = r.StageId\n"
+            f"SET {assignments}, z.IsActive = 1;\n\n"
+            f"INSERT INTO ZipCodes ({column_list})\n"
+            f"SELECT {column_list} FROM {DELTA_STAGING_TABLE} d\n"
+            f"WHERE NOT EXISTS (SELECT 1 FROM {DELTA_REACTIVATE_TABLE} r WHERE r.StageId = d.StageId);\n\n"
+            f"DROP TEMPORARY TABLE {DELTA_REACTIVATE_TABLE};\n"
+            f"DROP TEMPORARY TABLE {DELTA_STAGING_TABLE};\n")
+
+def convert_delta(previous_file, input_file, output_file, batch_size=1000, countries=None, geohash=False):
+    """Write only the changes between two GeoNames snapshots.
+    
+    Rows are matched on (CountryCode, PostalCode, City):
+    - keys missing from the previous snapshot are staged with batched INSERTs
+      and merged at the end, reactivating rows an earlier refresh soft-deleted
+    - a changed key with one row in both snapshots becomes an UPDATE
+    - a changed key with several rows in either snapshot is diffed row by row:
+      rows only in the new snapshot are inserted and rows only in the previous
+      one are soft-deleted by their full content, so row Ids stay stable
+    - keys missing from the new snapshot are soft-deleted with IsActive = 0
+    Both snapshots are streamed; only per-key hashes are held in memory.
+    """
+    print(f"Hashing previous snapshot {previous_file}...")
+    previous = load_snapshot_hashes(previous_file, countries)
+    print(f"Found {len(previous):,} previous keys")
+    
+    print(f"Hashing {input_file}...")
+    current = load_snapshot_hashes(input_file, countries)
+    print(f"Found {len(current):,} keys")
+    
+    changed = {key for key, value in current.items() if key in previous and previous[key] != value}
+    multi_row = {key for key in changed if previous[key][0] > 1 or current[key][0] > 1}
+    has_new_keys = any(key not in previous for key in current)
+    
+    # Row hash -> occurrences in the previous snapshot, for the keys diffed row by row
+    old_rows = {key: collections.Counter() for key in multi_row}
+    if multi_row:
+        for record in iter_records(previous_file, countries):
+            key = _hash64(record_key(record))
+            if key in old_rows:
+                old_rows[key][record_hash(record)] += 1
+    
+    header = GEOHASH_INSERT_HEADER if geohash else INSERT_HEADER
+    staging_header = header.replace("INSERT INTO ZipCodes ", f"INSERT INTO {DELTA_STAGING_TABLE} ", 1)
+    inserted = updated = unchanged = deactivated = 0
+    
+    with open_output(output_file) as outfile:
+        outfile.write("-- GeoNames ZIP Code Data (delta)\n")
+        outfile.write(f"-- Previous snapshot: {os.path.basename(previous_file)}\n")
+        outfile.write("-- Source: https://download.geonames.org/export/zip/allCountries.zip\n")
+        outfile.write("-- License: Creative Commons Attribution 4.0\n\n")
+        
+        outfile.write("START TRANSACTION;\n\n")
+        if has_new_keys:
+            outfile.write(format_staging_table(geohash) + "\n")
+        
+        print(f"Reading {input_file}...")
+        staged, batch = [], []
+        for record in iter_records(input_file, countries, geohash):
+            key = _hash64(record_key(record))
+            if key not in previous:
+                staged.append(format_values(record))
+                inserted += 1
+                if len(staged) >= batch_size:
+                    write_batch(outfile, staged, staging_header)
+                    staged = []
+            elif key in multi_row:
+                row = record_hash(record)
+                if old_rows[key][row]:
+                    old_rows[key][row] -= 1
+                    unchanged += 1
+                else:
+                    batch.append(format_values(record))
+                    inserted += 1
+                    if len(batch) >= batch_size:
+                        write_batch(outfile, batch, header)
+                        batch = []
+            elif key in changed:
+                outfile.write(format_update(record))
+                updated += 1
+            else:
+                unchanged += 1
+        
+        if staged:
+            write_batch(outfile, staged, staging_header)
+        if batch:
+            write_batch(outfile, batch, header)
+        
+        print("Checking previous snapshot for removed records...")
+        for record in iter_records(previous_file, countries):
+            key = _hash64(record_key(record))
+            if key not in current:
+                # All rows of the key go at once; later rows of it are skipped
+                if previous.pop(key, None) is not None:
+                    outfile.write(format_deactivate(record))
+                    deactivated += 1
+            elif key in multi_row:
+                row = record_hash(record)
+                if old_rows[key][row]:
+                    old_rows[key][row] -= 1
+                    outfile.write(format_deactivate_row(record))
+                    deactivated += 1
+        
+        if has_new_keys:
+            outfile.write("\n" + format_staging_merge(geohash))
+        
+        outfile.write("\nCOMMIT;\n")
+        outfile.write(f"\n-- Inserted: {inserted:,}, Updated: {updated:,}, "
+                      f"Deactivated: {deactivated:,}, Unchanged: {unchanged:,}\n")
+    
+    print(f"Delta complete! {inserted:,} inserted, {updated:,} updated, "
+          f"{deactivated:,} deactivated, {unchanged:,} unchanged")
+    return {"inserted": inserted, "updated": updated, "deactivated": deactivated, "unchanged": unchanged}
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, "allCountries.txt")
-    output_file = os.path.join(script_dir, "002_geonames_zipcodes.sql")
+    parser = argparse.ArgumentParser(description="Convert GeoNames ZIP code data to SQL for the CRM database")
+    parser.add_argument("--input", default=os.path.join(script_dir, "allCountries.txt"),
+                        help="GeoNames allCountries.txt file (.zip, .gz and .xz are read directly)")
+    parser.add_argument("--output", default=None,
+                        help="Output file (default: 002_geonames_zipcodes.sql, or .tsv with --format tsv)")
+    parser.add_argument("--format", choices=("sql", "tsv"), default="sql",
+                        help="sql: multi-row INSERTs; tsv: LOAD DATA INFILE file plus .load.sql driver")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT statement")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes (default: 1, serial)")
+    parser.add_argument("--previous", default=None,
+                        help="Previous allCountries.txt snapshot; writes only INSERT/UPDATE/soft-delete changes")
+    parser.add_argument("--countries", default=None,
+                        help="Comma-separated country codes to convert, e.g. US,CA,GB (default: all)")
+    parser.add_argument("--partition-dir", default=None,
+                        help="Write one file per country code plus manifest.json into this directory")
+    parser.add_argument("--checkpoint-dir", default=None,
+                        help="Write resumable SQL segment files plus checkpoint.json into this directory; "
+                             "rerun the same command to resume")
+    parser.add_argument("--segment-mb", type=int, default=16,
+                        help="Input megabytes per segment with --checkpoint-dir (default: 16)")
+    parser.add_argument("--geohash", action="store_true",
+                        help="Add a precomputed Geohash column (requires the ZipCodes.Geohash column)")
+    parser.add_argument("--compress", choices=sorted(OUTPUT_COMPRESSION_SUFFIXES), default="none",
+                        help="Compress SQL output (gzip or zstd); an output ending in .gz/.zst is compressed too")
+    args = parser.parse_args(argv)
+    if args.output is None:
+        args.output = os.path.join(script_dir, f"002_geonames_zipcodes.{args.format}")
     
-    if not os.path.exists(input_file):
-        print(f"Error: {input_file} not found!")
+    suffix = OUTPUT_COMPRESSION_SUFFIXES[args.compress]
+    if suffix and not args.output.endswith(suffix):
+        args.output += suffix
+    
+    if args.format == "tsv" and (args.compress != "none" or args.output.endswith((".gz", ".zst"))):
+        parser.error("LOAD DATA INFILE needs an uncompressed TSV; --compress only applies to SQL output")
+    if args.previous and args.format != "sql":
+        parser.error("--previous writes SQL statements; it cannot be combined with --format tsv")
+    if args.checkpoint_dir and (args.format != "sql" or args.previous or args.partition_dir):
+        parser.error("--checkpoint-dir only applies to full SQL conversion")
+    if args.checkpoint_dir and is_compressed_input(args.input):
+        parser.error("--checkpoint-dir needs an uncompressed input; resuming relies on byte offsets")
+    if (args.compress == "zstd" or args.output.endswith(".zst")) and zstandard is None:
+        parser.error("zstd output requires the zstandard package (pip install zstandard)")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    
+    if not os.path.exists(args.input):
+        print(f"Error: {args.input} not found!")
         sys.exit(1)
     
-    convert_to_sql(input_file, output_file)
+    countries = parse_countries(args.countries)
+    
+    if args.checkpoint_dir:
+        convert_checkpointed(args.input, args.checkpoint_dir, batch_size=args.batch_size, workers=args.workers,
+                             segment_bytes=args.segment_mb * 1024 * 1024, countries=countries,
+                             compression=args.compress, geohash=args.geohash)
+    elif args.partition_dir:
+        convert_partitioned(args.input, args.partition_dir, args.format, batch_size=args.batch_size,
+                            workers=args.workers, countries=countries, compression=args.compress,
+                            geohash=args.geohash)
+    elif args.previous:
+        if not os.path.exists(args.previous):
+            print(f"Error: {args.previous} not found!")
+            sys.exit(1)
+        convert_delta(args.previous, args.input, args.output, batch_size=args.batch_size,
+                      countries=countries, geohash=args.geohash)
+    elif args.format == "tsv":
+        convert_to_tsv(args.input, args.output, workers=args.workers, countries=countries,
+                       geohash=args.geohash)
+    else:
+        convert_to_sql(args.input, args.output, batch_size=args.batch_size, workers=args.workers,
+                       countries=countries, geohash=args.geohash)
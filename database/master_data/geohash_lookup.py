@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Geohash encoding and radius lookup for ZipCodes.
+
+convert_geonames.py --geohash stores a geohash per row in ZipCodes.Geohash.
+A radius or nearest query is then answered by a handful of indexed prefix
+range scans (Geohash LIKE 'dr5r%') followed by an exact distance check on
+the small candidate set, instead of a scan over Latitude/Longitude.
+
+This module is the pure-Python reference for that lookup:
+  covering_cells()  geohash prefixes that cover a circle
+  sql_condition()   the matching WHERE clause for ZipCodes
+  GeohashIndex      in-memory index over precomputed rows (e.g. the
+                    converter's --format tsv --geohash output)
+
+Usage:
+  python3 geohash_lookup.py 002_geonames_zipcodes.tsv 40.7128 -74.0060 5
+"""
+
+import argparse
+import bisect
+import math
+import sys
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Precision stored by the converter: 9 characters is a cell of about 5m x 5m
+GEOHASH_PRECISION = 9
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def encode(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Encode a coordinate as a geohash string"""
+    lat_low, lat_high = -90.0, 90.0
+    lon_low, lon_high = -180.0, 180.0
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            middle = (lon_low + lon_high) / 2
+            if longitude >= middle:
+                value = value * 2 + 1
+                lon_low = middle
+            else:
+                value *= 2
+                lon_high = middle
+        else:
+            middle = (lat_low + lat_high) / 2
+            if latitude >= middle:
+                value = value * 2 + 1
+                lat_low = middle
+            else:
+                value *= 2
+                lat_high = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def cell_size(precision):
+    """(height, width) of a geohash cell in degrees"""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in kilometres"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """(lat_min, lat_max, lon_min, lon_max) around a circle; longitudes may exceed +/-180"""
+    d_lat = radius_km / KM_PER_DEGREE
+    lat_min = max(-90.0, latitude - d_lat)
+    lat_max = min(90.0, latitude + d_lat)
+    
+    widest = max(abs(lat_min), abs(lat_max))
+    if widest >= 89.9:
+        # The circle reaches a pole: every longitude is in range
+        return lat_min, lat_max, -180.0, 180.0
+    d_lon = radius_km / (KM_PER_DEGREE * math.cos(math.radians(widest)))
+    if d_lon >= 180:
+        return lat_min, lat_max, -180.0, 180.0
+    return lat_min, lat_max, longitude - d_lon, longitude + d_lon
+
+
+def _steps(low, high, step):
+    """Sample points from low to high so that every cell of size step is hit"""
+    points = []
+    value = low
+    while value < high:
+        points.append(value)
+        value += step
+    points.append(high)
+    return points
+
+
+def covering_cells(latitude, longitude, radius_km, max_cells=16, max_precision=GEOHASH_PRECISION):
+    """Sorted geohash prefixes whose cells together cover the circle.
+    
+    Uses the finest precision (at most max_precision) that needs no more
+    than max_cells cells, so each query becomes at most max_cells prefix
+    range scans.
+    """
+    lat_min, lat_max, lon_min, lon_max = bounding_box(latitude, longitude, radius_km)
+    
+    for precision in range(max_precision, 0, -1):
+        height, width = cell_size(precision)
+        estimate = (math.floor((lat_max - lat_min) / height) + 2) * (math.floor((lon_max - lon_min) / width) + 2)
+        if estimate <= max_cells or precision == 1:
+            break
+    
+    cells = set()
+    for lat in _steps(lat_min, lat_max, height):
+        for lon in _steps(lon_min, lon_max, width):
+            # Wrap longitudes that cross the antimeridian
+            lon = (lon + 180.0) % 360.0 - 180.0
+            cells.add(encode(lat, lon, precision))
+    return sorted(cells)
+
+
+def sql_condition(cells, column="Geohash"):
+    """WHERE clause that turns the covering cells into indexed prefix range scans"""
+    return "(" + " OR ".join(f"{column} LIKE '{cell}%'" for cell in cells) + ")"
+
+
+class GeohashIndex:
+    """Sorted in-memory index of precomputed ZipCodes geohashes.
+    
+    Each entry is (geohash, postal_code, country_code, city, latitude, longitude).
+    Lookups use bisect over the sorted geohashes, mirroring the prefix range
+    scans the database runs against IX_ZipCodes_Geohash.
+    """
+    
+    def __init__(self, entries=()):
+        self.entries = sorted(entry for entry in entries if entry[0])
+        self.keys = [entry[0] for entry in self.entries]
+    
+    @classmethod
+    def from_tsv(cls, tsv_file):
+        """Load the output of convert_geonames.py --format tsv --geohash"""
+        entries = []
+        with open(tsv_file, 'r', encoding='utf-8') as infile:
+            for line in infile:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) < 15 or parts[14] == "\\N":
+                    continue
+                entries.append((parts[14], parts[2], parts[1], parts[3], float(parts[10]), float(parts[11])))
+        return cls(entries)
+    
+    def _scan(self, prefix):
+        start = bisect.bisect_left(self.keys, prefix)
+        # "~" sorts after every base32 character, closing the prefix range
+        end = bisect.bisect_left(self.keys, prefix + "~")
+        return self.entries[start:end]
+    
+    def candidates(self, latitude, longitude, radius_km, max_cells=16):
+        """Entries in the cells covering the circle (a superset of the real matches)"""
+        found = []
+        for cell in covering_cells(latitude, longitude, radius_km, max_cells):
+            found.extend(self._scan(cell))
+        return found
+    
+    def nearby(self, latitude, longitude, radius_km, limit=None):
+        """(distance_km, entry) pairs within radius_km, nearest first"""
+        matches = []
+        for entry in self.candidates(latitude, longitude, radius_km):
+            distance = haversine_km(latitude, longitude, entry[4], entry[5])
+            if distance <= radius_km:
+                matches.append((distance, entry))
+        matches.sort()
+        return matches[:limit] if limit else matches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find postal codes near a coordinate")
+    parser.add_argument("tsv", help="Output of convert_geonames.py --format tsv --geohash")
+    parser.add_argument("latitude", type=float)
+    parser.add_argument("longitude", type=float)
+    parser.add_argument("radius_km", type=float)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+    
+    cells = covering_cells(args.latitude, args.longitude, args.radius_km)
+    print(f"-- {sql_condition(cells)}")
+    
+    index = GeohashIndex.from_tsv(args.tsv)
+    for distance, (_, postal_code, country_code, city, _, _) in index.nearby(
+            args.latitude, args.longitude, args.radius_km, args.limit):
+        print(f"{distance:8.2f} km  {country_code} {postal_code}  {city}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the delta output of convert_geonames.py
+
+Run from this directory: python3 -m unittest test_convert_geonames
+"""
+
+import os
+import tempfile
+import unittest
+
+import convert_geonames
+
+ROW_A = "US\t10001\tNew York\tNew York\tNY\tNew York\t061\t\t\t40.7484\t-73.9967\t4\n"
+ROW_B = "US\t94105\tSan Francisco\tCalifornia\tCA\tSan Francisco\t075\t\t\t37.7898\t-122.3942\t4\n"
+
+
+class DeltaStagingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def convert(self, previous, current, geohash=False):
+        output = os.path.join(self.tmp.name, "delta.sql")
+        convert_geonames.convert_delta(self.write("prev.txt", previous), self.write("new.txt", current),
+                                       output, geohash=geohash)
+        with open(output, encoding="utf-8") as f:
+            return f.read()
+
+    def test_staging_table_has_no_fulltext_index(self):
+        for geohash in (False, True):
+            sql = self.convert(ROW_A, ROW_A + ROW_B, geohash)
+            ddl = [line for line in sql.splitlines() if "CREATE TEMPORARY TABLE" in line]
+            self.assertTrue(ddl)
+            self.assertNotIn("FULLTEXT", sql.upper())
+            self.assertNotIn(" LIKE ZipCodes", sql)
+
+    def test_each_staged_row_reactivates_at_most_one_row(self):
+        merge = convert_geonames.format_staging_merge()
+        self.assertIn("ROW_NUMBER() OVER (PARTITION BY CountryCode, PostalCode, City ORDER BY StageId)", merge)
+        self.assertIn("ROW_NUMBER() OVER (PARTITION BY CountryCode, PostalCode, City ORDER BY Id)", merge)
+        self.assertIn("AND z.Pos = d.Pos", merge)
+        self.assertIn("(StageId int NOT NULL PRIMARY KEY, Id int NOT NULL)", merge)
+
+    def test_no_staging_without_new_keys(self):
+        sql = self.convert(ROW_A + ROW_B, ROW_A)
+        self.assertNotIn(convert_geonames.DELTA_STAGING_TABLE, sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
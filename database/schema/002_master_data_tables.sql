@@ -27,6 +27,7 @@ CREATE TABLE IF NOT EXISTS `ZipCodes` (
   `Longitude` decimal(10,7) DEFAULT NULL COMMENT 'GPS longitude',
   `Accuracy` int(11) DEFAULT NULL COMMENT 'Accuracy level 1-6',
   `IsActive` tinyint(1) NOT NULL DEFAULT 1,
+  `Geohash` varchar(12) DEFAULT NULL COMMENT 'Precomputed geohash cell of Latitude/Longitude',
   `CreatedAt` datetime(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
   `UpdatedAt` datetime(6) DEFAULT NULL ON UPDATE CURRENT_TIMESTAMP(6),
   PRIMARY KEY (`Id`),
@@ -35,6 +36,7 @@ CREATE TABLE IF NOT EXISTS `ZipCodes` (
   KEY `IX_ZipCodes_Country_PostalCode` (`Country`, `PostalCode`),
   KEY `IX_ZipCodes_City` (`City`),
   KEY `IX_ZipCodes_State` (`State`),
+  KEY `IX_ZipCodes_Geohash` (`Geohash`),
   FULLTEXT KEY `FT_ZipCodes_City` (`City`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 